@@ -29,6 +29,7 @@ setup(
             'agent_skill = wazo_confd.plugins.agent_skill.plugin:Plugin',
             'api = wazo_confd.plugins.api.plugin:Plugin',
             'application = wazo_confd.plugins.application.plugin:Plugin',
+            'batch = wazo_confd.plugins.batch.plugin:Plugin',
             'call_filter = wazo_confd.plugins.call_filter.plugin:Plugin',
             'call_filter_fallback = wazo_confd.plugins.call_filter_fallback.plugin:Plugin',
             'call_filter_user = wazo_confd.plugins.call_filter_user.plugin:Plugin',
@@ -70,6 +71,7 @@ setup(
             'info = wazo_confd.plugins.info.plugin:Plugin',
             'ingress_http = wazo_confd.plugins.ingress_http.plugin:Plugin',
             'ivr = wazo_confd.plugins.ivr.plugin:Plugin',
+            'job = wazo_confd.plugins.job.plugin:Plugin',
             'line = wazo_confd.plugins.line.plugin:Plugin',
             'line_application = wazo_confd.plugins.line_application.plugin:Plugin',
             'line_device = wazo_confd.plugins.line_device.plugin:Plugin',
@@ -1,9 +1,11 @@
-# Copyright 2015-2018 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from werkzeug.local import LocalProxy as Proxy
 from .http_server import get_bus_publisher
+from .http_server import get_device_update_queue
 from .http_server import get_sysconfd_publisher
 
 bus = Proxy(get_bus_publisher)
+device_updates = Proxy(get_device_update_queue)
 sysconfd = Proxy(get_sysconfd_publisher)
@@ -1,28 +1,94 @@
-# Copyright 2015-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+
+import kombu
+import kombu.pools
 
 from wazo_bus.consumer import BusConsumer as Consumer
 from wazo_bus.mixins import PublisherMixin, WazoEventMixin
 from wazo_bus.base import Base
 from xivo.status import Status
 
+from .helpers.metrics import LatencyRecorder
+
 
 class FlushMixin:
     __saved_state = {}
 
-    def __init__(self, **kwargs):
+    def __init__(self, max_batch_size=0, **kwargs):
         super().__init__(**kwargs)
         self.__deque = deque()
+        self.__max_batch_size = max_batch_size
+        self.__latencies = LatencyRecorder()
+        self.__compactions = {}
+
+    def register_compaction(self, edited_event, key):
+        """Only publish the last `edited_event` queued for a resource
+
+        `key` is the payload field identifying the resource. The last edited
+        event carries the final state of the resource, so earlier ones can be
+        dropped, but created events, marshalled before the edits, are always
+        published. Events queued with extra headers are never compacted.
+        """
+        self.__compactions[edited_event.name] = key
 
     def queue_event(self, event, *, extra_headers=None):
         self.__deque.append((event, extra_headers))
 
     def flush(self):
+        if not self.__deque:
+            return
+
+        with self.__latencies.measure('flush'):
+            self._compact()
+            if self.__max_batch_size:
+                self._flush_batches()
+            else:
+                self._flush_events()
+
+    def _compact(self):
+        if not self.__compactions:
+            return
+
+        last_edited = {}
+        for index, (event, extra_headers) in enumerate(self.__deque):
+            if not extra_headers and event.name in self.__compactions:
+                resource_id = event.marshal().get(self.__compactions[event.name])
+                last_edited[(event.name, resource_id)] = index
+
+        compacted = deque()
+        for index, (event, extra_headers) in enumerate(self.__deque):
+            if not extra_headers and event.name in self.__compactions:
+                resource_id = event.marshal().get(self.__compactions[event.name])
+                if resource_id is not None:
+                    if last_edited[(event.name, resource_id)] != index:
+                        continue
+            compacted.append((event, extra_headers))
+        self.__deque = compacted
+
+    def _flush_events(self):
         while self.__deque:
-            event, extra_headers = self.__deque.popleft()
+            event, extra_headers = self.__deque[0]
             self.publish(event, headers=extra_headers)
+            self.__deque.popleft()
+
+    def _flush_batches(self):
+        while self.__deque:
+            batch = list(islice(self.__deque, self.__max_batch_size))
+            self.publish_batch(batch)
+            for _ in batch:
+                self.__deque.popleft()
+
+    def publish_batch(self, events):
+        for event, extra_headers in events:
+            self.publish(event, headers=extra_headers)
+
+    def provide_flush_status(self, status):
+        status['bus_publisher']['latencies'] = self.__latencies.summary()
 
     def rollback(self):
         self.__deque.clear()
@@ -41,10 +107,89 @@ class FlushMixin:
         return obj
 
 
+class TransactionalProducer:
+    """Publish batches of messages in AMQP channel transactions
+
+    A channel transaction sends a whole batch with a single round-trip. The
+    connections are taken from the kombu pool of `url`, so that batches reuse
+    a long-lived connection instead of opening one each.
+    """
+
+    def __init__(self, url, exchange):
+        self._connections = kombu.pools.connections[kombu.Connection(url)]
+        self._exchange = exchange
+
+    def publish(self, messages):
+        with self._connections.acquire(block=True) as connection:
+            try:
+                self._publish(connection, messages)
+            except Exception:
+                # Drop the possibly broken socket, the next batch reconnects
+                connection.collect()
+                raise
+
+    def _publish(self, connection, messages):
+        channel = connection.channel()
+        try:
+            producer = kombu.Producer(channel, exchange=self._exchange)
+            channel.tx_select()
+            try:
+                for headers, payload, routing_key in messages:
+                    producer.publish(
+                        payload,
+                        headers=headers,
+                        routing_key=routing_key,
+                        serializer='json',
+                    )
+                channel.tx_commit()
+            except Exception:
+                channel.tx_rollback()
+                raise
+        finally:
+            channel.close()
+
+
 class BusPublisher(WazoEventMixin, FlushMixin, PublisherMixin, Base):
     @classmethod
-    def from_config(cls, service_uuid, bus_config):
-        return cls(name='wazo-confd', service_uuid=service_uuid, **bus_config)
+    def from_config(cls, service_uuid, bus_config, max_batch_size=0):
+        return cls(
+            name='wazo-confd',
+            service_uuid=service_uuid,
+            max_batch_size=max_batch_size,
+            **bus_config,
+        )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._service_uuid = kwargs['service_uuid']
+        self._batch_producer = TransactionalProducer(
+            'amqp://{username}:{password}@{host}:{port}//'.format(**kwargs),
+            kombu.Exchange(kwargs['exchange_name'], kwargs['exchange_type']),
+        )
+
+    def publish_batch(self, events):
+        self._batch_producer.publish(
+            [
+                self.build_message(event, extra_headers)
+                for event, extra_headers in events
+            ]
+        )
+
+    def build_message(self, event, extra_headers=None):
+        """Return the headers, payload and routing key `publish` sends for `event`"""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        headers = dict(event.headers)
+        headers.update(extra_headers or {})
+        headers.setdefault('name', event.name)
+        headers.setdefault('origin_uuid', self._service_uuid)
+        headers.setdefault('timestamp', timestamp)
+        payload = {
+            'name': event.name,
+            'origin_uuid': self._service_uuid,
+            'timestamp': timestamp,
+            'data': event.marshal(),
+        }
+        return headers, payload, event.routing_key
 
 
 class BusConsumer(Consumer):
@@ -0,0 +1,224 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+import time
+
+from collections import OrderedDict, deque
+
+import requests
+
+from wazo_provd_client.exceptions import ProvdError
+from xivo.status import Status
+from xivo_dao.helpers.db_utils import session_scope
+
+from .helpers.metrics import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceUpdateQueue:
+    """Devices to update in provd once the request is committed
+
+    A device is updated once per request, whatever the number of changes
+    made to its lines, users or func keys. Updates skipped because the config
+    of the device was unchanged are counted as `unchanged`.
+    """
+
+    _lock = threading.Lock()
+    _counts = {'requested': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+    _latencies = LatencyRecorder()
+
+    def __init__(self):
+        self._updates = OrderedDict()
+
+    def add(self, provd_updater, device_id, tenant_uuid=None):
+        self._updates[device_id] = (provd_updater, tenant_uuid)
+        self.record('requested')
+
+    def drain(self):
+        """Remove and return the queued updates"""
+        updates, self._updates = self._updates, OrderedDict()
+        return updates
+
+    def flush(self):
+        updates = self.drain()
+        if not updates:
+            return
+
+        with self.measure('flush'), session_scope():
+            for device_id, (provd_updater, tenant_uuid) in updates.items():
+                try:
+                    written = provd_updater.update(device_id, tenant_uuid=tenant_uuid)
+                except Exception:
+                    logger.exception('Failed to update device %s', device_id)
+                    self.record('failed')
+                else:
+                    self.record('updated' if written else 'unchanged')
+
+    def rollback(self):
+        self._updates.clear()
+
+    @classmethod
+    def record(cls, name):
+        """Count a device update as `requested`, `updated`, `unchanged` or `failed`"""
+        with cls._lock:
+            cls._counts[name] += 1
+
+    @classmethod
+    def measure(cls, key):
+        return cls._latencies.measure(key)
+
+    @classmethod
+    def provide_status(cls, status):
+        with cls._lock:
+            status['device_updates'].update(cls._counts)
+            done = cls._counts['updated'] + cls._counts['unchanged']
+            status['device_updates']['unchanged_ratio'] = (
+                round(cls._counts['unchanged'] / done, 3) if done else 0.0
+            )
+        status['device_updates']['latencies'] = cls._latencies.summary()
+
+
+class DeviceUpdateDispatcher:
+    """Update devices in provd with a pool of `workers` background threads
+
+    The queued devices are kept by tenant and the workers take the tenants in
+    turn, so that a tenant updating thousands of devices does not delay the
+    others. A device queued again before its update starts is updated once.
+    An update failing with a server or connection error of provd is retried
+    `max_retries` times. When there is no worker, or the dispatcher is not
+    running, devices are updated at once.
+    """
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config['device_updates'])
+
+    def __init__(self, workers=0, max_retries=3, retry_interval=1):
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()
+        self._tenants = deque()
+        self._running = set()
+        self._threads = []
+        self._stopping = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        self._stopping = False
+        for number in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name='device_update_{}'.format(number), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def dispatch(self, queue):
+        if not self._threads:
+            queue.flush()
+            return
+
+        with self._condition:
+            for device_id, (provd_updater, tenant_uuid) in queue.drain().items():
+                devices = self._pending.get(tenant_uuid)
+                if devices is None:
+                    devices = self._pending[tenant_uuid] = OrderedDict()
+                    self._tenants.append(tenant_uuid)
+                devices[device_id] = provd_updater
+            self._condition.notify_all()
+
+    def provide_status(self, status):
+        with self._condition:
+            pending = sum(len(devices) for devices in self._pending.values())
+            running = len(self._running)
+        status['device_updates']['status'] = (
+            Status.ok if self._threads or not self.workers else Status.fail
+        )
+        status['device_updates']['pending'] = pending
+        status['device_updates']['running'] = running
+
+    def _run(self):
+        while True:
+            with self._condition:
+                update = self._next_update()
+                while update is None:
+                    if self._stopping and not self._pending:
+                        return
+                    self._condition.wait()
+                    update = self._next_update()
+                device_id, provd_updater, tenant_uuid = update
+                self._running.add(device_id)
+
+            try:
+                self._update(device_id, provd_updater, tenant_uuid)
+            finally:
+                with self._condition:
+                    self._running.discard(device_id)
+                    self._condition.notify_all()
+
+    def _next_update(self):
+        # The next tenant with a device that is not being updated
+        for _ in range(len(self._tenants)):
+            tenant_uuid = self._tenants[0]
+            self._tenants.rotate(-1)
+            devices = self._pending[tenant_uuid]
+            for device_id in devices:
+                if device_id not in self._running:
+                    provd_updater = devices.pop(device_id)
+                    if not devices:
+                        del self._pending[tenant_uuid]
+                        self._tenants.remove(tenant_uuid)
+                    return device_id, provd_updater, tenant_uuid
+        return None
+
+    def _update(self, device_id, provd_updater, tenant_uuid):
+        for attempt in range(self.max_retries + 1):
+            try:
+                with DeviceUpdateQueue.measure('update'), session_scope():
+                    written = provd_updater.update(device_id, tenant_uuid=tenant_uuid)
+            except (ProvdError, requests.RequestException) as e:
+                if not _is_transient(e) or attempt == self.max_retries:
+                    logger.error('Failed to update device %s: %s', device_id, e)
+                    break
+                logger.warning(
+                    'Failed to update device %s (attempt %s/%s): %s',
+                    device_id,
+                    attempt + 1,
+                    self.max_retries + 1,
+                    e,
+                )
+                time.sleep(self.retry_interval)
+            except Exception:
+                logger.exception('Failed to update device %s', device_id)
+                break
+            else:
+                DeviceUpdateQueue.record('updated' if written else 'unchanged')
+                return
+
+        DeviceUpdateQueue.record('failed')
+
+
+def _is_transient(error):
+    status_code = getattr(error, 'status_code', None)
+    response = getattr(error, 'response', None)
+    if status_code is None and response is not None:
+        status_code = response.status_code
+    return status_code is None or status_code >= 500
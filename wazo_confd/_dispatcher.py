@@ -0,0 +1,98 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import queue
+import threading
+import time
+
+from xivo.status import Status
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class FlushDispatcher:
+    """Flush the bus and sysconfd publishers outside of the request thread
+
+    Publishers are flushed in the order they were dispatched by a single
+    background thread. A publisher that fails to flush is retried
+    `max_retries` times before its pending requests are dropped. When the
+    dispatcher is disabled or not running, publishers are flushed immediately.
+
+    This is not a durable outbox: the queue is only kept in memory. Stopping
+    the dispatcher flushes the queued publishers, but they are lost if the
+    process dies, and a request is answered before its events are sent.
+    """
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config['flush_dispatcher'])
+
+    def __init__(self, enabled=False, max_retries=3, retry_interval=1):
+        self.enabled = enabled
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        if not self.enabled:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name='flush_dispatcher', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if not self._thread:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def dispatch(self, publisher):
+        if not self._thread:
+            publisher.flush()
+            return
+        self._queue.put(publisher)
+
+    def provide_status(self, status):
+        status['flush_dispatcher']['status'] = (
+            Status.ok if self._thread or not self.enabled else Status.fail
+        )
+        status['flush_dispatcher']['pending'] = self._queue.qsize()
+
+    def _run(self):
+        while True:
+            publisher = self._queue.get()
+            if publisher is _STOP:
+                return
+            self._flush(publisher)
+
+    def _flush(self, publisher):
+        for attempt in range(self.max_retries + 1):
+            try:
+                publisher.flush()
+                return
+            except Exception as e:
+                logger.warning(
+                    'Failed to flush %s (attempt %s/%s): %s',
+                    type(publisher).__name__,
+                    attempt + 1,
+                    self.max_retries + 1,
+                    e,
+                )
+            if attempt < self.max_retries:
+                time.sleep(self.retry_interval)
+
+        logger.error('Dropping pending requests of %s', type(publisher).__name__)
+        publisher.rollback()
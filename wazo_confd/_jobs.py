@@ -0,0 +1,138 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+import uuid
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from xivo.status import Status
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    def __init__(self, tenant_uuid):
+        self.uuid = str(uuid.uuid4())
+        self.tenant_uuid = tenant_uuid
+        self.status = 'pending'
+        self.result = None
+        self.error = None
+        self.created_at = _now()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._progress = {}
+
+    @property
+    def progress(self):
+        with self._lock:
+            return dict(self._progress)
+
+    @property
+    def finished(self):
+        return self.status in ('succeeded', 'failed')
+
+    def report_progress(self, **progress):
+        with self._lock:
+            self._progress.update(progress)
+
+    def start(self):
+        self.status = 'running'
+        self.started_at = _now()
+
+    def finish(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.finished_at = _now()
+        self.status = 'failed' if error else 'succeeded'
+
+
+class JobRunner:
+    """Run jobs with a pool of `workers` threads
+
+    Jobs are kept in memory: the `max_finished_jobs` most recent finished jobs
+    can be retrieved until wazo-confd is restarted. Jobs cannot be submitted
+    when there is no worker.
+    """
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config['jobs'])
+
+    def __init__(self, workers=0, max_finished_jobs=1000):
+        self.workers = workers
+        self.max_finished_jobs = max_finished_jobs
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._executor = None
+
+    @property
+    def enabled(self):
+        return self._executor is not None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        if not self.workers:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix='job'
+        )
+
+    def stop(self):
+        if not self._executor:
+            return
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def submit(self, tenant_uuid, function, *args, **kwargs):
+        """Run `function(job, *args, **kwargs)`, which may finish the job itself"""
+        job = Job(tenant_uuid)
+        with self._lock:
+            self._jobs[job.uuid] = job
+            self._prune()
+        self._executor.submit(self._run, job, function, *args, **kwargs)
+        return job
+
+    def get(self, job_uuid):
+        with self._lock:
+            return self._jobs.get(job_uuid)
+
+    def provide_status(self, status):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        status['jobs']['status'] = (
+            Status.ok if self.enabled or not self.workers else Status.fail
+        )
+        status['jobs']['pending'] = sum(1 for job in jobs if job.status == 'pending')
+        status['jobs']['running'] = sum(1 for job in jobs if job.status == 'running')
+
+    def _run(self, job, function, *args, **kwargs):
+        job.start()
+        try:
+            function(job, *args, **kwargs)
+        except Exception as e:
+            logger.exception('Job %s failed', job.uuid)
+            job.finish(error='Unexpected error: {}'.format(e))
+            return
+
+        if not job.finished:
+            job.finish()
+
+    def _prune(self):
+        finished = [job.uuid for job in self._jobs.values() if job.finished]
+        for job_uuid in finished[: max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[job_uuid]
+
+
+def _now():
+    return datetime.now(timezone.utc)
@@ -1,10 +1,21 @@
-# Copyright 2013-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import logging
+import threading
+
+from urllib.parse import urlparse
+
 import requests
 
+from requests.adapters import HTTPAdapter
 from xivo_dao.resources.configuration import dao as configuration_dao
 
+from .helpers.memoize import RequestMemoizedDAO
+from .helpers.metrics import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
 
 class SysconfdError(Exception):
     def __init__(self, code, value):
@@ -15,17 +26,161 @@ class SysconfdError(Exception):
         return "sysconfd error: status {} - {}".format(self.code, self.value)
 
 
+def _build_base_url(config):
+    return "http://{}:{}".format(config['sysconfd']['host'], config['sysconfd']['port'])
+
+
+def _build_session():
+    session = requests.Session()
+    session.trust_env = False
+    return session
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    def __init__(self, timeout, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class SysconfdSession:
+    """HTTP sessions shared by all the publishers to reuse sysconfd connections
+
+    A `requests.Session` is not thread-safe, so each thread, request threads and
+    the flush dispatcher alike, gets its own session keeping up to `pool_size`
+    connections alive. The number of calls and their latency are recorded for
+    each sysconfd path.
+    """
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config['sysconfd']['pool_size'], config['sysconfd']['timeout'])
+
+    def __init__(self, pool_size, timeout):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._latencies = LatencyRecorder()
+
+    def request(self, method, url, **kwargs):
+        key = '{} {}'.format(method, urlparse(url).path)
+        with self._latencies.measure(key):
+            return self._thread_session().request(method, url, **kwargs)
+
+    def _thread_session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            adapter = _TimeoutHTTPAdapter(
+                self.timeout, pool_connections=1, pool_maxsize=self.pool_size
+            )
+            session = self._local.session = _build_session()
+            session.mount('http://', adapter)
+        return session
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def latencies(self):
+        return self._latencies.summary()
+
+    def provide_status(self, status):
+        status['sysconfd']['latencies'] = self.latencies()
+
+
+class SysconfdReloadCoalescer:
+    """Merge the request handlers of concurrent requests into one sysconfd call
+
+    Handlers are accumulated for `window` seconds after the first one is
+    received, then sent as a single `exec_request_handlers` request. The
+    `context` entries of every request are kept so that consumers of the
+    `request_handlers_progress` event still see each resource.
+    """
+
+    @classmethod
+    def from_config(cls, config, session=None):
+        window = config['sysconfd']['reload_debounce_window']
+        return cls(_build_base_url(config), window, session=session)
+
+    def __init__(self, base_url, window, session=None):
+        self.base_url = base_url
+        self.window = window
+        self.session = session
+        self._lock = threading.Lock()
+        self._timer = None
+        self._handlers = {}
+        self._contexts = []
+
+    def add(self, handlers, contexts):
+        with self._lock:
+            for service, commands in handlers.items():
+                self._handlers.setdefault(service, set()).update(commands)
+            self._contexts.extend(contexts)
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._timer = None
+            handlers, self._handlers = self._handlers, {}
+            contexts, self._contexts = self._contexts, []
+
+        if not handlers:
+            return
+
+        url = "{}/exec_request_handlers".format(self.base_url)
+        body = {key: tuple(commands) for key, commands in handlers.items()}
+        if contexts:
+            body['context'] = contexts
+        try:
+            session = self.session or _build_session()
+            response = session.request('POST', url, json=body)
+        except requests.RequestException as e:
+            logger.error('sysconfd error: unable to reload handlers: %s', e)
+            return
+
+        if response.status_code != 200:
+            logger.error('%s', SysconfdError(response.status_code, response.text))
+
+    def stop(self):
+        with self._lock:
+            timer = self._timer
+        if timer:
+            timer.cancel()
+        self.flush()
+
+
 class SysconfdPublisher:
+    _reload_coalescer = None
+    _shared_session = None
+
     @classmethod
     def from_config(cls, config):
-        url = "http://{}:{}".format(
-            config['sysconfd']['host'], config['sysconfd']['port']
+        return cls(
+            _build_base_url(config),
+            RequestMemoizedDAO(configuration_dao, 'is_live_reload_enabled'),
+            reload_coalescer=cls._reload_coalescer,
+            session=cls._shared_session,
         )
-        return cls(url, configuration_dao)
 
-    def __init__(self, base_url, dao):
+    @classmethod
+    def set_reload_coalescer(cls, reload_coalescer):
+        cls._reload_coalescer = reload_coalescer
+
+    @classmethod
+    def set_shared_session(cls, session):
+        cls._shared_session = session
+
+    def __init__(self, base_url, dao, reload_coalescer=None, session=None):
         self.base_url = base_url
         self.dao = dao
+        self.reload_coalescer = reload_coalescer
+        self.session = session
         self._reset()
 
     def exec_request_handlers(self, args):
@@ -123,9 +278,7 @@ class SysconfdPublisher:
         return response.json()['data']
 
     def _session(self):
-        session = requests.Session()
-        session.trust_env = False
-        return session
+        return self.session or _build_session()
 
     def check_for_errors(self, response):
         if response.status_code != 200:
@@ -137,22 +290,30 @@ class SysconfdPublisher:
     def flush(self):
         session = self._session()
         self.flush_handlers(session)
+        if self.requests and self.reload_coalescer:
+            # The handlers waiting for the debounce window were requested first
+            self.reload_coalescer.flush()
         self.flush_requests(session)
         self._reset()
 
     def flush_handlers(self, session):
-        if len(self.handlers) > 0:
+        if len(self.handlers) > 0 and self.reload_coalescer:
+            self.reload_coalescer.add(self.handlers, self.handlers_contexts)
+        elif len(self.handlers) > 0:
             url = "{}/exec_request_handlers".format(self.base_url)
             body = {key: tuple(commands) for key, commands in self.handlers.items()}
             if self.handlers_contexts:
                 body['context'] = self.handlers_contexts
             response = session.request('POST', url, json=body)
             self.check_for_errors(response)
+        self.handlers = {}
+        self.handlers_contexts = []
 
     def flush_requests(self, session):
-        for request_applicator in self.requests:
-            response = request_applicator(session)
+        while self.requests:
+            response = self.requests[0](session)
             self.check_for_errors(response)
+            self.requests.pop(0)
 
     def rollback(self):
         self._reset()
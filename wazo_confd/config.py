@@ -29,6 +29,7 @@ DEFAULT_CONFIG = {
             'allow_headers': ['Content-Type', 'X-Auth-Token', 'Wazo-Tenant'],
         },
         'max_threads': 10,
+        'streaming': {'enabled': False, 'min_items': 1000, 'chunk_size': 100},
     },
     'auth': {
         'host': 'localhost',
@@ -52,14 +53,22 @@ DEFAULT_CONFIG = {
         'exchange_name': 'wazo-headers',
         'exchange_type': 'headers',
     },
+    'bus_publisher': {'max_batch_size': 0},
     'provd': {'host': 'localhost', 'port': 8666, 'prefix': None, 'https': False},
-    'sysconfd': {'host': 'localhost', 'port': '8668'},
+    'sysconfd': {
+        'host': 'localhost',
+        'port': '8668',
+        'reload_debounce_window': 0,
+        'pool_size': 10,
+        'timeout': 60,
+    },
     'enabled_plugins': {
         'access_feature': True,
         'agent': True,
         'agent_skill': True,
         'api': True,
         'application': True,
+        'batch': True,
         'call_filter': True,
         'call_filter_fallback': True,
         'call_filter_user': True,
@@ -101,6 +110,7 @@ DEFAULT_CONFIG = {
         'info': True,
         'ingress_http': True,
         'ivr': True,
+        'job': True,
         'line': True,
         'line_application': True,
         'line_device': True,
@@ -180,6 +190,16 @@ DEFAULT_CONFIG = {
         'retry_interval': 2,
         'extra_tags': [],
     },
+    'token_cache': {'ttl': 0, 'max_size': 1024},
+    'visible_tenants_cache': {'ttl': 0, 'max_size': 1024},
+    'flush_dispatcher': {
+        'enabled': False,
+        'max_retries': 3,
+        'retry_interval': 1,
+    },
+    'jobs': {'workers': 0, 'max_finished_jobs': 1000},
+    'device_updates': {'workers': 0, 'max_retries': 3, 'retry_interval': 1},
+    'user_import': {'auth_concurrency': 4},
     'wizard': {'service_id': None, 'service_key': None},
     'pjsip_config_doc_filename': '/usr/share/doc/asterisk-doc/json/pjsip.json.gz',
     'sync_db': {'quiet': False},
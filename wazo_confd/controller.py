@@ -1,4 +1,4 @@
-# Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
@@ -16,10 +16,17 @@ from xivo.status import StatusAggregator, TokenStatus
 from xivo.token_renewer import TokenRenewer
 
 from wazo_confd.helpers.asterisk import PJSIPDoc
+from wazo_confd.helpers.auth_cache import TokenCache, VisibleTenantsCache
 from wazo_confd.helpers.middleware import MiddleWareHandle
+from wazo_confd.helpers.restful import CachedAuthVerifier, ConfdResource
+from wazo_confd.helpers.tenant import known_tenants
 
 from . import auth
 from ._bus import BusPublisher, BusConsumer
+from ._device_updates import DeviceUpdateDispatcher, DeviceUpdateQueue
+from ._dispatcher import FlushDispatcher
+from ._jobs import JobRunner
+from ._sysconfd import SysconfdPublisher, SysconfdReloadCoalescer, SysconfdSession
 from .http_server import api, app, HTTPServer
 from .service_discovery import self_check
 
@@ -30,8 +37,26 @@ class Controller:
     def __init__(self, config):
         self.config = config
         self._bus_consumer = BusConsumer.from_config(config['bus'])
-        self._bus_publisher = BusPublisher.from_config(config['uuid'], config['bus'])
+        self._bus_publisher = BusPublisher.from_config(
+            config['uuid'],
+            config['bus'],
+            max_batch_size=config['bus_publisher']['max_batch_size'],
+        )
         self._bus_publisher.set_as_reference()
+        self._sysconfd_session = SysconfdSession.from_config(config)
+        SysconfdPublisher.set_shared_session(self._sysconfd_session)
+        self._sysconfd_reload_coalescer = None
+        if config['sysconfd']['reload_debounce_window']:
+            self._sysconfd_reload_coalescer = SysconfdReloadCoalescer.from_config(
+                config, session=self._sysconfd_session
+            )
+            SysconfdPublisher.set_reload_coalescer(self._sysconfd_reload_coalescer)
+        self._flush_dispatcher = FlushDispatcher.from_config(config)
+        app.extensions['flush_dispatcher'] = self._flush_dispatcher
+        self._job_runner = JobRunner.from_config(config)
+        app.extensions['job_runner'] = self._job_runner
+        self._device_update_dispatcher = DeviceUpdateDispatcher.from_config(config)
+        app.extensions['device_update_dispatcher'] = self._device_update_dispatcher
         self.status_aggregator = StatusAggregator()
         self.token_status = TokenStatus()
         self._service_discovery_args = [
@@ -57,6 +82,24 @@ class Controller:
         self.status_aggregator.add_provider(auth.provide_status)
         self.status_aggregator.add_provider(self.token_status.provide_status)
         self.status_aggregator.add_provider(self._bus_consumer.provide_status)
+        self.status_aggregator.add_provider(self._bus_publisher.provide_flush_status)
+        self.status_aggregator.add_provider(self._flush_dispatcher.provide_status)
+        self.status_aggregator.add_provider(self._job_runner.provide_status)
+        self.status_aggregator.add_provider(self._sysconfd_session.provide_status)
+        self.status_aggregator.add_provider(DeviceUpdateQueue.provide_status)
+        self.status_aggregator.add_provider(
+            self._device_update_dispatcher.provide_status
+        )
+        if config['token_cache']['ttl']:
+            token_cache = TokenCache.from_config(config)
+            token_cache.subscribe(self._bus_consumer)
+            CachedAuthVerifier.set_cache(token_cache)
+            self.status_aggregator.add_provider(token_cache.provide_status)
+        if config['visible_tenants_cache']['ttl']:
+            visible_tenants_cache = VisibleTenantsCache.from_config(config)
+            visible_tenants_cache.subscribe(self._bus_consumer)
+            ConfdResource.set_visible_tenants_cache(visible_tenants_cache)
+            self.status_aggregator.add_provider(visible_tenants_cache.provide_status)
 
         plugin_helpers.load(
             namespace='wazo_confd.plugins',
@@ -77,17 +120,21 @@ class Controller:
     def run(self):
         logger.info('wazo-confd starting...')
         xivo_dao.init_db_from_config(self.config)
+        known_tenants.prime()
         signal.signal(signal.SIGTERM, partial(_signal_handler, self))
         signal.signal(signal.SIGINT, partial(_signal_handler, self))
 
         try:
             with self.token_renewer:
-                with self._bus_consumer:
-                    with ServiceCatalogRegistration(*self._service_discovery_args):
-                        self.http_server.run()
+                with self._bus_consumer, self._flush_dispatcher, self._job_runner:
+                    with self._device_update_dispatcher:
+                        with ServiceCatalogRegistration(*self._service_discovery_args):
+                            self.http_server.run()
         finally:
             if self._stopping_thread:
                 self._stopping_thread.join()
+            if self._sysconfd_reload_coalescer:
+                self._sysconfd_reload_coalescer.stop()
 
     def stop(self, reason):
         logger.warning('Stopping wazo-confd: %s', reason)
@@ -1,4 +1,4 @@
-# Copyright 2016-2020 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from sqlalchemy.orm import Load
@@ -90,3 +90,21 @@ def template_has_sccp_device(template_id):
     )
 
     return Session.query(exists_query).scalar()
+
+
+def devices_for_template(template_id):
+    query = (
+        Session.query(LineFeatures.device_id, LineFeatures.tenant_uuid)
+        .join(UserLine, UserLine.line_id == LineFeatures.id)
+        .join(UserFeatures, UserFeatures.id == UserLine.user_id)
+        .filter(
+            or_(
+                UserFeatures.func_key_template_id == template_id,
+                UserFeatures.func_key_private_template_id == template_id,
+            )
+        )
+        .filter(LineFeatures.device_id != None)  # noqa
+        .distinct()
+    )
+
+    return query.all()
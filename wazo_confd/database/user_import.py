@@ -0,0 +1,54 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from xivo_dao.alchemy.context import Context
+from xivo_dao.alchemy.endpoint_sip import EndpointSIP
+from xivo_dao.alchemy.extension import Extension
+from xivo_dao.alchemy.linefeatures import LineFeatures as Line
+from xivo_dao.alchemy.rightcall import RightCall
+from xivo_dao.alchemy.voicemail import Voicemail
+from xivo_dao.helpers.db_manager import Session
+
+
+def find_contexts(tenant_uuid):
+    query = Session.query(Context).filter(Context.tenant_uuid == tenant_uuid)
+    return {context.name: context for context in query}
+
+
+def find_call_permission_names(tenant_uuid):
+    query = Session.query(RightCall.name).filter(RightCall.tenant_uuid == tenant_uuid)
+    return {name for name, in query}
+
+
+def find_extensions(contexts):
+    """Return the (type, typeval) of the extensions by (exten, context)"""
+    if not contexts:
+        return {}
+    query = Session.query(
+        Extension.exten, Extension.context, Extension.type, Extension.typeval
+    ).filter(Extension.context.in_(contexts))
+    return {
+        (exten, context): (type_, typeval) for exten, context, type_, typeval in query
+    }
+
+
+def find_voicemails(contexts):
+    if not contexts:
+        return set()
+    query = Session.query(Voicemail.number, Voicemail.context).filter(
+        Voicemail.context.in_(contexts)
+    )
+    return {(number, context) for number, context in query}
+
+
+def find_sip_usernames(usernames):
+    """Return whether the SIP endpoints of `usernames` are associated to a line"""
+    query = (
+        Session.query(EndpointSIP.username, Line.id)
+        .outerjoin(Line, Line.endpoint_sip_uuid == EndpointSIP.uuid)
+        .filter(EndpointSIP.username.in_(usernames))
+    )
+    usernames = {}
+    for username, line_id in query:
+        usernames[username] = usernames.get(username, False) or line_id is not None
+    return usernames
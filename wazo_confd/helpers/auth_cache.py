@@ -0,0 +1,141 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class _ExpiringLRUCache:
+    status_name = None
+
+    def __init__(self, ttl=0, max_size=1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def provide_status(self, status):
+        with self._lock:
+            status[self.status_name]['hits'] = self._hits
+            status[self.status_name]['misses'] = self._misses
+            status[self.status_name]['size'] = len(self._entries)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+
+            if entry:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def _set(self, key, value, lifetime=None):
+        ttl = self.ttl if lifetime is None else min(self.ttl, lifetime)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _remove(self, predicate):
+        with self._lock:
+            keys = [
+                key for key, (_, value) in self._entries.items() if predicate(value)
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+
+class TokenCache(_ExpiringLRUCache):
+    """Thread-safe LRU cache of successful token verifications
+
+    An entry is valid for `ttl` seconds, or until the token expires if it
+    expires sooner. At most `max_size` entries are kept, the least recently
+    used entries being evicted first. Entries are invalidated when the
+    session of their token is deleted.
+    """
+
+    status_name = 'token_cache'
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config['token_cache'])
+
+    def subscribe(self, bus_consumer):
+        bus_consumer.subscribe('auth_session_deleted', self._auth_session_deleted)
+
+    def get(self, key):
+        return self._get(key) is not None
+
+    def add(self, key, session_uuid=None, expires_at=None):
+        lifetime = None
+        if expires_at:
+            now = datetime.now(timezone.utc)
+            lifetime = (_utc_datetime(expires_at) - now).total_seconds()
+        self._set(key, (session_uuid,), lifetime)
+
+    def invalidate_session(self, session_uuid):
+        return self._remove(lambda entry: entry == (session_uuid,))
+
+    def _auth_session_deleted(self, event):
+        count = self.invalidate_session(event['uuid'])
+        logger.debug(
+            'Session %s deleted: %s cached verification(s) removed',
+            event['uuid'],
+            count,
+        )
+
+
+def _utc_datetime(value):
+    value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class VisibleTenantsCache(_ExpiringLRUCache):
+    """Thread-safe LRU cache of the tenants visible by a token from a tenant
+
+    Entries are valid for `ttl` seconds and the whole cache is cleared when a
+    tenant is added or deleted, since the tenant tree has changed.
+    """
+
+    status_name = 'visible_tenants_cache'
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config['visible_tenants_cache'])
+
+    def subscribe(self, bus_consumer):
+        bus_consumer.subscribe('auth_tenant_added', self._auth_tenant_changed)
+        bus_consumer.subscribe('auth_tenant_deleted', self._auth_tenant_changed)
+
+    def get(self, token_uuid, tenant_uuid):
+        return self._get((token_uuid, tenant_uuid))
+
+    def add(self, token_uuid, tenant_uuid, tenant_uuids):
+        self._set((token_uuid, tenant_uuid), list(tenant_uuids))
+
+    def _auth_tenant_changed(self, event):
+        logger.debug('Tenant %s changed: clearing visible tenants', event['uuid'])
+        self.clear()
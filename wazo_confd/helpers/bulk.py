@@ -0,0 +1,38 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from xivo_dao.helpers import errors
+from xivo_dao.helpers.db_manager import Session
+
+
+def get_all_by(model, key, values, param, resource, tenant_uuids=None):
+    """Get the `model` instances whose `key` is one of `values`, in order
+
+    All the instances are fetched with a single query. Every value not found
+    in `tenant_uuids` is reported in the same `param_not_found` error.
+    """
+    values = list(values)
+    found = find_all_by(model, key, values, tenant_uuids=tenant_uuids)
+
+    missing = []
+    for value in values:
+        if str(value) not in found and value not in missing:
+            missing.append(value)
+    if missing:
+        metadata = {key: missing[0] if len(missing) == 1 else missing}
+        raise errors.param_not_found(param, resource, **metadata)
+
+    return [found[str(value)] for value in values]
+
+
+def find_all_by(model, key, values, tenant_uuids=None):
+    """Map the string of each `key` found in `values` to its `model` instance"""
+    values = set(values)
+    if not values:
+        return {}
+
+    column = getattr(model, key)
+    query = Session.query(model).filter(column.in_(values))
+    if tenant_uuids is not None:
+        query = query.filter(model.tenant_uuid.in_(tenant_uuids))
+    return {str(getattr(instance, key)): instance for instance in query}
@@ -1,4 +1,4 @@
-# Copyright 2013-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
@@ -15,6 +15,9 @@ from xivo_dao.helpers.db_manager import Session
 from xivo_dao.helpers.exception import ServiceError, NotFoundError
 from wazo_provd_client.exceptions import ProvdError
 
+from .memoize import clear_request_memo
+from .tenant import known_tenants
+
 logger = logging.getLogger(__name__)
 
 GENERIC_ERRORS = (ServiceError,)
@@ -61,6 +64,8 @@ def handle_api_exception(func):
 
 def rollback():
     Session.rollback()
+    clear_request_memo()
+    known_tenants.rollback()
 
     sysconfd = g.get('sysconfd_publisher')
     if sysconfd:
@@ -70,6 +75,10 @@ def rollback():
     if bus:
         bus.rollback()
 
+    device_updates = g.get('device_update_queue')
+    if device_updates:
+        device_updates.rollback()
+
 
 def decode_and_log_error(error, exc_info=False):
     error_message = str(error)
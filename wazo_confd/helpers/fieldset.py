@@ -0,0 +1,58 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from marshmallow import ValidationError
+from sqlalchemy.orm import load_only, noload, selectinload
+
+
+def fieldset_schema(schema, fieldset=None):
+    if not fieldset:
+        return schema()
+
+    try:
+        return schema(only=fieldset)
+    except ValueError as e:
+        raise ValidationError(str(e), 'fields')
+
+
+def fieldset_options(model, schema, fieldset=None):
+    """Loader options fetching only the attributes of `model` dumped by `schema`
+
+    No options are returned when a dumped field is not a mapped column or
+    relationship (e.g. an hybrid property), since its dependencies are unknown.
+    """
+    if not fieldset:
+        return []
+
+    mapper = model.__mapper__
+    columns = []
+    relationships = set()
+    for name in {name.split('.')[0] for name in fieldset}:
+        attribute = schema.fields[name].attribute or name
+        if attribute in mapper.relationships:
+            relationships.add(attribute)
+        elif attribute in mapper.column_attrs:
+            columns.append(attribute)
+        else:
+            return []
+
+    options = [load_only(*columns)] if columns else []
+    for relationship in mapper.relationships:
+        if relationship.key not in relationships and relationship.lazy != 'dynamic':
+            options.append(noload(relationship.key))
+    return options
+
+
+def preload_options(model, schema):
+    """Loader options fetching the lazy relationships of `model` dumped by `schema`
+
+    Each relationship is fetched by one query for all the items instead of one
+    query per item.
+    """
+    relationships = model.__mapper__.relationships
+    options = []
+    for name, field in schema.dump_fields.items():
+        attribute = field.attribute or name
+        if attribute in relationships and relationships[attribute].lazy == 'select':
+            options.append(selectinload(attribute))
+    return options
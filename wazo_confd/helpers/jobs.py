@@ -0,0 +1,93 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from functools import wraps
+
+from flask import current_app, g, has_app_context, request, url_for
+from marshmallow import ValidationError, fields
+from xivo.tenant_flask_helpers import Tenant
+
+from wazo_confd.helpers.mallow import BaseSchema
+
+NOT_FORWARDED_HEADERS = ('Content-Length',)
+
+
+class AsyncSchema(BaseSchema):
+    async_ = fields.Boolean(data_key='async', load_default=False)
+
+
+class JobSchema(BaseSchema):
+    uuid = fields.String(dump_only=True)
+    tenant_uuid = fields.String(dump_only=True)
+    status = fields.String(dump_only=True)
+    progress = fields.Dict(dump_only=True)
+    result = fields.Raw(dump_only=True)
+    error = fields.Raw(dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
+    started_at = fields.DateTime(dump_only=True)
+    finished_at = fields.DateTime(dump_only=True)
+
+
+def asynchronous(func):
+    """Run the request as a job when the `async` query string is true
+
+    The job replays the request in a worker thread and its result is the
+    body of the response. The accepted job is returned with a 202 status.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not AsyncSchema().load(request.args)['async_']:
+            return func(*args, **kwargs)
+
+        runner = current_app.extensions.get('job_runner')
+        if not runner or not runner.enabled:
+            raise ValidationError({'async': ['Asynchronous jobs are disabled']})
+
+        job = runner.submit(
+            Tenant.autodetect().uuid,
+            _run_request,
+            current_app._get_current_object(),
+            method=request.method,
+            path=request.path,
+            query_string=[
+                (key, value)
+                for key, value in request.args.items(multi=True)
+                if key != 'async'
+            ],
+            headers=[
+                (name, value)
+                for name, value in request.headers.items()
+                if name not in NOT_FORWARDED_HEADERS
+            ],
+            data=request.get_data(),
+        )
+        headers = {'Location': url_for('jobs', job_uuid=job.uuid, _external=True)}
+        return JobSchema().dump(job), 202, headers
+
+    return wrapper
+
+
+def report_progress(**progress):
+    """Update the progress of the job running the current request, if any"""
+    job = g.get('job') if has_app_context() else None
+    if job:
+        job.report_progress(**progress)
+
+
+def _run_request(job, app, method, path, query_string, headers, data):
+    with app.test_request_context(
+        path,
+        method=method,
+        query_string=query_string,
+        headers=headers,
+        data=data,
+    ):
+        g.job = job
+        response = app.full_dispatch_request()
+        body = response.get_json(silent=True)
+
+    if response.status_code >= 400:
+        job.finish(error=body or response.status)
+    else:
+        job.finish(result=body)
@@ -1,4 +1,4 @@
-# Copyright 2016-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import re
@@ -70,6 +70,15 @@ class StrictBoolean(fields.Boolean):
         return value
 
 
+class Fieldset(fields.String):
+    def _deserialize(self, value, attr, data, **kwargs):
+        value = super()._deserialize(value, attr, data, **kwargs)
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        if not names:
+            raise ValidationError('Must contain at least one field name')
+        return names
+
+
 class Link(fields.Field):
     _CHECK_ATTRIBUTE = False
 
@@ -0,0 +1,89 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from functools import wraps
+
+from flask import g, has_app_context
+
+
+def request_memoized(func):
+    """Memoize the results of a read-only DAO function for the current request
+
+    Results are shared by all the wrappers of the same function. Only found
+    resources are memoized: a None result or an exception (e.g. NotFoundError)
+    is never reused, since the resource may be created later in the request.
+    Outside of a request, `func` is always called.
+    """
+    if getattr(func, 'request_memoized', False) is True:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not has_app_context():
+            return func(*args, **kwargs)
+
+        try:
+            key = (func, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        memo = g.setdefault('dao_memo', {})
+        if key in memo:
+            return memo[key]
+
+        result = func(*args, **kwargs)
+        if result is not None:
+            memo[key] = result
+        return result
+
+    wrapper.request_memoized = True
+    return wrapper
+
+
+class RequestMemoizedDAO:
+    """DAO whose `functions` are memoized with `request_memoized`"""
+
+    def __init__(self, dao, *functions):
+        self._dao = dao
+        for name in functions:
+            setattr(self, name, request_memoized(getattr(dao, name)))
+
+    def __getattr__(self, name):
+        return getattr(self._dao, name)
+
+
+def clear_request_memo():
+    g.pop('dao_memo', None)
+
+
+def forget_request_memo(dao):
+    """Forget the memoized results of the functions of `dao`
+
+    Called after a write through `dao`, so that the rest of the request reads
+    the resources again instead of their state before the write.
+    """
+    if not has_app_context():
+        return
+
+    memo = g.get('dao_memo', {})
+    for key in [key for key in memo if _belongs_to(key[0], dao)]:
+        del memo[key]
+
+
+def _belongs_to(func, dao):
+    name = getattr(func, '__name__', None)
+    if name is None:
+        return False
+    attribute = getattr(dao, name, None)
+    return getattr(attribute, '__wrapped__', attribute) == func
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
@@ -0,0 +1,36 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+import time
+
+from contextlib import contextmanager
+
+
+class LatencyRecorder:
+    """Thread-safe count, average and maximum duration of operations by key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = {}
+
+    @contextmanager
+    def measure(self, key):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(key, time.monotonic() - start)
+
+    def record(self, key, latency):
+        with self._lock:
+            count, total, maximum = self._latencies.get(key, (0, 0.0, 0.0))
+            self._latencies[key] = (count + 1, total + latency, max(maximum, latency))
+
+    def summary(self):
+        with self._lock:
+            latencies = dict(self._latencies)
+        return {
+            key: {'count': count, 'average': total / count, 'max': maximum}
+            for key, (count, total, maximum) in latencies.items()
+        }
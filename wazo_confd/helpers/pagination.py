@@ -0,0 +1,114 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import base64
+import json
+
+from marshmallow import ValidationError
+from xivo.mallow import fields
+from xivo_dao.helpers.db_manager import Session
+
+DIRECTIONS = ('asc', 'desc')
+
+
+class Cursor(fields.String):
+    """Opaque position after which the next page starts
+
+    An empty cursor is the position before the first item.
+    """
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        value = super()._deserialize(value, attr, data, **kwargs)
+        if not value:
+            return {}
+
+        try:
+            key, direction, last = json.loads(base64.urlsafe_b64decode(value))
+        except (ValueError, TypeError):
+            raise ValidationError('Invalid cursor')
+
+        if direction not in DIRECTIONS:
+            raise ValidationError('Invalid cursor')
+        return {'key': key, 'direction': direction, 'value': last}
+
+
+def encode_cursor(key, direction, value):
+    payload = json.dumps([key, direction, value], default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def tenant_query(model, tenant_uuids=None):
+    """Query of `model` for a `KeysetPage`, filtered on `tenant_uuids`"""
+    query = Session.query(model)
+    if tenant_uuids is not None:
+        query = query.filter(model.tenant_uuid.in_(tenant_uuids))
+    return query
+
+
+class KeysetPage:
+    """Items of `query` after `cursor`, ordered by the primary key of its model
+
+    Rows are filtered on the primary key instead of skipped with an offset,
+    so every page costs the same whatever its position. Once the items are
+    fetched, `after` is the cursor of the next page (None on the last page).
+    A `limit` of 0, as None, fetches all the items after `cursor`.
+    """
+
+    def __init__(self, query, cursor, limit=None, direction='asc'):
+        mapper = query.column_descriptions[0]['entity'].__mapper__
+        self.key = mapper.get_property_by_column(mapper.primary_key[0]).key
+        self.column = getattr(mapper.class_, self.key)
+
+        if cursor and cursor['key'] != self.key:
+            raise ValidationError({'after': ['Invalid cursor']})
+
+        self.direction = cursor.get('direction', direction)
+        if self.direction not in DIRECTIONS:
+            raise ValidationError({'direction': ['Must be one of: asc, desc.']})
+
+        self.query = query
+        self.cursor = cursor
+        self.limit = limit or None
+        self.after = None
+
+    def count(self):
+        return self.query.count()
+
+    def all(self):
+        items = self._fetch(self.cursor, self.limit)
+        if self.limit and len(items) == self.limit:
+            self.after = self._encode(items[-1])
+        return items
+
+    def chunks(self, size):
+        """Fetch the items by chunks of `size`, holding a single chunk in memory"""
+        cursor, remaining, last = self.cursor, self.limit, None
+        while remaining is None or remaining > 0:
+            chunk_size = size if remaining is None else min(size, remaining)
+            items = self._fetch(cursor, chunk_size)
+            if items:
+                yield items
+            if len(items) < chunk_size:
+                return
+
+            last = items[-1]
+            cursor = {'value': getattr(last, self.key)}
+            if remaining is not None:
+                remaining -= len(items)
+        if last is not None:
+            self.after = self._encode(last)
+
+    def _fetch(self, cursor, limit):
+        query = self.query
+        if cursor and self.direction == 'asc':
+            query = query.filter(self.column > cursor['value'])
+        elif cursor:
+            query = query.filter(self.column < cursor['value'])
+        order = self.column.asc() if self.direction == 'asc' else self.column.desc()
+        query = query.order_by(order)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    def _encode(self, item):
+        return encode_cursor(self.key, self.direction, getattr(item, self.key))
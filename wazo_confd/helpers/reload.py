@@ -0,0 +1,25 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+class ReloadPlanner:
+    """Select the sysconfd handlers required by a set of updated fields
+
+    `field_handlers` maps a field name to the handlers it requires. A field
+    mapped to an empty list is never read by Asterisk and requires no reload.
+    Unknown fields, or unknown changes (`updated_fields=None`), require all
+    `handlers`.
+    """
+
+    def __init__(self, handlers, field_handlers=None):
+        self.handlers = list(handlers)
+        self.field_handlers = field_handlers or {}
+
+    def plan(self, updated_fields=None):
+        if updated_fields is None:
+            return list(self.handlers)
+
+        required = set()
+        for field in updated_fields:
+            required.update(self.field_handlers.get(field, self.handlers))
+        return [handler for handler in self.handlers if handler in required]
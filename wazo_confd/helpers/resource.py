@@ -1,10 +1,13 @@
-# Copyright 2013-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers.db_manager import Session
 
 
 class CRUDService:
+    # Whether `notifier.edited` takes the names of the fields updated by the request
+    notify_updated_fields = False
+
     def __init__(self, dao, validator, notifier, extra_parameters=None):
         self.dao = dao
         self.validator = validator
@@ -33,7 +36,10 @@ class CRUDService:
         with Session.no_autoflush:
             self.validator.validate_edit(resource)
         self.dao.edit(resource)
-        self.notifier.edited(resource)
+        if self.notify_updated_fields:
+            self.notifier.edited(resource, updated_fields)
+        else:
+            self.notifier.edited(resource)
 
     def delete(self, resource):
         self.validator.validate_delete(resource)
@@ -1,22 +1,93 @@
-# Copyright 2015-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from flask import request
+from functools import wraps
+
+from flask import current_app, request
 from flask_restful import Resource
 
 import marshmallow
 
+from marshmallow import ValidationError, validates_schema
+
 from xivo.flask.auth_verifier import AuthVerifierFlask
 from xivo.mallow import fields, validate
 from xivo.tenant_flask_helpers import Tenant, token
-from xivo_dao import tenant_dao
 
 from wazo_confd.helpers.common import handle_api_exception
-from wazo_confd.helpers.mallow import BaseSchema
+from wazo_confd.helpers.fieldset import (
+    fieldset_options,
+    fieldset_schema,
+    preload_options,
+)
+from wazo_confd.helpers.mallow import BaseSchema, Fieldset
+from wazo_confd.helpers.pagination import Cursor, KeysetPage
+from wazo_confd.helpers.streaming import chunked, generate_list
+from wazo_confd.http_server import stream_response
+from wazo_confd.helpers.tenant import known_tenants
 
 auth_verifier = AuthVerifierFlask()
 
 
+class CachedAuthVerifier:
+    """Verify the token and tenant of a request, skipping wazo-auth when cached
+
+    Verifications are cached by token, tenant and view arguments, which
+    determine the required ACL. Without a cache, every request is verified.
+    On a miss, the token infos give the session and expiry of the entry.
+    """
+
+    _cache = None
+
+    @classmethod
+    def set_cache(cls, cache):
+        cls._cache = cache
+
+    def __init__(self, verifier):
+        self._verifier = verifier
+
+    def verify(self, func):
+        verified = self._verify(func)
+        check = self._verify(_verification(func))
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            token_id = request.headers.get('X-Auth-Token')
+            if not self._cache or not token_id:
+                return verified(*args, **kwargs)
+
+            key = (
+                token_id,
+                request.headers.get('Wazo-Tenant'),
+                request.endpoint,
+                request.method,
+                tuple(sorted(kwargs.items())),
+            )
+            if not self._cache.get(key):
+                check(*args, **kwargs)
+                infos = token.infos
+                self._cache.add(
+                    key, infos.get('session_uuid'), infos.get('utc_expires_at')
+                )
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def _verify(self, func):
+        return self._verifier.verify_token(self._verifier.verify_tenant(func))
+
+
+def _verification(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        pass
+
+    return wrapper
+
+
+cached_auth_verifier = CachedAuthVerifier(auth_verifier)
+
+
 class ErrorCatchingResource(Resource):
     method_decorators = [handle_api_exception] + Resource.method_decorators
 
@@ -26,17 +97,46 @@ class ListSchema(BaseSchema):
     offset = fields.Integer(validate=validate.Range(min=0))
     search = fields.String()
     recurse = fields.Boolean()
+    after = Cursor()
+    skip_total = fields.Boolean()
+    fieldset = Fieldset(data_key='fields')
 
     class Meta:
         unknown = marshmallow.INCLUDE
 
+    @validates_schema
+    def validate_fieldset(self, data, **kwargs):
+        if 'fieldset' in data and not self.context.get('selectable_fields'):
+            raise ValidationError('Not supported by this resource', 'fields')
+
+    @validates_schema
+    def validate_after(self, data, **kwargs):
+        if 'after' not in data:
+            if 'skip_total' in data:
+                raise ValidationError('Only supported with after', 'skip_total')
+            return
+        if not self.context.get('keyset_paging'):
+            raise ValidationError('Not supported by this resource', 'after')
+        for name in ('offset', 'order', 'search'):
+            if name in data:
+                raise ValidationError('Cannot be combined with after', name)
+
+
+class FieldsetSchema(BaseSchema):
+    fieldset = Fieldset(data_key='fields')
+
 
 class ConfdResource(ErrorCatchingResource):
     method_decorators = [
-        auth_verifier.verify_tenant,
-        auth_verifier.verify_token,
+        cached_auth_verifier.verify,
     ] + ErrorCatchingResource.method_decorators
 
+    _visible_tenants_cache = None
+
+    @classmethod
+    def set_visible_tenants_cache(cls, cache):
+        cls._visible_tenants_cache = cache
+
     def _has_write_tenant_uuid(self):
         return (
             self._has_write_tenant_uuid_sqlalchemy()
@@ -67,10 +167,28 @@ class ConfdResource(ErrorCatchingResource):
         if not params.get('recurse', False):
             return [tenant_uuid]
 
-        return [tenant.uuid for tenant in token.visible_tenants(tenant_uuid)]
+        return self._visible_tenants(tenant_uuid)
+
+    def _visible_tenants(self, tenant_uuid):
+        cache = self._visible_tenants_cache
+        if not cache:
+            return [tenant.uuid for tenant in token.visible_tenants(tenant_uuid)]
+
+        tenant_uuids = cache.get(token.uuid, tenant_uuid)
+        if tenant_uuids is None:
+            tenant_uuids = [
+                tenant.uuid for tenant in token.visible_tenants(tenant_uuid)
+            ]
+            cache.add(token.uuid, tenant_uuid, tenant_uuids)
+        return list(tenant_uuids)
 
 
 class ListResource(ConfdResource):
+    # Whether `after` pages the list, with the `keyset_query` of the service
+    keyset_paging = False
+    # Whether `fields` selects the dumped fields
+    selectable_fields = True
+
     def __init__(self, service):
         super().__init__()
         self.service = service
@@ -78,22 +196,67 @@ class ListResource(ConfdResource):
     def get(self):
         params = self.search_params()
         tenant_uuids = self._build_tenant_list(params)
+        if 'after' in params:
+            return self.get_after(params, tenant_uuids)
+
+        schema = fieldset_schema(self.schema, params.pop('fieldset', None))
         kwargs = {}
         if tenant_uuids is not None:
             kwargs['tenant_uuids'] = tenant_uuids
 
         total, items = self.service.search(params, **kwargs)
-        return {'total': total, 'items': self.schema().dump(items, many=True)}
+        return self.list_response(schema, items, total)
+
+    def list_response(self, schema, items, total):
+        streaming = current_app.config['rest_api']['streaming']
+        if streaming['enabled'] and len(items) >= streaming['min_items']:
+            chunks = chunked(items, streaming['chunk_size'])
+            return stream_response(generate_list(schema, chunks, total=total))
+        return {'total': total, 'items': schema.dump(items, many=True)}
+
+    def get_after(self, params, tenant_uuids, schema=None):
+        fieldset = params.get('fieldset')
+        schema = fieldset_schema(schema or self.schema, fieldset)
+        query = self.service.keyset_query(tenant_uuids)
+        model = query.column_descriptions[0]['entity']
+        options = fieldset_options(model, schema, fieldset)
+        if not fieldset:
+            options = preload_options(model, schema)
+        limit = params.get('limit')
+        page = KeysetPage(
+            query.options(*options),
+            params['after'],
+            limit=limit,
+            direction=params.get('direction', 'asc'),
+        )
+        fields = {}
+        if not params.get('skip_total', False):
+            fields['total'] = page.count()
+
+        streaming = current_app.config['rest_api']['streaming']
+        if streaming['enabled'] and (not limit or limit >= streaming['min_items']):
+            chunks = page.chunks(streaming['chunk_size'])
+            fields['after'] = lambda: page.after
+            return stream_response(generate_list(schema, chunks, **fields))
+
+        items = page.all()
+        return {'items': schema.dump(items, many=True), 'after': page.after, **fields}
 
     def search_params(self):
-        return ListSchema().load(request.args)
+        schema = ListSchema(
+            context={
+                'keyset_paging': self.keyset_paging,
+                'selectable_fields': self.selectable_fields,
+            }
+        )
+        return schema.load(request.args)
 
     def add_tenant_to_form(self, form):
         if not self._has_write_tenant_uuid():
             return form
 
         tenant = Tenant.autodetect()
-        tenant_dao.find_or_create_tenant(tenant.uuid)
+        known_tenants.find_or_create(tenant.uuid)
         form['tenant_uuid'] = tenant.uuid
         return form
 
@@ -117,8 +280,9 @@ class ItemResource(ConfdResource):
 
     def get(self, id):
         kwargs = self._add_tenant_uuid()
+        fieldset = FieldsetSchema().load(request.args).get('fieldset')
         model = self.service.get(id, **kwargs)
-        return self.schema().dump(model)
+        return fieldset_schema(self.schema, fieldset).dump(model)
 
     def put(self, id):
         kwargs = self._add_tenant_uuid()
@@ -159,7 +323,7 @@ class ItemResource(ConfdResource):
 
 def build_tenant():
     tenant = Tenant.autodetect()
-    tenant_dao.find_or_create_tenant(tenant.uuid)
+    known_tenants.find_or_create(tenant.uuid)
     return tenant.uuid
 
 
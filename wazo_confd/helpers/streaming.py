@@ -0,0 +1,37 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+
+from itertools import islice
+
+
+def chunked(items, size):
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def generate_list(schema, chunks, **fields):
+    """Generate a JSON object whose `items` are dumped chunk by chunk
+
+    `fields` are written after the items. A callable value is only called
+    once all items are written.
+    """
+    yield '{"items": ['
+    separator = ''
+    for chunk in chunks:
+        items = json.dumps(schema.dump(chunk, many=True))[1:-1]
+        if items:
+            yield separator + items
+            separator = ', '
+    yield ']'
+
+    for name, value in fields.items():
+        if callable(value):
+            value = value()
+        yield ', {}: {}'.format(json.dumps(name), json.dumps(value))
+    yield '}'
@@ -0,0 +1,58 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import threading
+
+from flask import g
+from xivo_dao import tenant_dao
+from xivo_dao.alchemy.tenant import Tenant
+from xivo_dao.helpers.db_utils import session_scope
+
+logger = logging.getLogger(__name__)
+
+
+class KnownTenants:
+    """Thread-safe set of the tenants known to exist in the database
+
+    Only tenants missing from the set are looked up, and created if needed,
+    in the database. A tenant created by an API request is only added to the
+    set once the request transaction is committed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tenant_uuids = set()
+
+    def prime(self):
+        with session_scope() as session:
+            tenant_uuids = {uuid for uuid, in session.query(Tenant.uuid)}
+        with self._lock:
+            self._tenant_uuids.update(tenant_uuids)
+        logger.debug('%s known tenants', len(tenant_uuids))
+
+    def find_or_create(self, tenant_uuid):
+        with self._lock:
+            if tenant_uuid in self._tenant_uuids:
+                return
+
+        tenant_dao.find_or_create_tenant(tenant_uuid)
+        g.setdefault('pending_tenant_uuids', set()).add(tenant_uuid)
+
+    def commit(self):
+        for tenant_uuid in g.pop('pending_tenant_uuids', ()):
+            self.add(tenant_uuid)
+
+    def rollback(self):
+        g.pop('pending_tenant_uuids', None)
+
+    def add(self, tenant_uuid):
+        with self._lock:
+            self._tenant_uuids.add(tenant_uuid)
+
+    def discard(self, tenant_uuid):
+        with self._lock:
+            self._tenant_uuids.discard(tenant_uuid)
+
+
+known_tenants = KnownTenants()
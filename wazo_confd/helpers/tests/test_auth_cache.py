@@ -0,0 +1,194 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, PropertyMock, patch
+
+from flask import Flask
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries, none
+
+from wazo_confd.helpers.auth_cache import TokenCache, VisibleTenantsCache
+from wazo_confd.helpers.restful import CachedAuthVerifier
+
+
+def utc_expires_at(seconds):
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return expires_at.replace(tzinfo=None).isoformat()
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TokenCache(ttl=10, max_size=2)
+
+    def test_get_when_not_cached_then_miss(self):
+        assert_that(self.cache.get('key'), equal_to(False))
+
+    def test_get_when_cached_then_hit(self):
+        self.cache.add('key', 'session-uuid')
+
+        assert_that(self.cache.get('key'), equal_to(True))
+
+    def test_get_when_cached_without_session_then_hit(self):
+        self.cache.add('key', None)
+
+        assert_that(self.cache.get('key'), equal_to(True))
+
+    @patch('wazo_confd.helpers.auth_cache.time.monotonic')
+    def test_get_when_ttl_elapsed_then_miss(self, monotonic):
+        monotonic.return_value = 100
+        self.cache.add('key', 'session-uuid')
+
+        monotonic.return_value = 110
+        assert_that(self.cache.get('key'), equal_to(False))
+
+    @patch('wazo_confd.helpers.auth_cache.time.monotonic')
+    def test_get_when_token_expired_then_miss(self, monotonic):
+        monotonic.return_value = 100
+        self.cache.add('key', 'session-uuid', utc_expires_at(5))
+
+        monotonic.return_value = 104
+        assert_that(self.cache.get('key'), equal_to(True))
+        monotonic.return_value = 105
+        assert_that(self.cache.get('key'), equal_to(False))
+
+    @patch('wazo_confd.helpers.auth_cache.time.monotonic')
+    def test_get_when_expiry_with_offset_then_expiry_used(self, monotonic):
+        monotonic.return_value = 100
+        expires_at = datetime.now(timezone(timedelta(hours=-5))) + timedelta(seconds=5)
+        self.cache.add('key', 'session-uuid', expires_at.isoformat())
+
+        monotonic.return_value = 105
+        assert_that(self.cache.get('key'), equal_to(False))
+
+    def test_add_when_token_already_expired_then_not_cached(self):
+        self.cache.add('key', 'session-uuid', utc_expires_at(-1))
+
+        assert_that(self.cache.get('key'), equal_to(False))
+
+    def test_add_when_full_then_least_recently_used_evicted(self):
+        self.cache.add('key-1', 'session-uuid')
+        self.cache.add('key-2', 'session-uuid')
+        self.cache.get('key-1')
+
+        self.cache.add('key-3', 'session-uuid')
+
+        assert_that(self.cache.get('key-1'), equal_to(True))
+        assert_that(self.cache.get('key-2'), equal_to(False))
+        assert_that(self.cache.get('key-3'), equal_to(True))
+
+    def test_session_deleted_then_session_entries_removed(self):
+        bus_consumer = Mock()
+        self.cache.subscribe(bus_consumer)
+        self.cache.add('key-1', 'session-1')
+        self.cache.add('key-2', 'session-2')
+
+        (_, handler), _ = bus_consumer.subscribe.call_args
+        handler({'uuid': 'session-1', 'user_uuid': 'user-uuid'})
+
+        assert_that(self.cache.get('key-1'), equal_to(False))
+        assert_that(self.cache.get('key-2'), equal_to(True))
+
+    def test_session_deleted_then_entries_without_session_kept(self):
+        self.cache.add('key-1')
+        self.cache.add('key-2', 'session-2')
+
+        self.cache.invalidate_session('session-1')
+
+        assert_that(self.cache.get('key-1'), equal_to(True))
+        assert_that(self.cache.get('key-2'), equal_to(True))
+
+    def test_provide_status(self):
+        self.cache.add('key', 'session-uuid')
+        self.cache.get('key')
+        self.cache.get('unknown')
+        status = defaultdict(dict)
+
+        self.cache.provide_status(status)
+
+        assert_that(status['token_cache'], has_entries(hits=1, misses=1, size=1))
+
+
+class TestVisibleTenantsCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = VisibleTenantsCache(ttl=10)
+
+    def test_get_when_cached_then_tenants(self):
+        self.cache.add('token', 'tenant', ['tenant', 'sub-tenant'])
+
+        assert_that(
+            self.cache.get('token', 'tenant'), contains_exactly('tenant', 'sub-tenant')
+        )
+        assert_that(self.cache.get('other-token', 'tenant'), none())
+        assert_that(self.cache.get('token', 'sub-tenant'), none())
+
+    def test_tenant_added_or_deleted_then_cleared(self):
+        bus_consumer = Mock()
+        self.cache.subscribe(bus_consumer)
+        handlers = {
+            name: handler
+            for (name, handler), _ in bus_consumer.subscribe.call_args_list
+        }
+
+        for name in ('auth_tenant_added', 'auth_tenant_deleted'):
+            self.cache.add('token', 'tenant', ['tenant'])
+
+            handlers[name]({'uuid': 'new-tenant', 'slug': 'new'})
+
+            assert_that(self.cache.get('token', 'tenant'), none())
+
+
+class TestCachedAuthVerifier(unittest.TestCase):
+    def setUp(self):
+        self.checks = []
+        self.verifier = Mock()
+        self.verifier.verify_tenant.side_effect = lambda func: func
+        self.verifier.verify_token.side_effect = self._verify_token
+        self.cache = TokenCache(ttl=10)
+        CachedAuthVerifier.set_cache(self.cache)
+        self.addCleanup(CachedAuthVerifier.set_cache, None)
+        self.view = CachedAuthVerifier(self.verifier).verify(lambda: 'result')
+
+    def _verify_token(self, func):
+        def wrapper(*args, **kwargs):
+            self.checks.append(func)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @patch('wazo_confd.helpers.restful.token')
+    def test_when_not_cached_then_verified_once(self, token):
+        infos = PropertyMock(
+            return_value={
+                'session_uuid': 'session-uuid',
+                'utc_expires_at': utc_expires_at(60),
+            }
+        )
+        type(token).infos = infos
+        app = Flask(__name__)
+
+        with app.test_request_context(headers={'X-Auth-Token': 'token'}):
+            assert_that(self.view(), equal_to('result'))
+            assert_that(self.view(), equal_to('result'))
+
+        assert_that(len(self.checks), equal_to(1))
+        infos.assert_called_once_with()
+
+    @patch('wazo_confd.helpers.restful.token')
+    def test_when_session_deleted_then_verified_again(self, token):
+        type(token).infos = PropertyMock(
+            return_value={
+                'session_uuid': 'session-uuid',
+                'utc_expires_at': utc_expires_at(60),
+            }
+        )
+        app = Flask(__name__)
+
+        with app.test_request_context(headers={'X-Auth-Token': 'token'}):
+            self.view()
+            self.cache.invalidate_session('session-uuid')
+            self.view()
+
+        assert_that(len(self.checks), equal_to(2))
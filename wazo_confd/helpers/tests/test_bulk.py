@@ -0,0 +1,91 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import patch
+
+from hamcrest import (
+    assert_that,
+    calling,
+    contains_exactly,
+    empty,
+    has_length,
+    raises,
+)
+from sqlalchemy import Column, Integer, String, create_engine, event
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+from xivo_dao.helpers.exception import InputError
+
+from wazo_confd.helpers.bulk import get_all_by
+
+Base = declarative_base()
+
+
+class User(Base):
+    __tablename__ = 'user'
+
+    id = Column(Integer, primary_key=True)
+    uuid = Column(String)
+    tenant_uuid = Column(String)
+
+
+class TestGetAllBy(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all(
+            [
+                User(id=1, uuid='uuid-1', tenant_uuid='tenant'),
+                User(id=2, uuid='uuid-2', tenant_uuid='tenant'),
+                User(id=3, uuid='uuid-3', tenant_uuid='other'),
+            ]
+        )
+        self.session.commit()
+
+        self.queries = []
+        event.listen(engine, 'before_cursor_execute', self._count_query)
+        patcher = patch('wazo_confd.helpers.bulk.Session', self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.session.close()
+
+    def _count_query(self, conn, cursor, statement, *args):
+        self.queries.append(statement)
+
+    def test_given_values_when_get_all_by_then_one_query_in_order(self):
+        result = get_all_by(User, 'uuid', ['uuid-2', 'uuid-1'], 'users', 'User')
+
+        assert_that([user.id for user in result], contains_exactly(2, 1))
+        assert_that(self.queries, has_length(1))
+
+    def test_given_no_values_when_get_all_by_then_no_query(self):
+        result = get_all_by(User, 'uuid', [], 'users', 'User')
+
+        assert_that(result, empty())
+        assert_that(self.queries, empty())
+
+    def test_given_integer_key_when_get_all_by_then_found(self):
+        result = get_all_by(User, 'id', [1, 2, 1], 'users', 'User')
+
+        assert_that([user.id for user in result], contains_exactly(1, 2, 1))
+
+    def test_given_other_tenant_when_get_all_by_then_not_found(self):
+        assert_that(
+            calling(get_all_by).with_args(
+                User, 'uuid', ['uuid-3'], 'users', 'User', tenant_uuids=['tenant']
+            ),
+            raises(InputError, 'uuid-3'),
+        )
+
+    def test_given_missing_values_when_get_all_by_then_all_reported(self):
+        assert_that(
+            calling(get_all_by).with_args(
+                User, 'uuid', ['unknown-1', 'uuid-1', 'unknown-2'], 'users', 'User'
+            ),
+            raises(InputError, "unknown-1.*unknown-2"),
+        )
@@ -1,15 +1,19 @@
-# Copyright 2013-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import unittest
 
+from unittest.mock import patch
+
 from flask import Flask
+from hamcrest import assert_that, equal_to
 from werkzeug.exceptions import HTTPException, BadRequest
 
 from xivo_dao.helpers.exception import NotFoundError
 from xivo_dao.helpers.exception import ServiceError
 
 from ..common import handle_api_exception
+from ..tenant import KnownTenants
 
 
 class TestCommon(unittest.TestCase):
@@ -88,3 +92,32 @@ class TestHandleError(TestCommon):
         response = handle_api_exception(lambda: self.raise_(exception))()
 
         self.assertResponse(response, expected_status_code, expected_message)
+
+
+@patch('wazo_confd.helpers.common.Session')
+@patch('wazo_confd.helpers.tenant.tenant_dao')
+class TestHandleErrorKnownTenants(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('test')
+        self.known_tenants = KnownTenants()
+        known_tenants_patch = patch(
+            'wazo_confd.helpers.common.known_tenants', self.known_tenants
+        )
+        known_tenants_patch.start()
+        self.addCleanup(known_tenants_patch.stop)
+
+    def test_tenant_created_then_error_then_commit_then_tenant_unknown(
+        self, tenant_dao, _
+    ):
+        def view():
+            self.known_tenants.find_or_create('tenant-uuid')
+            raise ServiceError('error')
+
+        with self.app.app_context():
+            handle_api_exception(view)()
+            self.known_tenants.commit()
+
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+
+        assert_that(tenant_dao.find_or_create_tenant.call_count, equal_to(2))
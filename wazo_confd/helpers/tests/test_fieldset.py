@@ -0,0 +1,158 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from hamcrest import (
+    assert_that,
+    calling,
+    empty,
+    equal_to,
+    has_entries,
+    has_key,
+    has_length,
+    not_,
+    raises,
+)
+from marshmallow import Schema, ValidationError, fields
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, sessionmaker
+
+from wazo_confd.helpers.fieldset import (
+    fieldset_options,
+    fieldset_schema,
+    preload_options,
+)
+
+Base = declarative_base()
+
+
+class Group(Base):
+    __tablename__ = 'group'
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('user.id'))
+
+
+class Line(Base):
+    __tablename__ = 'line'
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('user.id'))
+
+
+class User(Base):
+    __tablename__ = 'user'
+
+    id = Column(Integer, primary_key=True)
+    firstname = Column(String)
+    lastname = Column(String)
+    lines = relationship(Line, lazy='joined')
+    groups = relationship(Group)
+
+    @hybrid_property
+    def fullname(self):
+        return '{} {}'.format(self.firstname, self.lastname)
+
+
+class LineSchema(Schema):
+    id = fields.Integer()
+
+
+class GroupSchema(Schema):
+    id = fields.Integer()
+
+
+class UserSchema(Schema):
+    id = fields.Integer()
+    firstname = fields.String()
+    surname = fields.String(attribute='lastname')
+    fullname = fields.String()
+    lines = fields.Nested(LineSchema, many=True)
+    memberships = fields.Nested(GroupSchema, many=True, attribute='groups')
+
+
+class TestFieldsetSchema(unittest.TestCase):
+    def test_no_fieldset_then_all_fields(self):
+        schema = fieldset_schema(UserSchema)
+
+        assert_that(
+            sorted(schema.fields),
+            equal_to(
+                ['firstname', 'fullname', 'id', 'lines', 'memberships', 'surname']
+            ),
+        )
+
+    def test_fieldset_then_only_fields(self):
+        schema = fieldset_schema(UserSchema, ['id', 'lines.id'])
+
+        assert_that(sorted(schema.fields), equal_to(['id', 'lines']))
+
+    def test_unknown_field_then_error(self):
+        assert_that(
+            calling(fieldset_schema).with_args(UserSchema, ['unknown']),
+            raises(ValidationError),
+        )
+
+
+class _UserQueryTestCase(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add(
+            User(
+                id=1,
+                firstname='Al',
+                lastname='Ice',
+                lines=[Line(id=1)],
+                groups=[Group(id=1)],
+            )
+        )
+        self.session.commit()
+        self.session.expunge_all()
+
+    def tearDown(self):
+        self.session.close()
+
+
+class TestFieldsetOptions(_UserQueryTestCase):
+    def load(self, fieldset):
+        schema = fieldset_schema(UserSchema, fieldset)
+        options = fieldset_options(User, schema, fieldset)
+        return self.session.query(User).options(*options).one().__dict__
+
+    def test_columns_then_only_columns_loaded(self):
+        loaded = self.load(['id', 'surname'])
+
+        assert_that(loaded, has_entries(id=1, lastname='Ice', lines=empty()))
+        assert_that(loaded, not_(has_key('firstname')))
+
+    def test_relationship_then_relationship_loaded(self):
+        loaded = self.load(['firstname', 'lines.id'])
+
+        assert_that(loaded, has_entries(firstname='Al', lines=has_length(1)))
+        assert_that(loaded, not_(has_key('lastname')))
+
+    def test_hybrid_property_then_no_options(self):
+        schema = fieldset_schema(UserSchema, ['id', 'fullname'])
+
+        assert_that(fieldset_options(User, schema, ['id', 'fullname']), empty())
+
+    def test_no_fieldset_then_no_options(self):
+        assert_that(fieldset_options(User, UserSchema(), None), empty())
+
+
+class TestPreloadOptions(_UserQueryTestCase):
+    def test_lazy_relationship_then_preloaded(self):
+        options = preload_options(User, UserSchema())
+        loaded = self.session.query(User).options(*options).one().__dict__
+
+        assert_that(loaded, has_entries(groups=has_length(1)))
+
+    def test_no_lazy_relationship_then_no_options(self):
+        schema = fieldset_schema(UserSchema, ['id', 'lines.id'])
+
+        assert_that(preload_options(User, schema), empty())
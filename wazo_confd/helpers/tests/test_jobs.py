@@ -0,0 +1,76 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import Mock, patch
+
+from flask import Flask, request
+from flask_restful import Api, Resource
+from hamcrest import assert_that, calling, equal_to, has_entries, raises
+from marshmallow import ValidationError
+
+from wazo_confd._jobs import JobRunner
+from wazo_confd.helpers.jobs import asynchronous, report_progress
+
+
+class Import(Resource):
+    @asynchronous
+    def post(self):
+        report_progress(rows=len(request.get_json()))
+        if request.args.get('fail'):
+            return ['Error'], 400
+        return {'created': request.get_json()}, 201
+
+
+class Job(Resource):
+    def get(self, job_uuid):
+        return {}
+
+
+@patch('wazo_confd.helpers.jobs.Tenant')
+class TestAsynchronous(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        api = Api(self.app)
+        api.add_resource(Import, '/import')
+        api.add_resource(Job, '/jobs/<job_uuid>', endpoint='jobs')
+        self.runner = JobRunner(workers=1)
+        self.app.extensions['job_runner'] = self.runner
+        self.client = self.app.test_client()
+
+    def test_given_no_async_when_request_then_run_synchronously(self, Tenant):
+        with self.runner:
+            response = self.client.post('/import', json=['a'])
+
+        assert_that(response.status_code, equal_to(201))
+
+    def test_given_async_when_request_then_job_returned(self, Tenant):
+        Tenant.autodetect.return_value = Mock(uuid='tenant-uuid')
+
+        with self.runner:
+            response = self.client.post('/import?async=true', json=['a', 'b'])
+
+        assert_that(response.status_code, equal_to(202))
+        job = self.runner.get(response.get_json()['uuid'])
+        assert_that(
+            response.headers['Location'], equal_to(f'http://localhost/jobs/{job.uuid}')
+        )
+        assert_that(job.tenant_uuid, equal_to('tenant-uuid'))
+        assert_that(job.status, equal_to('succeeded'))
+        assert_that(job.result, equal_to({'created': ['a', 'b']}))
+        assert_that(job.progress, has_entries(rows=2))
+
+    def test_given_async_when_request_fails_then_job_failed(self, Tenant):
+        with self.runner:
+            response = self.client.post('/import?async=true&fail=1', json=['a'])
+
+        job = self.runner.get(response.get_json()['uuid'])
+        assert_that(job.status, equal_to('failed'))
+        assert_that(job.error, equal_to(['Error']))
+
+    def test_given_async_when_no_worker_then_error(self, Tenant):
+        self.app.extensions['job_runner'] = JobRunner(workers=0)
+
+        with self.app.test_request_context('/import?async=true', method='POST'):
+            assert_that(calling(Import().post), raises(ValidationError))
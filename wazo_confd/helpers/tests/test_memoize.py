@@ -0,0 +1,148 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import Mock, sentinel
+
+from flask import Flask
+from hamcrest import assert_that, equal_to, same_instance
+from sqlalchemy import Column, Integer, String, create_engine, event
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from wazo_confd.helpers.memoize import (
+    RequestMemoizedDAO,
+    clear_request_memo,
+    forget_request_memo,
+    request_memoized,
+)
+
+Base = declarative_base()
+
+
+class Context(Base):
+    __tablename__ = 'context'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    type = Column(String)
+
+
+class ContextDAO:
+    def __init__(self, session):
+        self.session = session
+
+    def get_by_name(self, name):
+        return self.session.query(Context).filter(Context.name == name).one()
+
+    def find_by(self, **criteria):
+        return self.session.query(Context).filter_by(**criteria).first()
+
+
+class TestRequestMemoized(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add(Context(name='default', type='internal'))
+        self.session.commit()
+
+        self.queries = []
+        event.listen(engine, 'before_cursor_execute', self._count_query)
+        self.dao = RequestMemoizedDAO(ContextDAO(self.session), 'get_by_name')
+        self.app = Flask(__name__)
+
+    def tearDown(self):
+        self.session.close()
+
+    def _count_query(self, conn, cursor, statement, *args):
+        self.queries.append(statement)
+
+    def test_extension_update_then_context_queried_once(self):
+        with self.app.app_context():
+            # GetResource, ExtenRegexValidator, ContextOnUpdateValidator,
+            # ExtensionRangeValidator and SameTenantValidator
+            contexts = [self.dao.get_by_name('default') for _ in range(5)]
+
+        assert_that(len(self.queries), equal_to(1))
+        assert_that(contexts[4], same_instance(contexts[0]))
+
+    def test_wrappers_of_same_function_then_shared(self):
+        context_dao = ContextDAO(self.session)
+        get_resource = request_memoized(context_dao.get_by_name)
+        other_dao = RequestMemoizedDAO(context_dao, 'get_by_name')
+
+        with self.app.app_context():
+            get_resource('default')
+            other_dao.get_by_name('default')
+
+        assert_that(len(self.queries), equal_to(1))
+
+    def test_new_request_then_queried_again(self):
+        with self.app.app_context():
+            self.dao.get_by_name('default')
+        with self.app.app_context():
+            self.dao.get_by_name('default')
+
+        assert_that(len(self.queries), equal_to(2))
+
+    def test_cleared_then_queried_again(self):
+        with self.app.app_context():
+            self.dao.get_by_name('default')
+            clear_request_memo()
+            self.dao.get_by_name('default')
+
+        assert_that(len(self.queries), equal_to(2))
+
+    def test_forgotten_then_queried_again(self):
+        with self.app.app_context():
+            self.dao.get_by_name('default')
+            forget_request_memo(self.dao)
+            self.dao.get_by_name('default')
+
+        assert_that(len(self.queries), equal_to(2))
+
+    def test_other_dao_forgotten_then_not_queried_again(self):
+        other_dao = RequestMemoizedDAO(ContextDAO(self.session), 'get_by_name')
+
+        with self.app.app_context():
+            self.dao.get_by_name('default')
+            forget_request_memo(other_dao)
+            self.dao.get_by_name('default')
+
+        assert_that(len(self.queries), equal_to(1))
+
+    def test_not_memoized_function_then_not_memoized(self):
+        with self.app.app_context():
+            self.dao.find_by(name='default')
+            self.dao.find_by(name='default')
+
+        assert_that(len(self.queries), equal_to(2))
+
+    def test_outside_request_then_not_memoized(self):
+        self.dao.get_by_name('default')
+        self.dao.get_by_name('default')
+
+        assert_that(len(self.queries), equal_to(2))
+
+    def test_none_result_then_not_memoized(self):
+        find = Mock(return_value=None)
+        memoized_find = request_memoized(find)
+
+        with self.app.app_context():
+            memoized_find(name='unknown')
+            find.return_value = sentinel.created
+            result = memoized_find(name='unknown')
+
+        assert_that(result, same_instance(sentinel.created))
+
+    def test_unhashable_arguments_then_frozen(self):
+        get = Mock(return_value=sentinel.resource)
+        memoized_get = request_memoized(get)
+
+        with self.app.app_context():
+            memoized_get(1, tenant_uuids=['a', 'b'])
+            memoized_get(1, tenant_uuids=['a', 'b'])
+
+        get.assert_called_once_with(1, tenant_uuids=['a', 'b'])
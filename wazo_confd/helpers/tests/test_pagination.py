@@ -0,0 +1,191 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+from unittest.mock import patch
+
+from hamcrest import (
+    assert_that,
+    calling,
+    contains_exactly,
+    equal_to,
+    has_entries,
+    none,
+    raises,
+)
+from marshmallow import Schema, ValidationError
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+from werkzeug.exceptions import BadRequest
+
+from wazo_confd.helpers.pagination import (
+    Cursor,
+    KeysetPage,
+    encode_cursor,
+    tenant_query,
+)
+from wazo_confd.helpers.restful import ListSchema
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'item'
+
+    id = Column(Integer, primary_key=True)
+    tenant_uuid = Column(String)
+
+
+class CursorSchema(Schema):
+    after = Cursor()
+
+
+class TestCursor(unittest.TestCase):
+    def test_empty_then_first_page(self):
+        result = CursorSchema().load({'after': ''})
+
+        assert_that(result['after'], equal_to({}))
+
+    def test_encoded_then_decoded(self):
+        cursor = encode_cursor('id', 'desc', 42)
+
+        result = CursorSchema().load({'after': cursor})
+
+        assert_that(result['after'], has_entries(key='id', direction='desc', value=42))
+
+    def test_invalid_then_error(self):
+        for cursor in ('not-a-cursor', encode_cursor('id', 'sideways', 1)):
+            assert_that(
+                calling(CursorSchema().load).with_args({'after': cursor}),
+                raises(ValidationError),
+            )
+
+
+class _ItemQueryTestCase(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all(
+            Item(id=id_, tenant_uuid='tenant' if id_ != 3 else 'other')
+            for id_ in range(1, 7)
+        )
+        self.session.flush()
+        self.query = self.session.query(Item).filter(Item.tenant_uuid == 'tenant')
+
+    def tearDown(self):
+        self.session.close()
+
+
+class TestKeysetPage(_ItemQueryTestCase):
+    def test_pages_then_all_items_once(self):
+        ids, cursor = [], {}
+        while True:
+            page = KeysetPage(self.query, cursor, limit=2)
+            ids.extend(item.id for item in page.all())
+            if not page.after:
+                break
+            cursor = CursorSchema().load({'after': page.after})['after']
+
+        assert_that(ids, contains_exactly(1, 2, 4, 5, 6))
+
+    def test_count_then_total_of_all_pages(self):
+        page = KeysetPage(self.query, {}, limit=2)
+
+        assert_that(page.count(), equal_to(5))
+
+    def test_descending_then_reversed(self):
+        page = KeysetPage(self.query, {}, limit=3, direction='desc')
+        items = page.all()
+        cursor = CursorSchema().load({'after': page.after})['after']
+        next_page = KeysetPage(self.query, cursor, limit=3)
+        next_items = next_page.all()
+
+        assert_that([item.id for item in items], contains_exactly(6, 5, 4))
+        assert_that([item.id for item in next_items], contains_exactly(2, 1))
+        assert_that(next_page.after, none())
+
+    def test_cursor_of_another_key_then_error(self):
+        cursor = {'key': 'uuid', 'direction': 'asc', 'value': 'abc'}
+
+        assert_that(
+            calling(KeysetPage).with_args(self.query, cursor),
+            raises(ValidationError),
+        )
+
+    def test_chunks_then_all_items_by_chunks(self):
+        page = KeysetPage(self.query, {})
+
+        chunks = [[item.id for item in chunk] for chunk in page.chunks(2)]
+
+        assert_that(chunks, contains_exactly([1, 2], [4, 5], [6]))
+        assert_that(page.after, none())
+
+    def test_chunks_with_limit_then_cursor_of_next_page(self):
+        page = KeysetPage(self.query, {}, limit=3)
+
+        chunks = [[item.id for item in chunk] for chunk in page.chunks(2)]
+        cursor = CursorSchema().load({'after': page.after})['after']
+        items = KeysetPage(self.query, cursor).all()
+
+        assert_that(chunks, contains_exactly([1, 2], [4]))
+        assert_that([item.id for item in items], contains_exactly(5, 6))
+
+    def test_limit_zero_then_all_items(self):
+        page = KeysetPage(self.query, {}, limit=0)
+
+        items = page.all()
+        chunks = [[item.id for item in chunk] for chunk in page.chunks(2)]
+
+        assert_that([item.id for item in items], contains_exactly(1, 2, 4, 5, 6))
+        assert_that(chunks, contains_exactly([1, 2], [4, 5], [6]))
+        assert_that(page.after, none())
+
+
+class TestTenantQuery(_ItemQueryTestCase):
+    def test_tenant_uuids_then_filtered(self):
+        with patch('wazo_confd.helpers.pagination.Session', self.session):
+            query = tenant_query(Item, ['other'])
+
+        assert_that([item.id for item in query], contains_exactly(3))
+
+    def test_no_tenant_uuids_then_all_items(self):
+        with patch('wazo_confd.helpers.pagination.Session', self.session):
+            query = tenant_query(Item)
+
+        assert_that(query.count(), equal_to(6))
+
+
+class TestListSchema(unittest.TestCase):
+    def setUp(self):
+        self.schema = ListSchema(
+            context={'keyset_paging': True, 'selectable_fields': True}
+        )
+
+    def test_skip_total_with_after_then_loaded(self):
+        result = self.schema.load({'after': '', 'skip_total': 'true'})
+
+        assert_that(result, has_entries(after={}, skip_total=True))
+
+    def test_skip_total_without_after_then_error(self):
+        assert_that(
+            calling(self.schema.load).with_args({'skip_total': 'true'}),
+            raises(BadRequest),
+        )
+
+    def test_after_without_keyset_paging_then_error(self):
+        schema = ListSchema(context={'selectable_fields': True})
+
+        assert_that(
+            calling(schema.load).with_args({'after': ''}),
+            raises(BadRequest),
+        )
+
+    def test_fields_without_selectable_fields_then_error(self):
+        schema = ListSchema(context={'keyset_paging': True})
+
+        assert_that(
+            calling(schema.load).with_args({'fields': 'id'}),
+            raises(BadRequest),
+        )
@@ -0,0 +1,48 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from hamcrest import assert_that, contains_exactly, empty
+
+from wazo_confd.helpers.reload import ReloadPlanner
+
+
+class TestReloadPlanner(unittest.TestCase):
+    def setUp(self):
+        self.planner = ReloadPlanner(
+            ['dialplan reload', 'module reload res_pjsip.so'],
+            {
+                'firstname': [],
+                'caller_id': ['module reload res_pjsip.so'],
+            },
+        )
+
+    def test_unknown_changes_then_all_handlers(self):
+        result = self.planner.plan(None)
+
+        assert_that(
+            result, contains_exactly('dialplan reload', 'module reload res_pjsip.so')
+        )
+
+    def test_no_changes_then_no_handlers(self):
+        result = self.planner.plan([])
+
+        assert_that(result, empty())
+
+    def test_field_not_read_by_asterisk_then_no_handlers(self):
+        result = self.planner.plan(['firstname'])
+
+        assert_that(result, empty())
+
+    def test_mapped_field_then_only_required_handlers(self):
+        result = self.planner.plan(['firstname', 'caller_id'])
+
+        assert_that(result, contains_exactly('module reload res_pjsip.so'))
+
+    def test_unmapped_field_then_all_handlers(self):
+        result = self.planner.plan(['caller_id', 'context'])
+
+        assert_that(
+            result, contains_exactly('dialplan reload', 'module reload res_pjsip.so')
+        )
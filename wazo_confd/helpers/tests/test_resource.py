@@ -1,4 +1,4 @@
-# Copyright 2013-2022 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import unittest
@@ -75,6 +75,13 @@ class TestCRUDService(unittest.TestCase):
 
         self.notifier.edited.assert_called_once_with(sentinel.resource)
 
+    def test_given_notify_updated_fields_when_editing_then_fields_notified(self):
+        self.service.notify_updated_fields = True
+
+        self.service.edit(sentinel.resource, updated_fields=['name'])
+
+        self.notifier.edited.assert_called_once_with(sentinel.resource, ['name'])
+
     def test_when_deleting_then_resource_validated(self):
         self.service.delete(sentinel.resource)
 
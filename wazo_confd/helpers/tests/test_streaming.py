@@ -0,0 +1,51 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import unittest
+
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries
+from marshmallow import Schema, fields
+
+from wazo_confd.helpers.streaming import chunked, generate_list
+
+
+class ItemSchema(Schema):
+    id = fields.Integer()
+
+
+class TestChunked(unittest.TestCase):
+    def test_chunked(self):
+        result = list(chunked(range(5), 2))
+
+        assert_that(result, contains_exactly([0, 1], [2, 3], [4]))
+
+
+class TestGenerateList(unittest.TestCase):
+    def test_items_then_json_object(self):
+        chunks = chunked([{'id': id_} for id_ in range(5)], 2)
+
+        result = json.loads(''.join(generate_list(ItemSchema(), chunks, total=5)))
+
+        assert_that(
+            result,
+            has_entries(items=[{'id': id_} for id_ in range(5)], total=5),
+        )
+
+    def test_no_items_then_empty_list(self):
+        result = json.loads(''.join(generate_list(ItemSchema(), [], total=0)))
+
+        assert_that(result, equal_to({'items': [], 'total': 0}))
+
+    def test_callable_field_then_called_after_items(self):
+        dumped = []
+
+        def chunks():
+            dumped.append(True)
+            yield [{'id': 1}]
+
+        result = json.loads(
+            ''.join(generate_list(ItemSchema(), chunks(), after=lambda: len(dumped)))
+        )
+
+        assert_that(result, has_entries(after=1))
@@ -0,0 +1,55 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import patch
+
+from flask import Flask
+from hamcrest import assert_that, equal_to
+
+from wazo_confd.helpers.tenant import KnownTenants
+
+
+@patch('wazo_confd.helpers.tenant.tenant_dao')
+class TestKnownTenants(unittest.TestCase):
+    def setUp(self):
+        self.known_tenants = KnownTenants()
+        self.app = Flask(__name__)
+
+    def test_find_or_create_when_known_then_database_not_queried(self, tenant_dao):
+        self.known_tenants.add('tenant-uuid')
+
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+
+        tenant_dao.find_or_create_tenant.assert_not_called()
+
+    def test_find_or_create_when_committed_then_known(self, tenant_dao):
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+            self.known_tenants.commit()
+
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+
+        tenant_dao.find_or_create_tenant.assert_called_once_with('tenant-uuid')
+
+    def test_find_or_create_when_rolled_back_then_unknown(self, tenant_dao):
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+            self.known_tenants.rollback()
+
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+
+        assert_that(tenant_dao.find_or_create_tenant.call_count, equal_to(2))
+
+    def test_find_or_create_when_discarded_then_unknown(self, tenant_dao):
+        self.known_tenants.add('tenant-uuid')
+        self.known_tenants.discard('tenant-uuid')
+
+        with self.app.app_context():
+            self.known_tenants.find_or_create('tenant-uuid')
+
+        tenant_dao.find_or_create_tenant.assert_called_once_with('tenant-uuid')
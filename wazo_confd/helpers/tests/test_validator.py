@@ -1,7 +1,9 @@
-# Copyright 2015-2022 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import unittest
+
+from flask import Flask
 from hamcrest import assert_that, raises, calling, equal_to
 from unittest.mock import Mock, sentinel
 
@@ -41,6 +43,17 @@ class TestGetResource(unittest.TestCase):
 
         self.dao_get.assert_called_once_with(model.field)
 
+    def test_given_resource_deleted_during_request_then_raises_error(self):
+        model = Mock(field=sentinel.field)
+
+        with Flask(__name__).app_context():
+            self.validator.validate(model)
+            self.dao_get.side_effect = NotFoundError
+
+            assert_that(
+                calling(self.validator.validate).with_args(model), raises(InputError)
+            )
+
 
 class TestUniqueField(unittest.TestCase):
     def setUp(self):
@@ -1,11 +1,11 @@
-# Copyright 2016-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import os
 import logging
 
 from xivo import wsgi
-from flask import Flask, g
+from flask import Flask, Response, g, stream_with_context
 from flask_cors import CORS
 from flask_restful import Api
 from sqlalchemy.exc import SQLAlchemyError
@@ -19,8 +19,11 @@ from xivo_dao.helpers.db_utils import session_scope
 from xivo_dao.resources.infos import dao as info_dao
 
 from ._bus import BusPublisher
+from ._device_updates import DeviceUpdateQueue
 from ._sysconfd import SysconfdPublisher
 from .helpers.converter import FilenameConverter
+from .helpers.memoize import clear_request_memo
+from .helpers.tenant import known_tenants
 
 logger = logging.getLogger(__name__)
 app = Flask('wazo_confd')
@@ -35,6 +38,13 @@ def get_bus_publisher():
     return publisher
 
 
+def get_device_update_queue():
+    queue = g.get('device_update_queue')
+    if not queue:
+        queue = g.device_update_queue = DeviceUpdateQueue()
+    return queue
+
+
 def get_sysconfd_publisher():
     publisher = g.get('sysconfd_publisher')
     if not publisher:
@@ -47,31 +57,84 @@ def log_requests():
 
 
 def after_request(response):
+    if not g.get('streaming'):
+        complete_request()
+    return http_helpers.log_request(response)
+
+
+def complete_request():
     commit_database()
+    flush_device_updates()
     flush_sysconfd()
     flush_bus()
-    return http_helpers.log_request(response)
+
+
+def complete_chunk():
+    # Commit the work done so far by a request that goes on: the next changes
+    # are sent by new publishers, since the flushed ones may still be in use
+    # by the flush dispatcher.
+    complete_request()
+    g.pop('sysconfd_publisher', None)
+    g.pop('bus_publisher', None)
+
+
+def stream_response(chunks, mimetype='application/json'):
+    # The database session is used until the whole response is sent, so the
+    # request is completed once the last chunk is generated.
+    g.streaming = True
+
+    def generate():
+        try:
+            yield from chunks
+        finally:
+            complete_request()
+
+    return Response(stream_with_context(generate()), mimetype=mimetype)
 
 
 def commit_database():
     try:
         Session.commit()
+        known_tenants.commit()
     except SQLAlchemyError:
         Session.rollback()
+        known_tenants.rollback()
         raise
     finally:
+        clear_request_memo()
         Session.remove()
 
 
+def flush_device_updates():
+    # Devices are updated from the committed configuration
+    queue = g.pop('device_update_queue', None)
+    if not queue:
+        return
+
+    dispatcher = app.extensions.get('device_update_dispatcher')
+    if dispatcher:
+        dispatcher.dispatch(queue)
+    else:
+        queue.flush()
+
+
 def flush_sysconfd():
     publisher = g.get('sysconfd_publisher')
     if publisher:
-        publisher.flush()
+        dispatch_flush(publisher)
 
 
 def flush_bus():
     publisher = g.get('bus_publisher')
     if publisher:
+        dispatch_flush(publisher)
+
+
+def dispatch_flush(publisher):
+    dispatcher = app.extensions.get('flush_dispatcher')
+    if dispatcher:
+        dispatcher.dispatch(publisher)
+    else:
         publisher.flush()
 
 
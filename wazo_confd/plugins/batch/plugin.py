@@ -0,0 +1,17 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from .resource import BatchResource
+from .service import BatchService
+
+
+class Plugin:
+    def load(self, dependencies):
+        api = dependencies['api']
+        service = BatchService(api.app, api.prefix)
+
+        api.add_resource(
+            BatchResource,
+            '/batch',
+            resource_class_args=(service,),
+        )
@@ -0,0 +1,57 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from urllib.parse import parse_qs, urlsplit
+
+from flask import request
+from marshmallow import ValidationError, validates
+from xivo.mallow import fields, validate
+
+from wazo_confd.auth import required_acl
+from wazo_confd.helpers.mallow import BaseSchema, Nested
+from wazo_confd.helpers.restful import ConfdResource
+
+
+class BatchOperationSchema(BaseSchema):
+    method = fields.String(
+        required=True, validate=validate.OneOf(['POST', 'PUT', 'DELETE'])
+    )
+    path = fields.String(required=True, validate=validate.Regexp(r'^/'))
+    body = fields.Raw(load_default=None, allow_none=True)
+
+    @validates('path')
+    def validate_path(self, path, **kwargs):
+        url = urlsplit(path)
+        resource = url.path.rstrip('/')
+        query = parse_qs(url.query)
+        if resource == '/batch':
+            raise ValidationError('Batches cannot be nested')
+        # A job runs outside of the transaction of the batch
+        if any(value in fields.Boolean.truthy for value in query.get('async', [])):
+            raise ValidationError('Asynchronous operations cannot be batched')
+        # A chunked import commits each of its chunks
+        if resource == '/users/import' and 'chunk_size' in query:
+            raise ValidationError('Chunked imports cannot be batched')
+
+
+class BatchSchema(BaseSchema):
+    operations = Nested(
+        BatchOperationSchema,
+        many=True,
+        required=True,
+        validate=validate.Length(min=1),
+    )
+
+
+class BatchResource(ConfdResource):
+    schema = BatchSchema
+
+    def __init__(self, service):
+        super().__init__()
+        self.service = service
+
+    @required_acl('confd.batch.create')
+    def post(self):
+        form = self.schema().load(request.get_json())
+        results, status = self.service.execute(form['operations'], request.headers)
+        return {'items': results}, status
@@ -0,0 +1,62 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+
+from wazo_confd.helpers.common import rollback
+
+logger = logging.getLogger(__name__)
+
+NOT_FORWARDED_HEADERS = ('Content-Length', 'Content-Type')
+
+
+class BatchService:
+    def __init__(self, app, prefix):
+        self.app = app
+        self.prefix = prefix or ''
+
+    def execute(self, operations, headers):
+        """Dispatch `operations` in order to the API resources
+
+        All operations share the database transaction and the bus and sysconfd
+        publishers of the batch request, which are committed and flushed once
+        by the batch request. The first failed operation rolls back the whole
+        batch and the next operations are not executed.
+        """
+        headers = [
+            (name, value)
+            for name, value in headers.items()
+            if name not in NOT_FORWARDED_HEADERS
+        ]
+        results = []
+        for operation in operations:
+            response = self._dispatch(operation, headers)
+            body = None
+            if response.status_code != 204:
+                body = response.get_json(silent=True)
+            results.append({'status': response.status_code, 'body': body})
+            logger.debug(
+                'Batch operation %s %s: %s',
+                operation['method'],
+                operation['path'],
+                response.status_code,
+            )
+            if response.status_code >= 400:
+                rollback()
+                return results, response.status_code
+        return results, 200
+
+    def _dispatch(self, operation, headers):
+        # The request context of an operation reuses the application context,
+        # hence the `g` publishers, of the batch request
+        with self.app.test_request_context(
+            self.prefix + operation['path'],
+            method=operation['method'],
+            headers=headers,
+            json=operation['body'],
+        ):
+            try:
+                response = self.app.dispatch_request()
+            except Exception as e:
+                response = self.app.handle_user_exception(e)
+            return self.app.make_response(response)
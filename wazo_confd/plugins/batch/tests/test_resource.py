@@ -0,0 +1,41 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from hamcrest import assert_that, calling, equal_to, raises
+from marshmallow import ValidationError
+
+from ..resource import BatchOperationSchema
+
+
+class TestBatchOperationSchema(unittest.TestCase):
+    def setUp(self):
+        self.schema = BatchOperationSchema(handle_error=False)
+
+    def load(self, path):
+        return self.schema.load({'method': 'POST', 'path': path})
+
+    def test_path_then_loaded(self):
+        result = self.load('/users/import')
+
+        assert_that(result['path'], equal_to('/users/import'))
+
+    def test_nested_batch_then_rejected(self):
+        assert_that(calling(self.load).with_args('/batch/'), raises(ValidationError))
+
+    def test_async_then_rejected(self):
+        assert_that(
+            calling(self.load).with_args('/users?async=true'), raises(ValidationError)
+        )
+
+    def test_async_false_then_loaded(self):
+        result = self.load('/users?async=false')
+
+        assert_that(result['path'], equal_to('/users?async=false'))
+
+    def test_chunked_import_then_rejected(self):
+        assert_that(
+            calling(self.load).with_args('/users/import?chunk_size=100'),
+            raises(ValidationError),
+        )
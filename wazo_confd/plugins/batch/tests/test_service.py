@@ -0,0 +1,82 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import patch
+
+from flask import Flask, g, request
+from flask_restful import Api, Resource
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries
+
+from ..service import BatchService
+
+
+class ItemList(Resource):
+    def post(self):
+        g.setdefault('created', []).append(request.get_json()['name'])
+        return {'name': request.get_json()['name']}, 201
+
+
+class Item(Resource):
+    def put(self, name):
+        if name not in g.get('created', []):
+            return ['Item was not found'], 404
+        g.setdefault('headers', []).append(request.headers.get('X-Auth-Token'))
+        return '', 204
+
+
+@patch('wazo_confd.plugins.batch.service.rollback')
+class TestBatchService(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        api = Api(self.app, prefix='/1.1')
+        api.add_resource(ItemList, '/items')
+        api.add_resource(Item, '/items/<name>')
+        self.service = BatchService(self.app, api.prefix)
+
+    def execute(self, *operations):
+        with self.app.test_request_context(
+            '/1.1/batch', method='POST', headers={'X-Auth-Token': 'token'}
+        ):
+            results, status = self.service.execute(operations, request.headers)
+            return results, status, dict(vars(g))
+
+    def test_given_operations_when_execute_then_state_shared(self, rollback):
+        results, status, state = self.execute(
+            {'method': 'POST', 'path': '/items', 'body': {'name': 'one'}},
+            {'method': 'PUT', 'path': '/items/one', 'body': None},
+        )
+
+        assert_that(status, equal_to(200))
+        assert_that(
+            results,
+            contains_exactly(
+                {'status': 201, 'body': {'name': 'one'}},
+                {'status': 204, 'body': None},
+            ),
+        )
+        assert_that(state, has_entries(created=['one'], headers=['token']))
+        rollback.assert_not_called()
+
+    def test_given_failed_operation_when_execute_then_stop_and_rollback(self, rollback):
+        results, status, state = self.execute(
+            {'method': 'POST', 'path': '/items', 'body': {'name': 'one'}},
+            {'method': 'PUT', 'path': '/items/two', 'body': None},
+            {'method': 'POST', 'path': '/items', 'body': {'name': 'three'}},
+        )
+
+        assert_that(status, equal_to(404))
+        assert_that(
+            [result['status'] for result in results], contains_exactly(201, 404)
+        )
+        assert_that(state, has_entries(created=['one']))
+        rollback.assert_called_once_with()
+
+    def test_given_unknown_path_when_execute_then_not_found(self, rollback):
+        results, status, _ = self.execute(
+            {'method': 'POST', 'path': '/unknown', 'body': None},
+        )
+
+        assert_that(status, equal_to(404))
+        rollback.assert_called_once_with()
@@ -1,8 +1,7 @@
-# Copyright 2018-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2018-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.call_filter import dao as call_filter_dao
-from xivo_dao.resources.user import dao as user_dao
 
 from .resource import CallFilterRecipientUserList, CallFilterSurrogateUserList
 from .service import build_service
@@ -17,12 +16,12 @@ class Plugin:
             CallFilterRecipientUserList,
             '/callfilters/<int:call_filter_id>/recipients/users',
             endpoint='call_filter_recipients_users',
-            resource_class_args=(service, call_filter_dao, user_dao),
+            resource_class_args=(service, call_filter_dao),
         )
 
         api.add_resource(
             CallFilterSurrogateUserList,
             '/callfilters/<int:call_filter_id>/surrogates/users',
             endpoint='call_filter_surrogate_users',
-            resource_class_args=(service, call_filter_dao, user_dao),
+            resource_class_args=(service, call_filter_dao),
         )
@@ -1,13 +1,13 @@
-# Copyright 2018-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2018-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import request
 
 from xivo_dao.alchemy.callfiltermember import Callfiltermember as CallFilterMember
-from xivo_dao.helpers import errors
-from xivo_dao.helpers.exception import NotFoundError
+from xivo_dao.alchemy.userfeatures import UserFeatures as User
 
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.bulk import get_all_by
 from wazo_confd.helpers.restful import ConfdResource
 
 from .schema import CallFilterRecipientUsersSchema, CallFilterSurrogateUsersSchema
@@ -17,10 +17,9 @@ class CallFilterRecipientUserList(ConfdResource):
     schema = CallFilterRecipientUsersSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, call_filter_dao, user_dao):
+    def __init__(self, service, call_filter_dao):
         self.service = service
         self.call_filter_dao = call_filter_dao
-        self.user_dao = user_dao
 
     @required_acl('confd.callfilters.{call_filter_id}.recipients.users.update')
     def put(self, call_filter_id):
@@ -29,21 +28,22 @@ class CallFilterRecipientUserList(ConfdResource):
             call_filter_id, tenant_uuids=tenant_uuids
         )
         form = self.schema().load(request.get_json())
-        try:
-            recipients = []
-            for user_form in form['users']:
-                user = self.user_dao.get_by(
-                    uuid=user_form['user']['uuid'], tenant_uuids=tenant_uuids
-                )
-                recipient = self.service.find_recipient_by_user(call_filter, user)
-                if not recipient:
-                    recipient = CallFilterMember()
-                    recipient.user = user
-                recipient.timeout = user_form['timeout']
-                recipients.append(recipient)
-
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        users = get_all_by(
+            User,
+            'uuid',
+            [user_form['user']['uuid'] for user_form in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
+        recipients = []
+        for user_form, user in zip(form['users'], users):
+            recipient = self.service.find_recipient_by_user(call_filter, user)
+            if not recipient:
+                recipient = CallFilterMember()
+                recipient.user = user
+            recipient.timeout = user_form['timeout']
+            recipients.append(recipient)
 
         self.service.associate_recipients(call_filter, recipients)
         return '', 204
@@ -53,10 +53,9 @@ class CallFilterSurrogateUserList(ConfdResource):
     schema = CallFilterSurrogateUsersSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, call_filter_dao, user_dao):
+    def __init__(self, service, call_filter_dao):
         self.service = service
         self.call_filter_dao = call_filter_dao
-        self.user_dao = user_dao
 
     @required_acl('confd.callfilters.{call_filter_id}.surrogates.users.update')
     def put(self, call_filter_id):
@@ -65,20 +64,21 @@ class CallFilterSurrogateUserList(ConfdResource):
             call_filter_id, tenant_uuids=tenant_uuids
         )
         form = self.schema().load(request.get_json())
-        try:
-            surrogates = []
-            for user_form in form['users']:
-                user = self.user_dao.get_by(
-                    uuid=user_form['user']['uuid'], tenant_uuids=tenant_uuids
-                )
-                surrogate = self.service.find_surrogate_by_user(call_filter, user)
-                if not surrogate:
-                    surrogate = CallFilterMember()
-                    surrogate.user = user
-                surrogates.append(surrogate)
-
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        users = get_all_by(
+            User,
+            'uuid',
+            [user_form['user']['uuid'] for user_form in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
+        surrogates = []
+        for user in users:
+            surrogate = self.service.find_surrogate_by_user(call_filter, user)
+            if not surrogate:
+                surrogate = CallFilterMember()
+                surrogate.user = user
+            surrogates.append(surrogate)
 
         self.service.associate_surrogates(call_filter, surrogates)
         return '', 204
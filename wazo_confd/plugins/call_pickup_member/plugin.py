@@ -1,9 +1,7 @@
-# Copyright 2018-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2018-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.call_pickup import dao as call_pickup_dao
-from xivo_dao.resources.group import dao as group_dao
-from xivo_dao.resources.user import dao as user_dao
 
 from .resource import (
     CallPickupInterceptorGroupList,
@@ -23,26 +21,26 @@ class Plugin:
             CallPickupInterceptorGroupList,
             '/callpickups/<int:call_pickup_id>/interceptors/groups',
             endpoint='call_pickup_interceptors_groups',
-            resource_class_args=(service, call_pickup_dao, group_dao),
+            resource_class_args=(service, call_pickup_dao),
         )
 
         api.add_resource(
             CallPickupTargetGroupList,
             '/callpickups/<int:call_pickup_id>/targets/groups',
             endpoint='call_pickup_target_groups',
-            resource_class_args=(service, call_pickup_dao, group_dao),
+            resource_class_args=(service, call_pickup_dao),
         )
 
         api.add_resource(
             CallPickupInterceptorUserList,
             '/callpickups/<int:call_pickup_id>/interceptors/users',
             endpoint='call_pickup_interceptors_users',
-            resource_class_args=(service, call_pickup_dao, user_dao),
+            resource_class_args=(service, call_pickup_dao),
         )
 
         api.add_resource(
             CallPickupTargetUserList,
             '/callpickups/<int:call_pickup_id>/targets/users',
             endpoint='call_pickup_target_users',
-            resource_class_args=(service, call_pickup_dao, user_dao),
+            resource_class_args=(service, call_pickup_dao),
         )
@@ -1,12 +1,13 @@
-# Copyright 2018-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2018-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import request
 
-from xivo_dao.helpers import errors
-from xivo_dao.helpers.exception import NotFoundError
+from xivo_dao.alchemy.groupfeatures import GroupFeatures as Group
+from xivo_dao.alchemy.userfeatures import UserFeatures as User
 
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.bulk import get_all_by
 from wazo_confd.helpers.restful import ConfdResource
 
 from .schema import (
@@ -21,10 +22,9 @@ class CallPickupInterceptorGroupList(ConfdResource):
     schema = CallPickupInterceptorGroupsSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, call_pickup_dao, group_dao):
+    def __init__(self, service, call_pickup_dao):
         self.service = service
         self.call_pickup_dao = call_pickup_dao
-        self.group_dao = group_dao
 
     @required_acl('confd.callpickups.{call_pickup_id}.interceptors.groups.update')
     def put(self, call_pickup_id):
@@ -33,13 +33,14 @@ class CallPickupInterceptorGroupList(ConfdResource):
             call_pickup_id, tenant_uuids=tenant_uuids
         )
         form = self.schema().load(request.get_json())
-        try:
-            interceptors = [
-                self.group_dao.get_by(id=group['id'], tenant_uuids=tenant_uuids)
-                for group in form['groups']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('groups', 'Group', **e.metadata)
+        interceptors = get_all_by(
+            Group,
+            'id',
+            [group['id'] for group in form['groups']],
+            'groups',
+            'Group',
+            tenant_uuids=tenant_uuids,
+        )
 
         self.service.associate_interceptor_groups(call_pickup, interceptors)
         return '', 204
@@ -49,10 +50,9 @@ class CallPickupTargetGroupList(ConfdResource):
     schema = CallPickupTargetGroupsSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, call_pickup_dao, group_dao):
+    def __init__(self, service, call_pickup_dao):
         self.service = service
         self.call_pickup_dao = call_pickup_dao
-        self.group_dao = group_dao
 
     @required_acl('confd.callpickups.{call_pickup_id}.targets.groups.update')
     def put(self, call_pickup_id):
@@ -61,13 +61,14 @@ class CallPickupTargetGroupList(ConfdResource):
             call_pickup_id, tenant_uuids=tenant_uuids
         )
         form = self.schema().load(request.get_json())
-        try:
-            targets = [
-                self.group_dao.get_by(id=group['id'], tenant_uuids=tenant_uuids)
-                for group in form['groups']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('groups', 'Group', **e.metadata)
+        targets = get_all_by(
+            Group,
+            'id',
+            [group['id'] for group in form['groups']],
+            'groups',
+            'Group',
+            tenant_uuids=tenant_uuids,
+        )
 
         self.service.associate_target_groups(call_pickup, targets)
         return '', 204
@@ -77,10 +78,9 @@ class CallPickupInterceptorUserList(ConfdResource):
     schema = CallPickupInterceptorUsersSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, call_pickup_dao, user_dao):
+    def __init__(self, service, call_pickup_dao):
         self.service = service
         self.call_pickup_dao = call_pickup_dao
-        self.user_dao = user_dao
 
     @required_acl('confd.callpickups.{call_pickup_id}.interceptors.users.update')
     def put(self, call_pickup_id):
@@ -89,13 +89,14 @@ class CallPickupInterceptorUserList(ConfdResource):
             call_pickup_id, tenant_uuids=tenant_uuids
         )
         form = self.schema().load(request.get_json())
-        try:
-            interceptors = [
-                self.user_dao.get_by(uuid=user['uuid'], tenant_uuids=tenant_uuids)
-                for user in form['users']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        interceptors = get_all_by(
+            User,
+            'uuid',
+            [user['uuid'] for user in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
 
         self.service.associate_interceptor_users(call_pickup, interceptors)
         return '', 204
@@ -105,10 +106,9 @@ class CallPickupTargetUserList(ConfdResource):
     schema = CallPickupTargetUsersSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, call_pickup_dao, user_dao):
+    def __init__(self, service, call_pickup_dao):
         self.service = service
         self.call_pickup_dao = call_pickup_dao
-        self.user_dao = user_dao
 
     @required_acl('confd.callpickups.{call_pickup_id}.targets.users.update')
     def put(self, call_pickup_id):
@@ -117,13 +117,14 @@ class CallPickupTargetUserList(ConfdResource):
             call_pickup_id, tenant_uuids=tenant_uuids
         )
         form = self.schema().load(request.get_json())
-        try:
-            targets = [
-                self.user_dao.get_by(uuid=user['uuid'], tenant_uuids=tenant_uuids)
-                for user in form['users']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        targets = get_all_by(
+            User,
+            'uuid',
+            [user['uuid'] for user in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
 
         self.service.associate_target_users(call_pickup, targets)
         return '', 204
@@ -1,9 +1,10 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers import errors
 from xivo_dao.resources.context import dao as context_dao_module
 
+from wazo_confd.helpers.memoize import RequestMemoizedDAO
 from wazo_confd.helpers.validator import (
     BaseExtensionRangeMixin,
     ValidatorAssociation,
@@ -80,5 +81,9 @@ class ConferenceExtensionAssociationValidator(
 
 def build_validator():
     return ValidationAssociation(
-        association=[ConferenceExtensionAssociationValidator(context_dao_module)]
+        association=[
+            ConferenceExtensionAssociationValidator(
+                RequestMemoizedDAO(context_dao_module, 'get_by_name')
+            )
+        ]
     )
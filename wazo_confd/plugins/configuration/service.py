@@ -1,8 +1,9 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.configuration import dao as configuration_dao
 
+from wazo_confd.helpers.memoize import forget_request_memo
 from wazo_confd.plugins.configuration.notifier import build_notifier
 
 
@@ -16,6 +17,7 @@ class LiveReloadService:
 
     def edit(self, live_reload):
         self.dao.set_live_reload_status(live_reload)
+        forget_request_memo(self.dao)
         self.notifier.edited(live_reload)
 
 
@@ -0,0 +1,50 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import Mock
+
+from flask import Flask
+from hamcrest import assert_that, equal_to
+
+from wazo_confd.helpers.memoize import request_memoized
+
+from ..service import LiveReloadService
+
+
+class LiveReloadDAO:
+    def __init__(self):
+        self.enabled = True
+
+    def is_live_reload_enabled(self):
+        return self.enabled
+
+    def set_live_reload_status(self, live_reload):
+        self.enabled = live_reload['enabled']
+
+
+class TestLiveReloadService(unittest.TestCase):
+    def setUp(self):
+        self.dao = LiveReloadDAO()
+        self.service = LiveReloadService(self.dao, Mock())
+
+    def test_edit_then_live_reload_read_again(self):
+        is_live_reload_enabled = request_memoized(self.dao.is_live_reload_enabled)
+
+        with Flask(__name__).app_context():
+            is_live_reload_enabled()
+            self.service.edit({'enabled': False})
+
+            assert_that(is_live_reload_enabled(), equal_to(False))
+
+    def test_edit_then_other_lookups_kept(self):
+        get = Mock(return_value='resource')
+        memoized_get = request_memoized(get)
+
+        with Flask(__name__).app_context():
+            memoized_get(1)
+            self.service.edit({'enabled': False})
+            memoized_get(1)
+
+        get.assert_called_once_with(1)
@@ -1,13 +1,24 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.context import dao as context_dao
 
+from wazo_confd.helpers.memoize import forget_request_memo
 from wazo_confd.helpers.resource import CRUDService
 
 from .notifier import build_notifier
 from .validator import build_validator
 
 
+class ContextService(CRUDService):
+    def edit(self, context, updated_fields=None):
+        super().edit(context, updated_fields)
+        forget_request_memo(self.dao)
+
+    def delete(self, context):
+        super().delete(context)
+        forget_request_memo(self.dao)
+
+
 def build_service():
-    return CRUDService(context_dao, build_validator(), build_notifier())
+    return ContextService(context_dao, build_validator(), build_notifier())
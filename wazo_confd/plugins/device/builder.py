@@ -77,6 +77,7 @@ def build_device_updater(provd_client):
         line_extension_dao,
         func_key_template_db,
         provd_updater,
+        device_db=device_db,
     )
 
 
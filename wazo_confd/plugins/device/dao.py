@@ -1,4 +1,4 @@
-# Copyright 2015-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
@@ -7,10 +7,14 @@ from xivo_dao.helpers import errors
 
 from wazo_provd_client.exceptions import ProvdError
 
+from wazo_confd.helpers.streaming import chunked
 from wazo_confd.plugins.device.model import Device
 
 logger = logging.getLogger(__name__)
 
+# Configs are listed by batches to keep the query string of provd short
+CONFIG_BATCH_SIZE = 100
+
 
 class DeviceDao:
     def __init__(self, client):
@@ -40,6 +44,33 @@ class DeviceDao:
             provd_config = None
         return Device(provd_device, provd_config)
 
+    def build_devices(self, provd_devices):
+        config_ids = [
+            device['config'] for device in provd_devices if 'config' in device
+        ]
+        provd_configs = {}
+        for batch in chunked(dict.fromkeys(config_ids), CONFIG_BATCH_SIZE):
+            try:
+                configs = self.configs.list({'id': {'$in': batch}})['configs']
+            except ProvdError as e:
+                logger.warning('Could not list the configs of devices: %s', e)
+                configs = self._get_configs(batch)
+            provd_configs.update((config['id'], config) for config in configs)
+
+        return [
+            Device(provd_device, provd_configs.get(provd_device.get('config')))
+            for provd_device in provd_devices
+        ]
+
+    def _get_configs(self, config_ids):
+        configs = []
+        for config_id in config_ids:
+            try:
+                configs.append(self.configs.get(config_id))
+            except ProvdError:
+                continue
+        return configs
+
     def find_by(self, tenant_uuid=None, **criteria):
         kwargs = {}
         if tenant_uuid is None:
@@ -1,4 +1,4 @@
-# Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.utils.search import SearchResult
@@ -71,17 +71,26 @@ class SearchEngine:
 
     def search(self, parameters, tenant_uuid=None):
         self.validate_parameters(parameters)
-        provd_devices = self.find_all_devices(parameters, tenant_uuid=tenant_uuid)
-        provd_devices = self.filter_devices(provd_devices, parameters.get('search'))
-        total = len(provd_devices)
-
-        provd_devices = self.paginate_devices(
-            provd_devices,
-            parameters.get('offset', 0),
-            parameters.get('limit'),
-        )
-
-        items = [self.dao.build_device(provd_device) for provd_device in provd_devices]
+        offset = parameters.get('offset', 0)
+        limit = parameters.get('limit')
+
+        if parameters.get('search') is None:
+            # provd filters and paginates the devices, only the total is counted
+            provd_devices = self.find_all_devices(
+                parameters, tenant_uuid=tenant_uuid, offset=offset, limit=limit
+            )
+            if limit or offset:
+                total = self.count_devices(parameters, tenant_uuid=tenant_uuid)
+            else:
+                total = len(provd_devices)
+        else:
+            # provd cannot search a substring in all keys
+            provd_devices = self.find_all_devices(parameters, tenant_uuid=tenant_uuid)
+            provd_devices = self.filter_devices(provd_devices, parameters['search'])
+            total = len(provd_devices)
+            provd_devices = self.paginate_devices(provd_devices, offset, limit)
+
+        items = self.dao.build_devices(provd_devices)
 
         return SearchResult(total=total, items=items)
 
@@ -96,7 +105,7 @@ class SearchEngine:
                     parameters['order'], self.PROVD_DEVICE_KEYS
                 )
 
-    def find_all_devices(self, parameters, tenant_uuid=None):
+    def find_all_devices(self, parameters, tenant_uuid=None, **params):
         query = {
             key: value
             for key, value in parameters.items()
@@ -105,14 +114,22 @@ class SearchEngine:
         order = parameters.get('order', self.DEFAULT_ORDER)
         direction = parameters.get('direction', self.DEFAULT_DIRECTION)
         recurse = parameters.get('recurse', False)
+        params = {key: value for key, value in params.items() if value}
         return self.dao.devices.list(
             search=query,
             order=order,
             direction=direction,
             tenant_uuid=tenant_uuid,
             recurse=recurse,
+            **params,
         )['devices']
 
+    def count_devices(self, parameters, tenant_uuid=None):
+        devices = self.find_all_devices(
+            parameters, tenant_uuid=tenant_uuid, fields='id'
+        )
+        return len(devices)
+
     def filter_devices(self, devices, search=None):
         if search is None:
             return devices
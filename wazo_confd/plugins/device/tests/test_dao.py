@@ -0,0 +1,55 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import Mock, patch
+
+from hamcrest import assert_that, contains_exactly, none
+from wazo_provd_client.exceptions import ProvdError
+
+from ..dao import DeviceDao
+
+
+class TestBuildDevices(unittest.TestCase):
+    def setUp(self):
+        self.client = Mock()
+        self.dao = DeviceDao(self.client)
+
+    @patch('wazo_confd.plugins.device.dao.CONFIG_BATCH_SIZE', 2)
+    def test_configs_listed_by_batches(self):
+        devices = [{'id': 'a', 'config': 'c1'}, {'id': 'b', 'config': 'c2'}]
+        devices += [{'id': 'c', 'config': 'c1'}, {'id': 'd', 'config': 'c3'}]
+        devices += [{'id': 'e'}]
+        self.client.configs.list.side_effect = [
+            {'configs': [{'id': 'c1'}, {'id': 'c2'}]},
+            {'configs': [{'id': 'c3'}]},
+        ]
+
+        result = self.dao.build_devices(devices)
+
+        assert_that(
+            [device._config for device in result],
+            contains_exactly(
+                {'id': 'c1'}, {'id': 'c2'}, {'id': 'c1'}, {'id': 'c3'}, none()
+            ),
+        )
+        assert_that(
+            [call.args for call in self.client.configs.list.call_args_list],
+            contains_exactly(
+                ({'id': {'$in': ['c1', 'c2']}},), ({'id': {'$in': ['c3']}},)
+            ),
+        )
+        self.client.configs.get.assert_not_called()
+
+    def test_configs_not_listed_then_fetched_one_by_one(self):
+        devices = [{'id': 'a', 'config': 'c1'}, {'id': 'b', 'config': 'c2'}]
+        self.client.configs.list.side_effect = ProvdError('error')
+        self.client.configs.get.side_effect = [{'id': 'c1'}, ProvdError('error')]
+
+        result = self.dao.build_devices(devices)
+
+        assert_that(
+            [device._config for device in result],
+            contains_exactly({'id': 'c1'}, none()),
+        )
@@ -0,0 +1,67 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import Mock
+
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries
+
+from ..service import SearchEngine
+
+
+class TestSearchEngine(unittest.TestCase):
+    def setUp(self):
+        self.dao = Mock()
+        self.dao.build_devices.side_effect = lambda devices: devices
+        self.engine = SearchEngine(self.dao)
+
+    def test_given_no_search_when_paginated_then_provd_paginates(self):
+        self.dao.devices.list.side_effect = [
+            {'devices': [{'id': 'b'}]},
+            {'devices': [{'id': 'a'}, {'id': 'b'}, {'id': 'c'}]},
+        ]
+
+        result = self.engine.search({'mac': 'mac', 'offset': 1, 'limit': 1})
+
+        assert_that(result.total, equal_to(3))
+        assert_that(result.items, contains_exactly({'id': 'b'}))
+        page_call, count_call = self.dao.devices.list.call_args_list
+        assert_that(
+            page_call.kwargs, has_entries(search={'mac': 'mac'}, offset=1, limit=1)
+        )
+        assert_that(count_call.kwargs, has_entries(search={'mac': 'mac'}, fields='id'))
+
+    def test_given_no_pagination_then_devices_counted_once_listed(self):
+        self.dao.devices.list.return_value = {'devices': [{'id': 'a'}, {'id': 'b'}]}
+
+        result = self.engine.search({})
+
+        assert_that(result.total, equal_to(2))
+        self.dao.devices.list.assert_called_once()
+
+    def test_given_search_then_devices_filtered_and_paginated(self):
+        self.dao.devices.list.return_value = {
+            'devices': [
+                {'id': 'a', 'mac': '00:11'},
+                {'id': 'b', 'ip': '10.0.0.11'},
+                {'id': 'c', 'mac': '00:22'},
+            ]
+        }
+
+        result = self.engine.search({'search': '11', 'limit': 1})
+
+        assert_that(result.total, equal_to(2))
+        assert_that(result.items, contains_exactly(has_entries(id='a')))
+        assert_that(
+            self.dao.devices.list.call_args.kwargs,
+            equal_to(
+                {
+                    'search': {},
+                    'order': 'ip',
+                    'direction': 'asc',
+                    'tenant_uuid': None,
+                    'recurse': False,
+                }
+            ),
+        )
@@ -0,0 +1,109 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import unittest
+
+from unittest.mock import Mock, call, patch
+
+from flask import Flask
+from hamcrest import assert_that, contains_exactly, equal_to
+
+from ..model import Device
+from ..update import DeviceUpdater, ProvdUpdater, config_hash
+
+
+class TestDeviceUpdater(unittest.TestCase):
+    def setUp(self):
+        self.provd_updater = Mock()
+        self.device_db = Mock()
+        self.updater = DeviceUpdater(
+            Mock(), Mock(), Mock(), Mock(), Mock(), self.provd_updater, self.device_db
+        )
+
+    def test_given_no_request_when_update_then_device_updated(self):
+        self.updater.update_for_line(Mock(device_id='device', tenant_uuid='tenant'))
+
+        self.provd_updater.update.assert_called_once_with(
+            'device', tenant_uuid='tenant'
+        )
+
+    @patch('wazo_confd.plugins.device.update.device_updates')
+    def test_given_request_when_update_then_device_queued(self, device_updates):
+        with Flask(__name__).app_context():
+            self.updater.update_device(Mock(id='device'), tenant_uuid='tenant')
+
+        self.provd_updater.update.assert_not_called()
+        device_updates.add.assert_called_once_with(
+            self.provd_updater, 'device', tenant_uuid='tenant'
+        )
+
+    @patch('wazo_confd.plugins.device.update.device_updates')
+    def test_update_for_template_then_devices_found_with_one_query(
+        self, device_updates
+    ):
+        self.device_db.devices_for_template.return_value = [
+            ('device-1', 'tenant'),
+            ('device-2', 'tenant'),
+        ]
+
+        with Flask(__name__).app_context():
+            self.updater.update_for_template(Mock(id=42))
+
+        self.device_db.devices_for_template.assert_called_once_with(42)
+        assert_that(
+            device_updates.add.call_args_list,
+            contains_exactly(
+                call(self.provd_updater, 'device-1', tenant_uuid='tenant'),
+                call(self.provd_updater, 'device-2', tenant_uuid='tenant'),
+            ),
+        )
+
+
+class TestProvdUpdater(unittest.TestCase):
+    def setUp(self):
+        self.dao = Mock()
+        self.config_generator = Mock()
+        self.config = {
+            'id': 'device',
+            'configdevice': 'defaultconfigdevice',
+            'parent_ids': ['base', 'defaultconfigdevice'],
+            'deletable': True,
+            'raw_config': {'sip_lines': {'1': {'username': 'abc'}}},
+        }
+        self.config_generator.generate.return_value = self.config
+        self.updater = ProvdUpdater(self.dao, self.config_generator, Mock())
+
+    def test_given_config_unchanged_when_update_device_then_provd_not_written(self):
+        stored_config = dict(
+            self.config, raw_config={'sip_lines': {'1': {'username': 'abc'}}}
+        )
+        stored_config['transient'] = False
+        device = Device({'id': 'device', 'config': 'device'}, stored_config)
+
+        written = self.updater.update_device(device, tenant_uuid='tenant')
+
+        assert_that(written, equal_to(False))
+        self.dao.edit.assert_not_called()
+
+    def test_given_config_changed_when_update_device_then_provd_written(self):
+        stored_config = dict(self.config, raw_config={'sip_lines': {}})
+        device = Device({'id': 'device', 'config': 'device'}, stored_config)
+
+        written = self.updater.update_device(device, tenant_uuid='tenant')
+
+        assert_that(written, equal_to(True))
+        assert_that(device.config, equal_to(self.config))
+        self.dao.edit.assert_called_once_with(device, tenant_uuid='tenant')
+
+    def test_given_no_stored_config_when_update_device_then_provd_written(self):
+        device = Device({'id': 'device', 'config': 'device'}, None)
+
+        self.updater.update_device(device, tenant_uuid='tenant')
+
+        self.dao.edit.assert_called_once_with(device, tenant_uuid='tenant')
+
+    def test_config_hash_does_not_depend_on_key_order(self):
+        config = {'a': 1, 'b': {'c': 2, 'd': 3}}
+        reordered = {'b': {'d': 3, 'c': 2}, 'a': 1}
+
+        assert_that(config_hash(config), equal_to(config_hash(reordered)))
@@ -1,6 +1,13 @@
-# Copyright 2016-2020 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import hashlib
+import json
+
+from flask import has_app_context
+
+from wazo_confd import device_updates
+
 
 class DeviceUpdater:
     def __init__(
@@ -11,6 +18,7 @@ class DeviceUpdater:
         line_extension_dao,
         func_key_template_db,
         provd_updater,
+        device_db=None,
     ):
         self.user_dao = user_dao
         self.line_dao = line_dao
@@ -18,8 +26,16 @@ class DeviceUpdater:
         self.line_extension_dao = line_extension_dao
         self.func_key_template_db = func_key_template_db
         self.provd_updater = provd_updater
+        self.device_db = device_db
 
     def update_for_template(self, template):
+        if self.device_db:
+            for device_id, tenant_uuid in self.device_db.devices_for_template(
+                template.id
+            ):
+                self._update(device_id, tenant_uuid=tenant_uuid)
+            return
+
         private_users = self.user_dao.find_all_by(
             func_key_private_template_id=template.id
         )
@@ -63,10 +79,17 @@ class DeviceUpdater:
 
     def update_for_line(self, line):
         if line.device_id:
-            self.provd_updater.update(line.device_id, tenant_uuid=line.tenant_uuid)
+            self._update(line.device_id, tenant_uuid=line.tenant_uuid)
 
     def update_device(self, device, tenant_uuid=None):
-        self.provd_updater.update(device.id, tenant_uuid=tenant_uuid)
+        self._update(device.id, tenant_uuid=tenant_uuid)
+
+    def _update(self, device_id, tenant_uuid=None):
+        # Outside of a request, e.g. on bus events, the device is updated at once
+        if not has_app_context():
+            self.provd_updater.update(device_id, tenant_uuid=tenant_uuid)
+            return
+        device_updates.add(self.provd_updater, device_id, tenant_uuid=tenant_uuid)
 
 
 class ProvdUpdater:
@@ -76,15 +99,17 @@ class ProvdUpdater:
         self.line_dao = line_dao
 
     def update(self, device_id, tenant_uuid=None):
+        """Update the device in provd and return whether provd was written"""
         device = self.dao.get(device_id)
         has_lines = self.device_has_lines(device)
 
         if device.is_autoprov() and has_lines:
             self.create_device(device, tenant_uuid=tenant_uuid)
         elif has_lines:
-            self.update_device(device, tenant_uuid=tenant_uuid)
+            return self.update_device(device, tenant_uuid=tenant_uuid)
         else:
             self.reset_autoprov(device, tenant_uuid=tenant_uuid)
+        return True
 
     def device_has_lines(self, device):
         lines = self.line_dao.find_all_by(device_id=device.id)
@@ -97,8 +122,25 @@ class ProvdUpdater:
 
     def update_device(self, device, tenant_uuid=None):
         config = self.config_generator.generate(device)
+        if self.is_unchanged(device, config):
+            return False
+
         device.update_config(config)
         self.dao.edit(device, tenant_uuid=tenant_uuid)
+        return True
+
+    def is_unchanged(self, device, config):
+        stored_config = device._config
+        if stored_config is None or device.device.get('config') != config['id']:
+            return False
+        stored_config = {key: stored_config.get(key) for key in config}
+        return config_hash(stored_config) == config_hash(config)
 
     def reset_autoprov(self, device, tenant_uuid=None):
         self.dao.reset_autoprov(device, tenant_uuid=tenant_uuid)
+
+
+def config_hash(config):
+    """Return a hash of `config` that does not depend on the order of its keys"""
+    text = json.dumps(config, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
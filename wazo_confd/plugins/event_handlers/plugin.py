@@ -1,4 +1,4 @@
-# Copyright 2020-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2020-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
@@ -10,6 +10,7 @@ from xivo_dao.resources.pjsip_transport import dao as transport_dao
 
 from .service import DefaultSIPTemplateService
 from ..._sysconfd import SysconfdPublisher
+from ...helpers.tenant import known_tenants
 from ...sync_db import remove_tenant
 
 logger = logging.getLogger(__name__)
@@ -32,8 +33,10 @@ class TenantEventHandler:
             tenant = self.tenant_dao.find_or_create_tenant(tenant_uuid)
             self.service.generate_sip_templates(tenant)
             self.service.copy_slug(tenant, slug)
+        known_tenants.add(tenant_uuid)
 
     def _auth_tenant_deleted(self, event):
+        known_tenants.discard(event['uuid'])
         remove_tenant(event['uuid'], self.sysconfd)
 
 
@@ -1,6 +1,7 @@
 # Copyright 2016-2022 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from wazo_bus.resources.extension.event import ExtensionEditedEvent
 from wazo_provd_client import Client as ProvdClient
 
 from .middleware import ExtensionMiddleWare
@@ -14,6 +15,8 @@ class Plugin:
         config = dependencies['config']
         token_changed_subscribe = dependencies['token_changed_subscribe']
         middleware_handle = dependencies['middleware_handle']
+        bus_publisher = dependencies['bus_publisher']
+        bus_publisher.register_compaction(ExtensionEditedEvent, key='id')
 
         provd_client = ProvdClient(**config['provd'])
         token_changed_subscribe(provd_client.set_token)
@@ -1,4 +1,4 @@
-# Copyright 2016-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import request, url_for
@@ -11,6 +11,7 @@ from .schema import ExtensionSchema
 
 class ExtensionList(ListResource):
     schema = ExtensionSchema
+    keyset_paging = True
 
     def __init__(self, service, middleware):
         super().__init__(service)
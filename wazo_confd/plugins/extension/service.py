@@ -1,8 +1,10 @@
-# Copyright 2016-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
 
+from xivo_dao.alchemy.context import Context
+from xivo_dao.alchemy.extension import Extension
 from xivo_dao.helpers.db_manager import Session
 from xivo_dao.resources.extension import dao as extension_dao_module
 
@@ -29,6 +31,14 @@ class ExtensionService(CRUDService):
     def search(self, parameters, tenant_uuids=None):
         return self.dao.search(tenant_uuids=tenant_uuids, **parameters)
 
+    def keyset_query(self, tenant_uuids=None):
+        query = Session.query(Extension)
+        if tenant_uuids is not None:
+            query = query.join(Context, Extension.context == Context.name).filter(
+                Context.tenant_uuid.in_(tenant_uuids)
+            )
+        return query
+
     def get(self, resource_id, **kwargs):
         return self.dao.get_by(id=resource_id, **kwargs)
 
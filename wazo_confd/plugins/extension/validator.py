@@ -1,4 +1,4 @@
-# Copyright 2016-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import re
@@ -11,6 +11,7 @@ from xivo_dao.resources.line_extension import dao as line_extension_dao_module
 from xivo_dao.resources.parking_lot import dao as parking_lot_dao_module
 
 
+from wazo_confd.helpers.memoize import RequestMemoizedDAO
 from wazo_confd.helpers.validator import (
     EXTEN_REGEX,
     EXTEN_OUTCALL_REGEX,
@@ -239,22 +240,23 @@ class ExtensionAssociationValidator(Validator):
 
 
 def build_validator():
+    context_dao = RequestMemoizedDAO(context_dao_module, 'get_by_name')
     return ValidationGroup(
-        common=[GetResource('context', context_dao_module.get_by_name, 'Context')],
+        common=[GetResource('context', context_dao.get_by_name, 'Context')],
         create=[
             ExtenAvailableOnCreateValidator(
                 extension_dao_module, parking_lot_dao_module
             ),
-            ExtenRegexValidator(context_dao_module),
+            ExtenRegexValidator(context_dao),
         ],
         edit=[
             ExtenAvailableOnUpdateValidator(
                 extension_dao_module, parking_lot_dao_module
             ),
-            ContextOnUpdateValidator(context_dao_module),
-            ExtensionRangeValidator(context_dao_module),
-            ExtenRegexValidator(context_dao_module),
-            SameTenantValidator(context_dao_module),
+            ContextOnUpdateValidator(context_dao),
+            ExtensionRangeValidator(context_dao),
+            ExtenRegexValidator(context_dao),
+            SameTenantValidator(context_dao),
         ],
         delete=[
             ExtensionAssociationValidator(
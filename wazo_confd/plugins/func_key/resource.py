@@ -1,4 +1,4 @@
-# Copyright 2016-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import url_for, request
@@ -24,6 +24,7 @@ from xivo_dao.alchemy.func_key_mapping import FuncKeyMapping
 from xivo_dao.alchemy.func_key_template import FuncKeyTemplate
 
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.jobs import asynchronous
 from wazo_confd.helpers.restful import ItemResource, ListResource, ConfdResource
 
 from .schema import (
@@ -96,6 +97,7 @@ class FuncKeyTemplateList(ListResource):
     context = {'exclude_destination': ['agent', 'bsfilter']}
     schema = FuncKeyTemplateSchema
     model = FuncKeyTemplate
+    selectable_fields = False
 
     def build_headers(self, template):
         return {
@@ -141,6 +143,7 @@ class FuncKeyTemplateItem(ItemResource, FindUpdateFieldsMixin):
         return self.schema(context=self.context).dump(template)
 
     @required_acl('confd.funckeys.templates.{id}.update')
+    @asynchronous
     def put(self, id):
         kwargs = self._add_tenant_uuid()
         template = self.service.get(id, **kwargs)
@@ -159,6 +162,7 @@ class FuncKeyTemplateItem(ItemResource, FindUpdateFieldsMixin):
         return '', 204
 
     @required_acl('confd.funckeys.templates.{id}.delete')
+    @asynchronous
     def delete(self, id):
         return super().delete(id)
 
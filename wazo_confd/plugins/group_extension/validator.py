@@ -1,9 +1,10 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers import errors
 from xivo_dao.resources.context import dao as context_dao_module
 
+from wazo_confd.helpers.memoize import RequestMemoizedDAO
 from wazo_confd.helpers.validator import (
     BaseExtensionRangeMixin,
     ValidatorAssociation,
@@ -78,5 +79,9 @@ class GroupExtensionAssociationValidator(ValidatorAssociation, BaseExtensionRang
 
 def build_validator():
     return ValidationAssociation(
-        association=[GroupExtensionAssociationValidator(context_dao_module)]
+        association=[
+            GroupExtensionAssociationValidator(
+                RequestMemoizedDAO(context_dao_module, 'get_by_name')
+            )
+        ]
     )
@@ -1,8 +1,7 @@
-# Copyright 2016-2021 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.group import dao as group_dao
-from xivo_dao.resources.user import dao as user_dao
 
 from .resource import GroupMemberUserItem, GroupMemberExtensionItem
 from .service import build_service
@@ -18,7 +17,7 @@ class Plugin:
             '/groups/<int:group_uuid>/members/users',
             '/groups/<uuid:group_uuid>/members/users',
             endpoint='group_member_users',
-            resource_class_args=(service, group_dao, user_dao),
+            resource_class_args=(service, group_dao),
         )
 
         api.add_resource(
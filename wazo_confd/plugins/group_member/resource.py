@@ -1,13 +1,13 @@
-# Copyright 2016-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import request
 
 from xivo_dao.alchemy.queuemember import QueueMember
-from xivo_dao.helpers import errors
-from xivo_dao.helpers.exception import NotFoundError
+from xivo_dao.alchemy.userfeatures import UserFeatures as User
 
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.bulk import get_all_by
 from wazo_confd.helpers.restful import ConfdResource
 
 from .schema import GroupUsersSchema, GroupExtensionsSchema
@@ -30,27 +30,25 @@ class GroupMemberUserItem(GroupMemberItem):
     schema = GroupUsersSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, group_dao, user_dao):
-        super().__init__(service, group_dao)
-        self.user_dao = user_dao
-
     @required_acl('confd.groups.{group_uuid}.members.users.update')
     def put(self, group_uuid):
         tenant_uuids = self._build_tenant_list({'recurse': True})
 
         group = self.group_dao.get(group_uuid, tenant_uuids=tenant_uuids)
         form = self.schema().load(request.get_json())
+        users = get_all_by(
+            User,
+            'uuid',
+            [member_form['user']['uuid'] for member_form in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
         members = []
-        try:
-            for member_form in form['users']:
-                user = self.user_dao.get_by(
-                    uuid=member_form['user']['uuid'], tenant_uuids=tenant_uuids
-                )
-                member = self._find_or_create_member(group, user)
-                member.priority = member_form['priority']
-                members.append(member)
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        for member_form, user in zip(form['users'], users):
+            member = self._find_or_create_member(group, user)
+            member.priority = member_form['priority']
+            members.append(member)
 
         self.service.associate_all_users(group, members)
         return '', 204
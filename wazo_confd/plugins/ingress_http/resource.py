@@ -1,4 +1,4 @@
-# Copyright 2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2024-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import request, url_for
@@ -14,6 +14,7 @@ from .schema import IngressViewSchema, IngressHTTPSchema
 class IngressHTTPList(ListResource):
     model = IngressHTTP
     schema = IngressHTTPSchema
+    selectable_fields = False
 
     def build_headers(self, ingress_http):
         return {
@@ -0,0 +1,15 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from .resource import JobItem
+
+
+class Plugin:
+    def load(self, dependencies):
+        api = dependencies['api']
+
+        api.add_resource(
+            JobItem,
+            '/jobs/<uuid:job_uuid>',
+            endpoint='jobs',
+        )
@@ -0,0 +1,23 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from flask import current_app
+from xivo_dao.helpers import errors
+
+from wazo_confd.auth import required_acl
+from wazo_confd.helpers.jobs import JobSchema
+from wazo_confd.helpers.restful import ConfdResource
+
+
+class JobItem(ConfdResource):
+    schema = JobSchema
+    has_tenant_uuid = True
+
+    @required_acl('confd.jobs.{job_uuid}.read')
+    def get(self, job_uuid):
+        tenant_uuids = self._build_tenant_list({'recurse': True})
+        runner = current_app.extensions.get('job_runner')
+        job = runner.get(str(job_uuid)) if runner else None
+        if not job or job.tenant_uuid not in tenant_uuids:
+            raise errors.not_found('Job', uuid=str(job_uuid))
+        return self.schema().dump(job)
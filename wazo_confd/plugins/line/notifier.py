@@ -8,6 +8,7 @@ from wazo_bus.resources.line.event import (
 )
 
 from wazo_confd import bus, sysconfd
+from wazo_confd.helpers.reload import ReloadPlanner
 from wazo_confd.plugins.line.schema import LineSchema
 
 LINE_FIELDS = [
@@ -17,20 +18,32 @@ LINE_FIELDS = [
     'tenant_uuid',
 ]
 
+RELOAD_PLANNER = ReloadPlanner(
+    [
+        'module reload res_pjsip.so',
+        'dialplan reload',
+        'module reload chan_sccp.so',
+    ],
+    {
+        'provisioning_code': [],
+        'position': [],
+        'registrar': [],
+        'caller_id_name': ['module reload res_pjsip.so', 'module reload chan_sccp.so'],
+        'caller_id_num': ['module reload res_pjsip.so', 'module reload chan_sccp.so'],
+    },
+)
+
 
 class LineNotifier:
     def __init__(self, sysconfd, bus):
         self.sysconfd = sysconfd
         self.bus = bus
 
-    def send_sysconfd_handlers(self):
-        handlers = {
-            'ipbx': [
-                'module reload res_pjsip.so',
-                'dialplan reload',
-                'module reload chan_sccp.so',
-            ],
-        }
+    def send_sysconfd_handlers(self, updated_fields=None):
+        ipbx = RELOAD_PLANNER.plan(updated_fields)
+        if not ipbx:
+            return
+        handlers = {'ipbx': ipbx}
         self.sysconfd.exec_request_handlers(handlers)
 
     def created(self, line):
@@ -40,8 +53,7 @@ class LineNotifier:
         self.bus.queue_event(event)
 
     def edited(self, line, updated_fields):
-        if updated_fields is None or updated_fields:
-            self.send_sysconfd_handlers()
+        self.send_sysconfd_handlers(updated_fields)
         serialized_line = LineSchema(only=LINE_FIELDS).dump(line)
         event = LineEditedEvent(serialized_line, line.tenant_uuid)
         self.bus.queue_event(event)
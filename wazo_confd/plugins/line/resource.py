@@ -18,6 +18,7 @@ class LineList(ListResource):
     model = Line
     schema = LineListSchema
     has_tenant_uuid = True
+    keyset_paging = True
 
     def __init__(self, service, middleware):
         super().__init__(service)
@@ -1,9 +1,11 @@
-# Copyright 2015-2020 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from xivo_dao.alchemy.linefeatures import LineFeatures as Line
 from xivo_dao.helpers.db_manager import Session
 from xivo_dao.resources.line import dao as line_dao_module
 
+from wazo_confd.helpers.pagination import tenant_query
 from wazo_confd.helpers.resource import CRUDService
 from wazo_confd.plugins.device import builder as device_builder
 from wazo_confd.plugins.line_device.service import (
@@ -41,6 +43,9 @@ class LineService(CRUDService):
     def find_all_by(self, **criteria):
         return self.dao.find_all_by(**criteria)
 
+    def keyset_query(self, tenant_uuids=None):
+        return tenant_query(Line, tenant_uuids)
+
     def create(self, resource, tenant_uuids):
         self.validator.validate_create(resource, tenant_uuids=tenant_uuids)
         created_resource = self.dao.create(resource)
@@ -68,6 +68,12 @@ class TestLineNotifier(unittest.TestCase):
 
         self.sysconfd.exec_request_handlers.assert_not_called()
 
+    def test_when_line_edited_and_no_asterisk_field_then_sip_not_reloaded(self):
+        updated_fields = ['provisioning_code', 'position']
+        self.notifier.edited(self.line, updated_fields)
+
+        self.sysconfd.exec_request_handlers.assert_not_called()
+
     def test_when_line_edited_then_event_sent_on_bus(self):
         expected_event = LineEditedEvent(self.line_serialized, self.line.tenant_uuid)
 
@@ -1,10 +1,11 @@
-# Copyright 2015-2020 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers import errors
 from xivo_dao.resources.context import dao as context_dao
 from xivo_dao.resources.line import dao as line_dao
 
+from wazo_confd.helpers.memoize import request_memoized
 from wazo_confd.helpers.validator import (
     GetResource,
     Optional,
@@ -39,11 +40,15 @@ def build_validator(registrar_dao):
             Optional(
                 'registrar', GetResource('registrar', registrar_dao.get, 'Registrar')
             ),
-            GetResource('context', context_dao.get_by_name, 'Context'),
+            GetResource(
+                'context', request_memoized(context_dao.get_by_name), 'Context'
+            ),
         ],
         edit=[
             ProvCodeChanged(line_dao),
             GetResource('registrar', registrar_dao.get, 'Registrar'),
-            GetResource('context', context_dao.get_by_name, 'Context'),
+            GetResource(
+                'context', request_memoized(context_dao.get_by_name), 'Context'
+            ),
         ],
     )
@@ -1,4 +1,4 @@
-# Copyright 2013-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers import errors
@@ -7,6 +7,7 @@ from xivo_dao.resources.user_line import dao as user_line_dao
 from xivo_dao.resources.line_extension import dao as line_extension_dao
 from xivo_dao.resources.extension import dao as extension_dao
 
+from wazo_confd.helpers.memoize import RequestMemoizedDAO
 from wazo_confd.helpers.validator import (
     BaseExtensionRangeMixin,
     ValidatorAssociation,
@@ -106,6 +107,10 @@ class LineExtensionDissociationValidator(ValidatorAssociation):
 
 def build_validator():
     return ValidationAssociation(
-        association=[LineExtensionAssociationValidator(context_dao_module)],
+        association=[
+            LineExtensionAssociationValidator(
+                RequestMemoizedDAO(context_dao_module, 'get_by_name')
+            )
+        ],
         dissociation=[LineExtensionDissociationValidator()],
     )
@@ -1,4 +1,4 @@
-# Copyright 2021-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2021-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
@@ -17,7 +17,7 @@ from xivo_dao.alchemy.endpoint_sip import EndpointSIP
 from xivo_dao.helpers import errors
 
 from wazo_confd.auth import required_acl, no_auth, master_tenant_uuid
-from wazo_confd.helpers.restful import ItemResource, ListResource, ListSchema
+from wazo_confd.helpers.restful import ItemResource, ListResource
 
 from .exceptions import MeetingGuestSIPTemplateNotFound
 from .schema import MeetingSchema
@@ -293,7 +293,7 @@ class UserMeetingList(MeetingList):
         return body
 
     def search_params(self):
-        params = ListSchema().load(request.args)
+        params = super().search_params()
         params['owner'] = self._find_user_uuid()
         return params
 
@@ -1,4 +1,4 @@
-# Copyright 2021-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2021-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import url_for, request
@@ -104,6 +104,7 @@ class _MeResourceMixin:
 class UserMeetingAuthorizationList(ListResource, _MeResourceMixin):
     model = MeetingAuthorization
     schema = MeetingAuthorizationSchema
+    selectable_fields = False
 
     def __init__(self, service, meeting_dao):
         self.service = service
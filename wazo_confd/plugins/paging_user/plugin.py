@@ -1,8 +1,7 @@
-# Copyright 2017-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2017-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.resources.paging import dao as paging_dao
-from xivo_dao.resources.user import dao as user_dao
 
 from .resource import PagingCallerUserItem, PagingMemberUserItem
 from .service import build_service
@@ -17,12 +16,12 @@ class Plugin:
             PagingCallerUserItem,
             '/pagings/<int:paging_id>/callers/users',
             endpoint='paging_caller_users',
-            resource_class_args=(service, paging_dao, user_dao),
+            resource_class_args=(service, paging_dao),
         )
 
         api.add_resource(
             PagingMemberUserItem,
             '/pagings/<int:paging_id>/members/users',
             endpoint='paging_member_users',
-            resource_class_args=(service, paging_dao, user_dao),
+            resource_class_args=(service, paging_dao),
         )
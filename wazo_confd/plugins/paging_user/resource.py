@@ -1,12 +1,12 @@
-# Copyright 2017-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2017-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import request
 
-from xivo_dao.helpers import errors
-from xivo_dao.helpers.exception import NotFoundError
+from xivo_dao.alchemy.userfeatures import UserFeatures as User
 
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.bulk import get_all_by
 from wazo_confd.helpers.mallow import UsersUUIDSchema
 from wazo_confd.helpers.restful import ConfdResource
 
@@ -15,11 +15,10 @@ class PagingUserItem(ConfdResource):
     schema = UsersUUIDSchema
     has_tenant_uuid = True
 
-    def __init__(self, service, paging_dao, user_dao):
+    def __init__(self, service, paging_dao):
         super().__init__()
         self.service = service
         self.paging_dao = paging_dao
-        self.user_dao = user_dao
 
 
 class PagingCallerUserItem(PagingUserItem):
@@ -28,13 +27,14 @@ class PagingCallerUserItem(PagingUserItem):
         tenant_uuids = self._build_tenant_list({'recurse': True})
         paging = self.paging_dao.get(paging_id, tenant_uuids=tenant_uuids)
         form = self.schema().load(request.get_json())
-        try:
-            users = [
-                self.user_dao.get_by(uuid=user['uuid'], tenant_uuids=tenant_uuids)
-                for user in form['users']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        users = get_all_by(
+            User,
+            'uuid',
+            [user['uuid'] for user in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
 
         self.service.associate_all_caller_users(paging, users)
 
@@ -47,13 +47,14 @@ class PagingMemberUserItem(PagingUserItem):
         tenant_uuids = self._build_tenant_list({'recurse': True})
         paging = self.paging_dao.get(paging_id, tenant_uuids=tenant_uuids)
         form = self.schema().load(request.get_json())
-        try:
-            users = [
-                self.user_dao.get_by(uuid=user['uuid'], tenant_uuids=tenant_uuids)
-                for user in form['users']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        users = get_all_by(
+            User,
+            'uuid',
+            [user['uuid'] for user in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
 
         self.service.associate_all_member_users(paging, users)
 
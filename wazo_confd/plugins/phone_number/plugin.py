@@ -1,6 +1,8 @@
 # Copyright 2024 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from wazo_bus.resources.phone_number.event import PhoneNumberEditedEvent
+
 from wazo_confd.helpers.types import PluginDependencies
 from .resource import (
     PhoneNumberItem,
@@ -18,6 +20,8 @@ class PhoneNumberPluginDependencies(PluginDependencies):
 class Plugin:
     def load(self, dependencies: PhoneNumberPluginDependencies):
         api = dependencies['api']
+        bus_publisher = dependencies['bus_publisher']
+        bus_publisher.register_compaction(PhoneNumberEditedEvent, key='uuid')
         service = build_service()
 
         api.add_resource(
@@ -1,4 +1,4 @@
-# Copyright 2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2024-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import url_for, request
@@ -7,6 +7,7 @@ from xivo_dao.alchemy.phone_number import PhoneNumber
 
 from xivo.tenant_flask_helpers import Tenant
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.jobs import asynchronous
 from wazo_confd.helpers.restful import ConfdResource, ListResource, ItemResource
 
 from .schema import (
@@ -22,6 +23,7 @@ from .service import PhoneNumberService
 class PhoneNumberList(ListResource):
     model = PhoneNumber
     schema = PhoneNumberSchema
+    keyset_paging = True
 
     def build_headers(self, resource):
         return {
@@ -45,6 +47,7 @@ class PhoneNumberRange(ConfdResource):
         super().__init__()
 
     @required_acl('confd.phone-numbers.create')
+    @asynchronous
     def post(self):
         tenant_uuid = Tenant.autodetect().uuid
         range_spec = phone_number_range_spec_schema.load(request.get_json())
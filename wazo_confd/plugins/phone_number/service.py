@@ -1,4 +1,4 @@
-# Copyright 2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2024-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 from __future__ import annotations
 
@@ -8,6 +8,8 @@ from typing import Literal
 from xivo_dao.resources.phone_number import dao
 from xivo_dao.alchemy.phone_number import PhoneNumber
 from xivo_dao.helpers.errors import ResourceError
+from wazo_confd.helpers.jobs import report_progress
+from wazo_confd.helpers.pagination import tenant_query
 from wazo_confd.helpers.resource import CRUDService
 
 from .utils import (
@@ -32,6 +34,9 @@ class PhoneNumberService(CRUDService):
     def find_all_by(self, **criteria) -> list[PhoneNumber]:
         return self.dao.find_all_by(**criteria)
 
+    def keyset_query(self, tenant_uuids: list[str] | None = None):
+        return tenant_query(PhoneNumber, tenant_uuids)
+
     def create_range(
         self, range_spec: PhoneNumberRangeSpec, tenant_uuid: str
     ) -> tuple[list[PhoneNumber], list[PhoneNumber]]:
@@ -55,6 +60,10 @@ class PhoneNumberService(CRUDService):
                     raise
 
             register_phone_numbers.append(phone_number)
+            report_progress(
+                created=len(register_phone_numbers),
+                existing=len(_redundant_phone_numbers),
+            )
 
         redundant_phone_numbers = self.find_all_by(
             number_in=_redundant_phone_numbers,
@@ -1,11 +1,10 @@
-# Copyright 2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2023-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from xivo_dao.helpers import errors
-from xivo_dao.helpers.exception import NotFoundError
+from xivo_dao.alchemy.userfeatures import UserFeatures as User
 from xivo_dao.resources.switchboard import dao as switchboard_dao
-from xivo_dao.resources.user import dao as user_dao
 
+from wazo_confd.helpers.bulk import get_all_by
 from wazo_confd.helpers.mallow import UsersUUIDSchema
 
 
@@ -21,13 +20,14 @@ class SwitchboardMemberMiddleWare:
         """
         switchboard = switchboard_dao.get(switchboard_uuid, tenant_uuids=tenant_uuids)
         form = self._schema.load(body)
-        try:
-            users = [
-                user_dao.get_by(uuid=user['uuid'], tenant_uuids=tenant_uuids)
-                for user in form['users']
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+        users = get_all_by(
+            User,
+            'uuid',
+            [user['uuid'] for user in form['users']],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
 
         self._service.associate_all_member_users(switchboard, users)
 
@@ -37,14 +37,18 @@ class SwitchboardMemberMiddleWare:
         The other existing members of the switchboard are kept.
         """
         switchboard = switchboard_dao.get(switchboard_uuid, tenant_uuids=tenant_uuids)
-        try:
-            users = [
-                user_dao.get_by(uuid=user_member.uuid, tenant_uuids=tenant_uuids)
+        users = get_all_by(
+            User,
+            'uuid',
+            [
+                user_member.uuid
                 for user_member in switchboard.user_members
                 if user_member.uuid != user_id
-            ]
-        except NotFoundError as e:
-            raise errors.param_not_found('users', 'User', **e.metadata)
+            ],
+            'users',
+            'User',
+            tenant_uuids=tenant_uuids,
+        )
 
         self._service.associate_all_member_users(switchboard, users)
 
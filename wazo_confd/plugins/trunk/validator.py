@@ -1,9 +1,10 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers import errors
 from xivo_dao.resources.context import dao as context_dao_module
 
+from wazo_confd.helpers.memoize import request_memoized
 from wazo_confd.helpers.validator import (
     GetResource,
     Optional,
@@ -33,14 +34,22 @@ def build_validator():
         create=[
             Optional(
                 'context',
-                GetResource('context', context_dao_module.get_by_name, 'Context'),
+                GetResource(
+                    'context',
+                    request_memoized(context_dao_module.get_by_name),
+                    'Context',
+                ),
             ),
             ContextTenantValidator(context_dao_module),
         ],
         edit=[
             Optional(
                 'context',
-                GetResource('context', context_dao_module.get_by_name, 'Context'),
+                GetResource(
+                    'context',
+                    request_memoized(context_dao_module.get_by_name),
+                    'Context',
+                ),
             ),
             ContextTenantValidator(context_dao_module),
         ],
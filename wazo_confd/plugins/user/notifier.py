@@ -10,6 +10,31 @@ from wazo_bus.resources.user.event import (
 )
 
 from wazo_confd import bus, sysconfd
+from wazo_confd.helpers.reload import ReloadPlanner
+
+RELOAD_PLANNER = ReloadPlanner(
+    [
+        'dialplan reload',
+        'module reload chan_sccp.so',
+        'module reload app_queue.so',
+        'module reload res_pjsip.so',
+    ],
+    {
+        'email': [],
+        'timezone': [],
+        'description': [],
+        'outgoing_caller_id': [],
+        'mobile_phone_number': [],
+        'username': [],
+        'password': [],
+        'userfield': [],
+        'call_permission_password': [],
+        'subscription_type': [],
+        'caller_id': ['module reload chan_sccp.so', 'module reload res_pjsip.so'],
+        'language': ['module reload chan_sccp.so', 'module reload res_pjsip.so'],
+        'music_on_hold': ['module reload chan_sccp.so', 'module reload res_pjsip.so'],
+    },
+)
 
 
 class UserNotifier:
@@ -17,15 +42,11 @@ class UserNotifier:
         self.sysconfd = sysconfd
         self.bus = bus
 
-    def send_sysconfd_handlers(self):
-        handlers = {
-            'ipbx': [
-                'dialplan reload',
-                'module reload chan_sccp.so',
-                'module reload app_queue.so',
-                'module reload res_pjsip.so',
-            ],
-        }
+    def send_sysconfd_handlers(self, updated_fields=None):
+        ipbx = RELOAD_PLANNER.plan(updated_fields)
+        if not ipbx:
+            return
+        handlers = {'ipbx': ipbx}
         self.sysconfd.exec_request_handlers(handlers)
 
     def created(self, user):
@@ -39,8 +60,8 @@ class UserNotifier:
         )
         self.bus.queue_event(event)
 
-    def edited(self, user):
-        self.send_sysconfd_handlers()
+    def edited(self, user, updated_fields=None):
+        self.send_sysconfd_handlers(updated_fields)
         event = UserEditedEvent(
             user.id,
             user.uuid,
@@ -1,6 +1,7 @@
 # Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from wazo_bus.resources.user.event import UserEditedEvent
 from wazo_provd_client import Client as ProvdClient
 
 from .middleware import UserMiddleWare
@@ -25,6 +26,8 @@ class Plugin:
         config = dependencies['config']
         token_changed_subscribe = dependencies['token_changed_subscribe']
         middleware_handle = dependencies['middleware_handle']
+        bus_publisher = dependencies['bus_publisher']
+        bus_publisher.register_compaction(UserEditedEvent, key='uuid')
 
         provd_client = ProvdClient(**config['provd'])
         token_changed_subscribe(provd_client.set_token)
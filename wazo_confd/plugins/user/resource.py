@@ -1,11 +1,13 @@
-# Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import url_for, request
+from marshmallow import ValidationError
 
 from xivo_dao.alchemy.userfeatures import UserFeatures as User
 
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.fieldset import fieldset_schema
 from wazo_confd.helpers.restful import (
     ListResource,
     ItemResource,
@@ -24,6 +26,7 @@ from .schema import (
 class UserList(ListResource):
     model = User
     schema = UserListItemSchema
+    keyset_paging = True
     view_schemas = {'directory': UserDirectorySchema, 'summary': UserSummarySchema}
 
     def __init__(self, service, middleware):
@@ -47,9 +50,15 @@ class UserList(ListResource):
         params = self.search_params()
         tenant_uuids = self._build_tenant_list(params)
         view = params.get('view')
+        if 'after' in params:
+            if view:
+                raise ValidationError('Cannot be combined with after', 'view')
+            return self.get_after(params, tenant_uuids)
+
         schema = self.view_schemas.get(view, UserSchema)
+        schema = fieldset_schema(schema, params.pop('fieldset', None))
         result = self.service.search_collated(params, tenant_uuids)
-        return {'total': result.total, 'items': schema().dump(result.items, many=True)}
+        return self.list_response(schema, result.items, result.total)
 
 
 class UserItem(ItemResource):
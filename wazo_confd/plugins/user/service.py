@@ -1,10 +1,12 @@
-# Copyright 2013-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from xivo_dao.alchemy.userfeatures import UserFeatures as User
 from xivo_dao.resources.user import dao as user_dao
 from xivo_dao.resources.user import strategy
 from xivo_dao.resources.func_key import dao as func_key_dao
 
+from wazo_confd.helpers.pagination import tenant_query
 from wazo_confd.helpers.resource import CRUDService
 from wazo_confd.helpers.validator import ValidationGroup
 from wazo_confd.plugins.device.builder import build_device_updater
@@ -19,6 +21,8 @@ class UserBaseService(CRUDService):
 
 
 class UserService(UserBaseService):
+    notify_updated_fields = True
+
     def __init__(
         self,
         dao,
@@ -55,6 +59,10 @@ class UserService(UserBaseService):
         with self.dao.query_options(*selected_strategy):
             return self.dao.search_collated(tenant_uuids=tenant_uuids, **parameters)
 
+    def keyset_query(self, tenant_uuids=None):
+        query = tenant_query(User, tenant_uuids)
+        return query.options(*strategy.user_unpaginated_strategy)
+
 
 def build_service(provd_client, paginated_user_strategy_threshold):
     updater = build_device_updater(provd_client)
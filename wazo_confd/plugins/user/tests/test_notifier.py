@@ -74,6 +74,23 @@ class TestUserNotifier(unittest.TestCase):
 
         self.sysconfd.exec_request_handlers.assert_called_once_with(EXPECTED_HANDLERS)
 
+    def test_when_user_edited_and_no_asterisk_field_then_nothing_reloaded(self):
+        self.notifier.edited(self.user, ['email', 'userfield'])
+
+        self.sysconfd.exec_request_handlers.assert_not_called()
+
+    def test_when_user_edited_and_caller_id_then_endpoints_reloaded(self):
+        self.notifier.edited(self.user, ['email', 'caller_id'])
+
+        self.sysconfd.exec_request_handlers.assert_called_once_with(
+            {'ipbx': ['module reload chan_sccp.so', 'module reload res_pjsip.so']}
+        )
+
+    def test_when_user_edited_and_name_then_all_reloaded(self):
+        self.notifier.edited(self.user, ['firstname', 'lastname'])
+
+        self.sysconfd.exec_request_handlers.assert_called_once_with(EXPECTED_HANDLERS)
+
     def test_when_user_edited_then_event_sent_on_bus(self):
         expected_event = UserEditedEvent(
             self.user.id,
@@ -1,14 +1,14 @@
-# Copyright 2020-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2020-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from flask import url_for, request
 
 from xivo.tenant_flask_helpers import Tenant
-from xivo_dao import tenant_dao
 from xivo_dao.alchemy.user_external_app import UserExternalApp
 
 from wazo_confd.auth import required_acl
 from wazo_confd.helpers.restful import ListResource, ItemResource
+from wazo_confd.helpers.tenant import known_tenants
 
 from .schema import (
     GETQueryStringSchema,
@@ -20,6 +20,7 @@ from .schema import (
 class UserExternalAppList(ListResource):
     schema = UserExternalAppSchema
     has_tenant_uuid = True
+    selectable_fields = False
 
     def __init__(self, service, user_dao):
         self.service = service
@@ -63,7 +64,7 @@ class UserExternalAppItem(ItemResource):
             return form
 
         tenant = Tenant.autodetect()
-        tenant_dao.find_or_create_tenant(tenant.uuid)
+        known_tenants.find_or_create(tenant.uuid)
         form['tenant_uuid'] = tenant.uuid
         return form
 
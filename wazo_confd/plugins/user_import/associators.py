@@ -1,10 +1,10 @@
-# Copyright 2015-2021 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import abc
 
 from xivo_dao.alchemy.dialaction import Dialaction
-from xivo_dao.helpers.exception import NotFoundError
+from xivo_dao.helpers.exception import NotFoundError, ServiceError
 
 
 class Associator(metaclass=abc.ABCMeta):
@@ -28,6 +28,22 @@ class WazoUserAssociator(Associator):
         wazo_user['uuid'] = user.uuid
         return self.service.create(wazo_user)
 
+    def associate_all(self, entries):
+        """Create the wazo-auth users of `entries` concurrently
+
+        Returns the error of each entry, or None when its user is created.
+        """
+        wazo_users = []
+        for entry in entries:
+            wazo_user = entry.get_resource('wazo_user')
+            wazo_user['uuid'] = entry.get_resource('user').uuid
+            wazo_users.append(wazo_user)
+
+        results = self.service.create_all(wazo_users)
+        return [
+            result if isinstance(result, ServiceError) else None for result in results
+        ]
+
     def update(self, entry):
         pass
 
@@ -1,8 +1,10 @@
-# Copyright 2018-2022 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2018-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+
 from werkzeug.local import LocalProxy as Proxy
 
 from flask import g
@@ -13,11 +15,13 @@ from xivo_dao.helpers.exception import ServiceError
 logger = logging.getLogger(__name__)
 
 auth_config = {}
+auth_concurrency = 1
 
 
 class AuthClientProxy:
-    def __init__(self, auth_client):
+    def __init__(self, auth_client, concurrency=1):
         self._auth_client = auth_client
+        self._concurrency = concurrency
         self._users_created = []
         self.users = self._auth_client.users
 
@@ -30,13 +34,53 @@ class AuthClientProxy:
         self._users_created.append(user)
         return user
 
+    def new_users(self, users):
+        """Create `users` with at most `concurrency` requests at a time
+
+        Returns the created user or the ServiceError of each user, in order.
+        """
+        futures = self._map(lambda user: self._auth_client.users.new(**user), users)
+
+        results = []
+        unexpected_error = None
+        for future in futures:
+            error = future.exception()
+            if error is None:
+                self._users_created.append(future.result())
+                results.append(future.result())
+            elif isinstance(error, HTTPError):
+                results.append(ServiceError(str(error)))
+            else:
+                unexpected_error = unexpected_error or error
+
+        if unexpected_error:
+            raise unexpected_error
+        return results
+
     def edit_user(self, *args, **kwargs):
         # rollback system can be added here
         self.auth_client.users.edit(*args, **kwargs)
 
+    def commit(self):
+        self._users_created = []
+
     def rollback(self):
-        for user in self._users_created:
-            self._auth_client.users.delete(user['uuid'])
+        users, self._users_created = self._users_created, []
+        futures = self._map(
+            lambda user: self._auth_client.users.delete(user['uuid']), users
+        )
+
+        errors = []
+        for user, future in zip(users, futures):
+            error = future.exception()
+            if error:
+                logger.error(
+                    'Failed to delete wazo-auth user %s: %s', user['uuid'], error
+                )
+                errors.append(error)
+
+        if errors:
+            raise errors[0]
 
     def delete(self, uuid):
         self._auth_client.users.delete(uuid)
@@ -44,25 +88,35 @@ class AuthClientProxy:
     def get(self, uuid):
         self._auth_client.users.get(uuid)
 
+    def _map(self, function, items):
+        with ThreadPoolExecutor(
+            max_workers=max(min(self._concurrency, len(items)), 1),
+            thread_name_prefix='user-import-auth',
+        ) as executor:
+            return [executor.submit(function, item) for item in items]
+
     @classmethod
-    def from_config(cls, *args, **kwargs):
+    def from_config(cls, *args, concurrency=1, **kwargs):
         client = AuthClient(*args, **kwargs)
         # 30 minutes should be enought to import all users
         token = client.token.new(expiration=30 * 30)['token']
         client.set_token(token)
-        return cls(client)
+        return cls(client, concurrency=concurrency)
 
 
 def get_auth_client():
     client = g.get('auth_client_user_import')
     if not client:
-        client = g.auth_client_user_import = AuthClientProxy.from_config(**auth_config)
+        client = g.auth_client_user_import = AuthClientProxy.from_config(
+            concurrency=auth_concurrency, **auth_config
+        )
     return client
 
 
-def set_auth_client_config(config):
-    global auth_config
+def set_auth_client_config(config, concurrency=1):
+    global auth_config, auth_concurrency
     auth_config = config
+    auth_concurrency = concurrency
 
 
 auth_client = Proxy(get_auth_client)
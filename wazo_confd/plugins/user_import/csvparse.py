@@ -1,7 +1,8 @@
-# Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import csv
+import io
 import time
 
 from collections import namedtuple
@@ -203,3 +204,9 @@ def parse():
     lines = request.data.decode(charset)
     lines = lines.split('\n')
     return CsvParser(lines)
+
+
+def parse_stream():
+    charset = request.mimetype_params.get('charset', 'utf-8')
+    lines = io.TextIOWrapper(request.stream, encoding=charset, newline='')
+    return CsvParser(lines)
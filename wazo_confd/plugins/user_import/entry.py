@@ -1,11 +1,15 @@
-# Copyright 2015-2024 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from __future__ import annotations
 
 from typing import TypedDict, TYPE_CHECKING
 
+from marshmallow import ValidationError
 from xivo_dao.helpers import errors
+from xivo_dao.helpers.exception import ServiceError
+
+from wazo_confd.helpers.validator import BaseExtensionRangeMixin
 
 from .constants import VALID_ENDPOINT_TYPES
 
@@ -130,12 +134,27 @@ class EntryCreator:
 
 
 class EntryAssociator:
-    def __init__(self, associators):
+    def __init__(self, associators, deferred=()):
         self.associators = associators
+        self.deferred = deferred
 
     def associate(self, entry):
-        for associator in self.associators.values():
-            associator.associate(entry)
+        for name, associator in self.associators.items():
+            if name not in self.deferred:
+                associator.associate(entry)
+
+    def associate_deferred(self, entries):
+        """Run the `deferred` associators once for all `entries`
+
+        Returns the first error of each failed entry by entry.
+        """
+        errors = {}
+        for name in self.deferred:
+            results = self.associators[name].associate_all(entries)
+            for entry, error in zip(entries, results):
+                if error and entry not in errors:
+                    errors[entry] = error
+        return errors
 
 
 class EntryFinder:
@@ -265,3 +284,178 @@ class EntryUpdater:
     def update_resources(self, entry):
         for resource, creator in self.creators.items():
             entry.update(resource, creator)
+
+
+class EntryValidator(BaseExtensionRangeMixin):
+    """Check rows as they would be imported, without writing
+
+    The existing contexts, call permissions, extensions and voicemails are
+    loaded once, and the SIP usernames of the checked rows. Each row is then
+    checked against them and against the resources created by the previous
+    rows.
+    """
+
+    def __init__(self, creators, import_dao):
+        self.creators = creators
+        self.import_dao = import_dao
+
+    def validate_rows(self, parser, tenant_uuid):
+        return self.check_rows(parser, self.load_index(tenant_uuid))
+
+    def load_index(self, tenant_uuid):
+        contexts = self.import_dao.find_contexts(tenant_uuid)
+        names = set(contexts)
+        return {
+            'contexts': contexts,
+            'call_permissions': self.import_dao.find_call_permission_names(tenant_uuid),
+            'extensions': self.import_dao.find_extensions(names),
+            'voicemails': self.import_dao.find_voicemails(names),
+            'sip_usernames': {},
+            'rows': {},
+        }
+
+    def check_rows(self, parser, index):
+        """Check `parser` rows against `index`, which they are added to"""
+        rows = []
+        for row in parser:
+            try:
+                rows.append((row, row.parse()))
+            except (ServiceError, ValidationError) as e:
+                rows.append((row, e))
+        self._load_sip_usernames(
+            index, [entry for _, entry in rows if isinstance(entry, dict)]
+        )
+
+        validated = 0
+        errors = []
+        for row, entry in rows:
+            if isinstance(entry, dict):
+                row_errors = self.validate_entry(entry, index, row.position)
+            else:
+                row_errors = [entry]
+            if row_errors:
+                errors.extend(row.format_error(error) for error in row_errors)
+            else:
+                validated += 1
+
+        return validated, errors
+
+    def _load_sip_usernames(self, index, entry_dicts):
+        usernames = {entry_dict['sip'].get('username') for entry_dict in entry_dicts}
+        usernames -= {None, *index['sip_usernames']}
+        if usernames:
+            index['sip_usernames'].update(self.import_dao.find_sip_usernames(usernames))
+
+    def validate_entry(self, entry_dict, index, position):
+        row_errors = []
+        for check in (
+            self.check_user,
+            self.check_context,
+            self.check_voicemail,
+            self.check_call_permissions,
+            self.check_extension,
+            self.check_incall,
+            self.check_endpoint,
+        ):
+            try:
+                check(entry_dict, index, position)
+            except (ServiceError, ValidationError) as e:
+                row_errors.append(e)
+        return row_errors
+
+    def check_user(self, entry_dict, index, position):
+        if entry_dict['user']:
+            self.creators['user'].schema_nullable(handle_error=False).load(
+                entry_dict['user']
+            )
+        self.creators['wazo_user'].schema(handle_error=False).load(
+            entry_dict['wazo_user']
+        )
+
+    def check_context(self, entry_dict, index, position):
+        name = entry_dict['context'].get('context')
+        if name and name not in index['contexts']:
+            raise errors.not_found('Context', name=name)
+
+    def check_voicemail(self, entry_dict, index, position):
+        fields = entry_dict['voicemail']
+        key = (fields.get('number'), fields.get('context'))
+        if not any(key) or key in index['voicemails']:
+            return
+
+        self.creators['voicemail'].schema(handle_error=False).load(fields)
+        if key[1] not in index['contexts']:
+            raise errors.not_found('Context', name=key[1])
+        index['voicemails'].add(key)
+
+    def check_call_permissions(self, entry_dict, index, position):
+        for name in entry_dict['call_permissions'].get('names') or []:
+            if name not in index['call_permissions']:
+                raise errors.not_found('CallPermission', name=name)
+
+    def check_extension(self, entry_dict, index, position):
+        fields = entry_dict['extension']
+        exten, context = fields.get('exten'), fields.get('context')
+        if not (exten and context):
+            return
+
+        self._check_new_resource(
+            index, position, 'Extension', exten=exten, context=context
+        )
+        existing = index['extensions'].get((exten, context))
+        if existing and existing != ('user', '0'):
+            raise errors.resource_exists('Extension', exten=exten, context=context)
+
+        line = entry_dict['line']
+        if line.get('context') and line.get('endpoint') in VALID_ENDPOINT_TYPES:
+            self._check_user_range(index, exten, context)
+        if existing:
+            return
+
+        if fields.get('firstname'):
+            line_protocol = fields.get('line_protocol')
+            if not line_protocol:
+                raise errors.missing('line_protocol')
+            if line_protocol not in VALID_ENDPOINT_TYPES:
+                raise errors.invalid_choice('line_protocol', VALID_ENDPOINT_TYPES)
+        self.creators['extension'].schema(handle_error=False).load(fields)
+
+    def check_incall(self, entry_dict, index, position):
+        fields = entry_dict['extension_incall']
+        exten, context = fields.get('exten'), fields.get('context')
+        if not (exten and context):
+            return
+
+        if context not in index['contexts']:
+            raise errors.not_found('Context', name=context)
+        self._check_new_resource(
+            index, position, 'Extension', exten=exten, context=context
+        )
+        existing = index['extensions'].get((exten, context))
+        if existing and existing[0] != 'incall' and existing != ('user', '0'):
+            raise errors.resource_exists('Extension', exten=exten, context=context)
+
+    def check_endpoint(self, entry_dict, index, position):
+        endpoint = entry_dict['line'].get('endpoint')
+        username = entry_dict['sip'].get('username')
+        if endpoint not in ('sip', 'webrtc') or not username:
+            return
+
+        self._check_new_resource(index, position, 'EndpointSIP', username=username)
+        if index['sip_usernames'].get(username):
+            raise errors.resource_exists('EndpointSIP', username=username)
+
+    def _check_user_range(self, index, exten, name):
+        context = index['contexts'].get(name)
+        if not context or self._is_pattern(exten):
+            return
+        if context.type != 'internal':
+            raise errors.unhandled_context_type(context.type, name, context=name)
+        if not self._exten_in_range(exten, context.user_ranges):
+            raise errors.outside_context_range(exten, name)
+
+    def _check_new_resource(self, index, position, resource, **ids):
+        key = (resource, tuple(sorted(ids.items())))
+        first_position = index['rows'].setdefault(key, position)
+        if first_position != position:
+            raise errors.resource_exists(resource, row_number=first_position, **ids)
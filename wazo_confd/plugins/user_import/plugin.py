@@ -1,9 +1,10 @@
-# Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from collections import OrderedDict
 
 from xivo_dao.resources.call_permission import dao as call_permission_dao
+from xivo_dao.resources.context import dao as context_dao
 from xivo_dao.resources.endpoint_sccp import dao as sccp_dao
 from xivo_dao.resources.endpoint_sip import dao as sip_dao
 from xivo_dao.resources.extension import dao as extension_dao
@@ -18,10 +19,11 @@ from xivo_dao.resources.voicemail import dao as voicemail_dao
 from wazo_provd_client import Client as ProvdClient
 
 from wazo_confd.database import user_export as user_export_dao
+from wazo_confd.database import user_import as user_import_dao
+from wazo_confd.helpers.memoize import RequestMemoizedDAO
 from wazo_confd.plugins.call_permission.service import (
     build_service as build_call_permission_service,
 )
-from wazo_confd.plugins.context.service import build_service as build_context_service
 from wazo_confd.plugins.endpoint_sccp.service import build_service as build_sccp_service
 from wazo_confd.plugins.endpoint_sip.service import (
     build_endpoint_service as build_sip_service,
@@ -78,7 +80,13 @@ from .creators import (
     WazoUserCreator,
     WebRTCCreator,
 )
-from .entry import EntryCreator, EntryAssociator, EntryFinder, EntryUpdater
+from .entry import (
+    EntryAssociator,
+    EntryCreator,
+    EntryFinder,
+    EntryUpdater,
+    EntryValidator,
+)
 from .resource import UserImportResource, UserExportResource
 from .service import ImportService, ExportService
 from .wazo_user_service import build_service as build_wazo_user_service
@@ -91,7 +99,9 @@ class Plugin:
         config = dependencies['config']
         pjsip_doc = dependencies['pjsip_doc']
         token_changed_subscribe = dependencies['token_changed_subscribe']
-        set_auth_client_config(config['auth'])
+        set_auth_client_config(
+            config['auth'], concurrency=config['user_import']['auth_concurrency']
+        )
 
         provd_client = ProvdClient(**config['provd'])
         token_changed_subscribe(provd_client.set_token)
@@ -113,12 +123,15 @@ class Plugin:
         extension_service = build_extension_service(provd_client)
         user_line_service = build_ul_service()
         line_extension_service = build_line_extension_service()
-        call_permission_service = build_call_permission_service()
         user_call_permission_service = build_user_call_permission_service()
         incall_service = build_incall_service()
         incall_extension_service = build_incall_extension_service()
-        context_service = build_context_service()
-        tenant_service = build_tenant_service()
+        # Lookups repeated by every row are made once per request
+        call_permission_service = RequestMemoizedDAO(
+            build_call_permission_service(), 'get_by'
+        )
+        context_service = RequestMemoizedDAO(context_dao, 'get_by')
+        tenant_service = RequestMemoizedDAO(build_tenant_service(), 'get')
 
         creators = {
             'user': UserCreator(user_service),
@@ -156,7 +169,8 @@ class Plugin:
             ]
         )
 
-        entry_associator = EntryAssociator(associators)
+        # wazo-auth users are created concurrently once all rows are imported
+        entry_associator = EntryAssociator(associators, deferred=('wazo_user',))
 
         entry_finder = EntryFinder(
             user_dao,
@@ -175,7 +189,11 @@ class Plugin:
 
         entry_updater = EntryUpdater(creators, associators, entry_finder)
 
-        import_service = ImportService(entry_creator, entry_associator, entry_updater)
+        entry_validator = EntryValidator(creators, user_import_dao)
+
+        import_service = ImportService(
+            entry_creator, entry_associator, entry_updater, entry_validator
+        )
         api.add_resource(
             UserImportResource, '/users/import', resource_class_args=(import_service,)
         )
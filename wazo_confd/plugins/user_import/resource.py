@@ -1,25 +1,44 @@
-# Copyright 2015-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from flask import request
+from marshmallow import fields
+from marshmallow.validate import Range
 from xivo.tenant_flask_helpers import Tenant
 from xivo_dao.helpers.db_manager import Session
 
-from wazo_confd import sysconfd, bus
+from wazo_confd import bus, device_updates, sysconfd
 from wazo_confd.auth import required_acl
+from wazo_confd.helpers.jobs import asynchronous
+from wazo_confd.helpers.mallow import BaseSchema
 from wazo_confd.helpers.restful import ConfdResource
+from wazo_confd.helpers.tenant import known_tenants
+from wazo_confd.http_server import complete_chunk
 from wazo_confd.representations.csv_ import output_csv
 
 from . import csvparse
 from .auth_client import auth_client
 
 
+class UserImportSchema(BaseSchema):
+    chunk_size = fields.Integer(validate=Range(min=1), load_default=None)
+    resume_after = fields.Integer(validate=Range(min=0), load_default=0)
+    dry_run = fields.Boolean(load_default=False)
+
+
 class UserImportResource(ConfdResource):
     def __init__(self, service):
         self.service = service
 
     @required_acl('confd.users.import.create')
+    @asynchronous
     def post(self):
         tenant = Tenant.autodetect()
+        params = UserImportSchema().load(request.args)
+        if params.pop('dry_run'):
+            return self.post_dry_run(tenant)
+        if params['chunk_size']:
+            return self.post_chunks(tenant, **params)
 
         parser = csvparse.parse()
         entries, errors = self.service.import_rows(parser, tenant.uuid)
@@ -34,6 +53,30 @@ class UserImportResource(ConfdResource):
 
         return response, status_code
 
+    def post_chunks(self, tenant, chunk_size, resume_after):
+        parser = csvparse.parse_stream()
+        chunks, checkpoint = self.service.import_chunks(
+            parser,
+            tenant.uuid,
+            chunk_size,
+            commit=self.commit,
+            rollback=self.rollback,
+            resume_after=resume_after,
+        )
+
+        response = {'chunks': chunks, 'checkpoint': checkpoint}
+        if chunks and 'errors' in chunks[-1]:
+            return response, 400
+        return response, 201
+
+    def post_dry_run(self, tenant):
+        parser = csvparse.parse_stream()
+        validated, errors = self.service.validate_rows(parser, tenant.uuid)
+
+        if errors:
+            return {'errors': errors}, 400
+        return {'validated': validated}, 200
+
     @required_acl('confd.users.import.update')
     def put_disabled(self):
         parser = csvparse.parse()
@@ -50,10 +93,16 @@ class UserImportResource(ConfdResource):
 
         return response, status_code
 
+    def commit(self):
+        complete_chunk()
+        auth_client.commit()
+
     def rollback(self):
         Session.rollback()
+        known_tenants.rollback()
         sysconfd.rollback()
         bus.rollback()
+        device_updates.rollback()
         auth_client.rollback()
 
 
@@ -1,41 +1,109 @@
-# Copyright 2015-2022 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2015-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
 
 from marshmallow import ValidationError
-from xivo_dao import tenant_dao
 from xivo_dao.helpers.exception import ServiceError
 
+from wazo_confd.helpers.jobs import report_progress
+from wazo_confd.helpers.streaming import chunked
+from wazo_confd.helpers.tenant import known_tenants
+
 logger = logging.getLogger(__name__)
 
 
 class ImportService:
-    def __init__(self, entry_creator, entry_associator, entry_updater):
+    def __init__(
+        self, entry_creator, entry_associator, entry_updater, entry_validator=None
+    ):
         self.entry_creator = entry_creator
         self.entry_associator = entry_associator
         self.entry_updater = entry_updater
+        self.entry_validator = entry_validator
 
     def import_rows(self, parser, tenant_uuid):
-        tenant_dao.find_or_create_tenant(tenant_uuid)
-        created = []
+        known_tenants.find_or_create(tenant_uuid)
+        rows = []
         errors = []
 
         for row in parser:
             try:
                 entry = self.create_entry(row, tenant_uuid)
-                created.append(entry)
+                rows.append((row, entry))
             except (ServiceError, ValidationError) as e:
                 logger.warn("Error importing CSV row %s: %s", row.position, e)
                 errors.append(row.format_error(e))
+            report_progress(rows=row.position, errors=len(errors))
+
+        created = []
+        deferred_errors = self.entry_associator.associate_deferred(
+            [entry for _, entry in rows]
+        )
+        for row, entry in rows:
+            error = deferred_errors.get(entry)
+            if error:
+                logger.warning("Error importing CSV row %s: %s", row.position, error)
+                errors.append(row.format_error(error))
+            else:
+                created.append(entry)
+
+        if deferred_errors:
+            errors.sort(key=lambda error: error['details']['row_number'])
+            report_progress(errors=len(errors))
 
         return created, errors
 
+    def import_chunks(
+        self, parser, tenant_uuid, chunk_size, commit, rollback, resume_after=0
+    ):
+        """Import the rows after `resume_after` by chunks of `chunk_size` rows
+
+        Each chunk is committed with `commit`. The first chunk with errors is
+        rolled back with `rollback` and stops the import. A chunk whose commit
+        fails is also rolled back before the error is raised. The checkpoint is
+        the number of the last committed row, after which the import can resume.
+
+        The existing resources are loaded once by the entry validator. Each
+        chunk is checked against them before any of its rows is created.
+        """
+        chunks = []
+        checkpoint = resume_after
+        index = None
+        if self.entry_validator:
+            index = self.entry_validator.load_index(tenant_uuid)
+        rows = (row for row in parser if row.position > resume_after)
+        for chunk in chunked(rows, chunk_size):
+            errors = None
+            if index is not None:
+                _, errors = self.entry_validator.check_rows(chunk, index)
+            if not errors:
+                created, errors = self.import_rows(chunk, tenant_uuid)
+            summary = {'first_row': chunk[0].position, 'last_row': chunk[-1].position}
+            if errors:
+                rollback()
+                chunks.append(dict(summary, created=0, errors=errors))
+                break
+
+            try:
+                commit()
+            except Exception:
+                rollback()
+                raise
+            checkpoint = chunk[-1].position
+            chunks.append(dict(summary, created=len(created)))
+            report_progress(checkpoint=checkpoint)
+
+        return chunks, checkpoint
+
     def create_entry(self, row, tenant_uuid):
         entry = self.entry_creator.create(row, tenant_uuid=tenant_uuid)
         self.entry_associator.associate(entry)
         return entry
 
+    def validate_rows(self, parser, tenant_uuid):
+        return self.entry_validator.validate_rows(parser, tenant_uuid)
+
     def update_rows(self, parser, tenant_uuid):
         updated = []
         errors = []
@@ -56,29 +124,57 @@ class ImportService:
 
 
 class ExportService:
-    def __init__(self, user_export_dao, auth_client):
+    """Export the users of a tenant as they are read from the database
+
+    Users are fetched from the database by chunks of `chunk_size`. The
+    wazo-auth usernames are fetched by pages of `auth_page_size` users before
+    the export starts, so that a wazo-auth error fails the whole request.
+    """
+
+    def __init__(
+        self, user_export_dao, auth_client, chunk_size=1000, auth_page_size=1000
+    ):
         self._user_export_dao = user_export_dao
         self._auth_client = auth_client
+        self._chunk_size = chunk_size
+        self._auth_page_size = auth_page_size
 
     def export(self, tenant_uuid):
+        usernames = self._find_usernames(tenant_uuid)
         csv_header, users = self._user_export_dao.export_query(tenant_uuid)
-        users = list(self._format_users(csv_header, users))
+        users = self._add_usernames(
+            usernames,
+            self._format_users(csv_header, users.yield_per(self._chunk_size)),
+        )
+        csv_header = csv_header + ('username',)
 
-        wazo_users = self._auth_client.users.list(tenant_uuid=tenant_uuid)['items']
-        wazo_users = {user['uuid']: user for user in wazo_users}
+        return csv_header, users
+
+    def _add_usernames(self, usernames, users):
         for user in users:
-            if user['uuid'] in wazo_users:
-                wazo_user = wazo_users[user['uuid']]
-                user['username'] = wazo_user['username']
+            if user['uuid'] in usernames:
+                user['username'] = usernames[user['uuid']]
             else:
                 logger.warning(
                     "User '%s' has no wazo-auth user associated. Please create one with same uuid",
                     user['uuid'],
                 )
-
-        csv_header = csv_header + ('username',)
-
-        return csv_header, users
+            yield user
+
+    def _find_usernames(self, tenant_uuid):
+        usernames = {}
+        offset = 0
+        while True:
+            wazo_users = self._auth_client.users.list(
+                tenant_uuid=tenant_uuid,
+                limit=self._auth_page_size,
+                offset=offset,
+                order='uuid',
+            )['items']
+            usernames.update((user['uuid'], user['username']) for user in wazo_users)
+            if len(wazo_users) < self._auth_page_size:
+                return usernames
+            offset += self._auth_page_size
 
     def _format_users(self, header, users):
         for user in users:
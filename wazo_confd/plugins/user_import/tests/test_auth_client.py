@@ -1,12 +1,15 @@
-# Copyright 2019-2020 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2019-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from unittest import TestCase
-from unittest.mock import Mock, sentinel as s
+from unittest.mock import Mock, call, sentinel as s
 from requests import HTTPError
 from hamcrest import (
     assert_that,
     calling,
+    contains_exactly,
+    contains_inanyorder,
+    instance_of,
     raises,
 )
 
@@ -18,7 +21,7 @@ from ..auth_client import AuthClientProxy as Client
 class TestRollback(TestCase):
     def setUp(self):
         self.auth_client = Mock()
-        self.client = Client(self.auth_client)
+        self.client = Client(self.auth_client, concurrency=4)
 
     def test_that_an_error_in_auth_will_raise_a_service_error(self):
         self.auth_client.users.new.side_effect = HTTPError()
@@ -36,3 +39,60 @@ class TestRollback(TestCase):
         self.client.rollback()
 
         self.auth_client.users.delete.assert_called_once_with(s.user_uuid)
+
+    def test_that_rollback_after_commit_keeps_committed_users(self):
+        self.auth_client.users.new.return_value = {'uuid': s.user_uuid}
+
+        self.client.new_user(uuid=s.user_uuid)
+        self.client.commit()
+
+        self.client.rollback()
+
+        self.auth_client.users.delete.assert_not_called()
+
+    def test_that_new_users_returns_users_and_errors_in_order(self):
+        def new(uuid):
+            if uuid == s.error_uuid:
+                raise HTTPError()
+            return {'uuid': uuid}
+
+        self.auth_client.users.new.side_effect = new
+
+        results = self.client.new_users(
+            [{'uuid': s.user1_uuid}, {'uuid': s.error_uuid}, {'uuid': s.user2_uuid}]
+        )
+
+        assert_that(
+            results,
+            contains_exactly(
+                {'uuid': s.user1_uuid},
+                instance_of(ServiceError),
+                {'uuid': s.user2_uuid},
+            ),
+        )
+
+        self.client.rollback()
+
+        assert_that(
+            self.auth_client.users.delete.call_args_list,
+            contains_inanyorder(call(s.user1_uuid), call(s.user2_uuid)),
+        )
+
+    def test_that_an_unexpected_error_keeps_created_users_for_rollback(self):
+        def new(uuid):
+            if uuid == s.error_uuid:
+                raise ConnectionError()
+            return {'uuid': uuid}
+
+        self.auth_client.users.new.side_effect = new
+
+        assert_that(
+            calling(self.client.new_users).with_args(
+                [{'uuid': s.error_uuid}, {'uuid': s.user_uuid}]
+            ),
+            raises(ConnectionError),
+        )
+
+        self.client.rollback()
+
+        self.auth_client.users.delete.assert_called_once_with(s.user_uuid)
@@ -0,0 +1,109 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    contains_string,
+    equal_to,
+    has_entries,
+)
+
+from ..csvparse import CsvParser
+from ..entry import EntryValidator
+
+HEADER = 'firstname,context,exten,line_protocol,sip_username,call_permissions'
+
+
+class TestEntryValidator(TestCase):
+    def setUp(self):
+        self.import_dao = Mock()
+        user_range = Mock()
+        user_range.in_range.side_effect = lambda exten: '1000' <= exten <= '1999'
+        self.import_dao.find_contexts.return_value = {
+            'default': Mock(type='internal', user_ranges=[user_range])
+        }
+        self.import_dao.find_call_permission_names.return_value = {'perm'}
+        self.import_dao.find_extensions.return_value = {
+            ('1000', 'default'): ('user', '12'),
+            ('1001', 'default'): ('user', '0'),
+        }
+        self.import_dao.find_voicemails.return_value = set()
+        self.import_dao.find_sip_usernames.side_effect = lambda usernames: {
+            username: True for username in usernames if username == 'used'
+        }
+        self.creators = {
+            'user': Mock(),
+            'wazo_user': Mock(),
+            'voicemail': Mock(),
+            'extension': Mock(),
+        }
+        self.validator = EntryValidator(self.creators, self.import_dao)
+
+    def validate(self, *rows):
+        parser = CsvParser([HEADER] + list(rows))
+        return self.validator.validate_rows(parser, 'tenant-uuid')
+
+    def test_given_valid_rows_then_validated(self):
+        validated, errors = self.validate(
+            'A,default,1001,sip,a,perm',
+            'B,default,1002,sip,b,',
+        )
+
+        assert_that(validated, equal_to(2))
+        assert_that(errors, equal_to([]))
+        self.creators['extension'].schema.return_value.load.assert_called_once()
+        self.import_dao.find_extensions.assert_called_once_with({'default'})
+        self.import_dao.find_sip_usernames.assert_called_once_with({'a', 'b'})
+
+    def test_given_existing_resources_then_all_conflicts_reported(self):
+        validated, errors = self.validate(
+            'A,unknown,,,,',
+            'B,default,1000,sip,used,unknown',
+        )
+
+        assert_that(validated, equal_to(0))
+        assert_that(
+            [error['message'] for error in errors],
+            contains_exactly(
+                contains_string('Context was not found'),
+                contains_string('CallPermission was not found'),
+                contains_string('Extension already exists'),
+                contains_string('EndpointSIP already exists'),
+            ),
+        )
+
+    def test_given_duplicates_in_file_then_later_rows_reported(self):
+        validated, errors = self.validate(
+            'A,default,1002,sip,a,',
+            'B,default,1002,sip,a,',
+        )
+
+        assert_that(validated, equal_to(1))
+        assert_that(
+            errors,
+            contains_exactly(
+                has_entries(details=has_entries(row_number=2)),
+                has_entries(details=has_entries(row_number=2)),
+            ),
+        )
+
+    def test_given_extension_outside_user_range_then_reported(self):
+        validated, errors = self.validate(
+            'A,default,2000,sip,a,',
+            ',default,2001,,,',
+        )
+
+        assert_that(validated, equal_to(1))
+        assert_that(
+            errors,
+            contains_exactly(
+                has_entries(
+                    message=contains_string('range'),
+                    details=has_entries(row_number=1),
+                )
+            ),
+        )
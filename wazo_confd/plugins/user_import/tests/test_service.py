@@ -0,0 +1,171 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from flask import Flask
+from hamcrest import (
+    assert_that,
+    calling,
+    contains_exactly,
+    equal_to,
+    has_entries,
+    raises,
+)
+from requests import HTTPError
+from xivo_dao.helpers.exception import ServiceError
+
+from ..csvparse import parse_stream
+from ..service import ExportService, ImportService
+
+CSV = 'firstname,lastname\nA,One\nB,Two\nC,Three\n'
+
+
+@patch('wazo_confd.plugins.user_import.service.known_tenants', Mock())
+class TestImportChunks(TestCase):
+    def setUp(self):
+        self.entry_creator = Mock()
+        self.entry_associator = Mock()
+        self.entry_associator.associate_deferred.return_value = {}
+        self.service = ImportService(self.entry_creator, self.entry_associator, Mock())
+        self.commit = Mock()
+        self.rollback = Mock()
+        self.app = Flask(__name__)
+
+    def import_chunks(self, csv, **kwargs):
+        with self.app.test_request_context(
+            method='POST', data=csv, content_type='text/csv; charset=utf-8'
+        ):
+            return self.service.import_chunks(
+                parse_stream(),
+                'tenant-uuid',
+                commit=self.commit,
+                rollback=self.rollback,
+                **kwargs,
+            )
+
+    def test_given_rows_when_import_chunks_then_each_chunk_committed(self):
+        chunks, checkpoint = self.import_chunks(CSV, chunk_size=2)
+
+        assert_that(
+            chunks,
+            contains_exactly(
+                {'first_row': 1, 'last_row': 2, 'created': 2},
+                {'first_row': 3, 'last_row': 3, 'created': 1},
+            ),
+        )
+        assert_that(checkpoint, equal_to(3))
+        assert_that(self.commit.call_count, equal_to(2))
+        self.rollback.assert_not_called()
+
+    def test_given_error_when_import_chunks_then_chunk_rolled_back(self):
+        def create(row, tenant_uuid):
+            if row.position == 3:
+                raise ServiceError('error')
+
+        self.entry_creator.create.side_effect = create
+
+        chunks, checkpoint = self.import_chunks(CSV, chunk_size=2)
+
+        assert_that(chunks[-1], has_entries(first_row=3, created=0))
+        assert_that(checkpoint, equal_to(2))
+        self.commit.assert_called_once_with()
+        self.rollback.assert_called_once_with()
+
+    def test_given_commit_error_when_import_chunks_then_chunk_rolled_back(self):
+        self.commit.side_effect = [None, RuntimeError('commit failed')]
+
+        assert_that(
+            calling(self.import_chunks).with_args(CSV, chunk_size=2),
+            raises(RuntimeError),
+        )
+        self.rollback.assert_called_once_with()
+
+    def test_given_deferred_error_when_import_chunks_then_row_reported(self):
+        def associate_deferred(entries):
+            return {entry: ServiceError('auth') for entry in entries[1:]}
+
+        self.entry_creator.create.side_effect = lambda row, tenant_uuid: row.position
+        self.entry_associator.associate_deferred.side_effect = associate_deferred
+
+        chunks, checkpoint = self.import_chunks(CSV, chunk_size=3)
+
+        assert_that(
+            chunks[0]['errors'],
+            contains_exactly(
+                has_entries(message='auth', details=has_entries(row_number=2)),
+                has_entries(message='auth', details=has_entries(row_number=3)),
+            ),
+        )
+        assert_that(checkpoint, equal_to(0))
+        self.rollback.assert_called_once_with()
+
+    def test_given_conflict_when_import_chunks_then_chunk_not_created(self):
+        entry_validator = Mock()
+        entry_validator.check_rows.side_effect = [
+            (2, []),
+            (0, [{'message': 'conflict', 'details': {'row_number': 3}}]),
+        ]
+        self.service.entry_validator = entry_validator
+
+        chunks, checkpoint = self.import_chunks(CSV, chunk_size=2)
+
+        assert_that(chunks[-1], has_entries(first_row=3, created=0))
+        assert_that(checkpoint, equal_to(2))
+        assert_that(self.entry_creator.create.call_count, equal_to(2))
+        entry_validator.load_index.assert_called_once_with('tenant-uuid')
+        self.rollback.assert_called_once_with()
+
+    def test_given_checkpoint_when_import_chunks_then_resumed(self):
+        chunks, checkpoint = self.import_chunks(CSV, chunk_size=2, resume_after=2)
+
+        assert_that(
+            chunks, contains_exactly({'first_row': 3, 'last_row': 3, 'created': 1})
+        )
+        assert_that(self.entry_creator.create.call_count, equal_to(1))
+        assert_that(checkpoint, equal_to(3))
+
+
+class TestExport(TestCase):
+    def setUp(self):
+        self.user_export_dao = Mock()
+        self.auth_client = Mock()
+        self.service = ExportService(
+            self.user_export_dao, self.auth_client, chunk_size=10, auth_page_size=2
+        )
+
+    def test_given_users_when_export_then_usernames_fetched_by_pages(self):
+        query = self.user_export_dao.export_query.return_value = ('uuid',), Mock()
+        query[1].yield_per.return_value = iter([('u1',), ('u2',), ('u3',)])
+        self.auth_client.users.list.side_effect = [
+            {
+                'items': [
+                    {'uuid': 'u1', 'username': 'one'},
+                    {'uuid': 'u2', 'username': 'two'},
+                ]
+            },
+            {'items': [{'uuid': 'u3', 'username': 'three'}]},
+        ]
+
+        header, users = self.service.export('tenant-uuid')
+
+        assert_that(header, equal_to(('uuid', 'username')))
+        assert_that(self.auth_client.users.list.call_count, equal_to(2))
+        assert_that(
+            list(users),
+            contains_exactly(
+                {'uuid': 'u1', 'username': 'one'},
+                {'uuid': 'u2', 'username': 'two'},
+                {'uuid': 'u3', 'username': 'three'},
+            ),
+        )
+        query[1].yield_per.assert_called_once_with(10)
+
+    def test_given_auth_error_when_export_then_raised_before_streaming(self):
+        self.auth_client.users.list.side_effect = HTTPError()
+
+        assert_that(
+            calling(self.service.export).with_args('tenant-uuid'), raises(HTTPError)
+        )
+        self.user_export_dao.export_query.assert_not_called()
@@ -1,4 +1,4 @@
-# Copyright 2018-2022 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2018-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from .auth_client import auth_client
@@ -9,7 +9,13 @@ class WazoUserService:
         self._auth_client = auth_client
 
     def create(self, user):
-        return self._auth_client.new_user(
+        return self._auth_client.new_user(**self._build_user(user))
+
+    def create_all(self, users):
+        return self._auth_client.new_users([self._build_user(user) for user in users])
+
+    def _build_user(self, user):
+        return dict(
             uuid=user.get('uuid'),
             firstname=user.get('firstname'),
             lastname=user.get('lastname'),
@@ -1,4 +1,4 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from xivo_dao.helpers import errors
@@ -6,6 +6,7 @@ from xivo_dao.resources.voicemail import dao as voicemail_dao
 from xivo_dao.resources.context import dao as context_dao
 
 from wazo_confd.database import static_voicemail
+from wazo_confd.helpers.memoize import request_memoized
 from wazo_confd.helpers.validator import (
     GetResource,
     MemberOfSequence,
@@ -51,7 +52,9 @@ class AssociatedToUser(Validator):
 def build_validator():
     return ValidationGroup(
         common=[
-            GetResource('context', context_dao.get_by_name, 'Context'),
+            GetResource(
+                'context', request_memoized(context_dao.get_by_name), 'Context'
+            ),
             Optional(
                 'timezone',
                 MemberOfSequence(
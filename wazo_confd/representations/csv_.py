@@ -1,4 +1,4 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import csv
@@ -6,6 +6,11 @@ import csv
 from io import StringIO
 from flask import json, make_response
 
+from wazo_confd.http_server import stream_response
+
+CSV_MIMETYPE = 'text/csv; charset=utf-8'
+STREAM_BUFFER_SIZE = 64 * 1024
+
 
 def output_csv(data, code, http_headers=None):
     # A 401 might happen when trying to find the tenant if the specified tenant is not authorized
@@ -15,6 +20,14 @@ def output_csv(data, code, http_headers=None):
     csv_headers = data['headers']
     csv_entries = data['content']
 
+    if not isinstance(csv_entries, (list, tuple)):
+        response = stream_response(
+            generate_csv(csv_headers, csv_entries), mimetype=CSV_MIMETYPE
+        )
+        response.status_code = code
+        response.headers.extend(http_headers or {})
+        return response
+
     csv_text = StringIO()
     writer = csv.DictWriter(csv_text, csv_headers)
     writer.writeheader()
@@ -25,3 +38,26 @@ def output_csv(data, code, http_headers=None):
     response = make_response(csv_text.getvalue(), code)
     response.headers.extend(http_headers or {})
     return response
+
+
+def generate_csv(headers, entries):
+    """Generate the CSV text of `entries`, the header first
+
+    Rows are sent by blocks of about `STREAM_BUFFER_SIZE` characters.
+    """
+    csv_text = StringIO()
+    writer = csv.DictWriter(csv_text, headers)
+    writer.writeheader()
+    yield csv_text.getvalue()
+
+    csv_text.seek(0)
+    csv_text.truncate()
+    for entry in entries:
+        writer.writerow(entry)
+        if csv_text.tell() >= STREAM_BUFFER_SIZE:
+            yield csv_text.getvalue()
+            csv_text.seek(0)
+            csv_text.truncate()
+
+    if csv_text.tell():
+        yield csv_text.getvalue()
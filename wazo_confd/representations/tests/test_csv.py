@@ -1,11 +1,13 @@
-# Copyright 2016-2019 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2016-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from unittest import TestCase
+from unittest.mock import patch
 
-from hamcrest import assert_that, equal_to, has_entry
+from flask import Flask
+from hamcrest import assert_that, contains_exactly, equal_to, has_entry
 
-from ..csv_ import output_csv
+from ..csv_ import generate_csv, output_csv
 
 SOME_STATUS_CODE = 200
 SOME_INPUT = {'headers': [], 'content': []}
@@ -44,3 +46,32 @@ class TestCSVRepresentation(TestCase):
 
         assert_that(result.status_code, equal_to(200))
         assert_that(result.headers, has_entry('my-header', 'my-value'))
+
+    @patch('wazo_confd.http_server.complete_request')
+    def test_csv_generator_streamed(self, complete_request):
+        body = ({'a': str(i)} for i in range(2))
+
+        with Flask(__name__).test_request_context():
+            result = output_csv({'headers': ['a'], 'content': body}, 200)
+
+            assert_that(result.is_streamed, equal_to(True))
+            assert_that(result.get_data(), equal_to(b'a\r\n0\r\n1\r\n'))
+        complete_request.assert_called_once_with()
+
+
+class TestGenerateCSV(TestCase):
+    def test_header_generated_before_entries(self):
+        def entries():
+            raise AssertionError('entries read before the header')
+            yield
+
+        assert_that(next(generate_csv(['a'], entries())), equal_to('a\r\n'))
+
+    @patch('wazo_confd.representations.csv_.STREAM_BUFFER_SIZE', 6)
+    def test_entries_generated_by_blocks(self):
+        entries = [{'a': 'xx'}, {'a': 'yy'}, {'a': 'zz'}]
+
+        assert_that(
+            list(generate_csv(['a'], entries)),
+            contains_exactly('a\r\n', 'xx\r\nyy\r\n', 'zz\r\n'),
+        )
@@ -0,0 +1,277 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import defaultdict
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+from hamcrest import (
+    assert_that,
+    calling,
+    contains_exactly,
+    equal_to,
+    has_entries,
+    raises,
+)
+from wazo_bus.resources.common.event import TenantEvent
+
+from .._bus import BusPublisher, FlushMixin, TransactionalProducer
+
+
+class Event:
+    def __init__(self, name, **payload):
+        self.name = name
+        self.payload = payload
+
+    def marshal(self):
+        return self.payload
+
+
+class EditedEvent(Event):
+    name = 'resource_edited'
+
+
+class ResourceEditedEvent(TenantEvent):
+    service = 'confd'
+    name = 'resource_edited'
+    routing_key_fmt = 'config.resources.{id}.edited'
+
+    def __init__(self, resource_id, tenant_uuid):
+        super().__init__({'id': resource_id}, tenant_uuid)
+
+
+class Publisher(FlushMixin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.publish = Mock()
+
+
+class TestFlushMixin(TestCase):
+    def test_flush_without_batch_then_events_published_in_order(self):
+        publisher = Publisher()
+        publisher.queue_event('event-1')
+        publisher.queue_event('event-2', extra_headers={'key': 'value'})
+
+        publisher.flush()
+
+        assert_that(
+            publisher.publish.call_args_list,
+            contains_exactly(
+                call('event-1', headers=None),
+                call('event-2', headers={'key': 'value'}),
+            ),
+        )
+
+    def test_flush_with_batch_then_events_published_by_batch(self):
+        publisher = Publisher(max_batch_size=2)
+        publisher.publish_batch = Mock()
+        for i in range(5):
+            publisher.queue_event(i)
+
+        publisher.flush()
+
+        assert_that(
+            publisher.publish_batch.call_args_list,
+            contains_exactly(
+                call([(0, None), (1, None)]),
+                call([(2, None), (3, None)]),
+                call([(4, None)]),
+            ),
+        )
+
+    def test_flush_when_batch_fails_then_remaining_events_kept(self):
+        publisher = Publisher(max_batch_size=2)
+        publisher.publish_batch = Mock(side_effect=[None, Exception('error')])
+        for i in range(4):
+            publisher.queue_event(i)
+
+        self.assertRaises(Exception, publisher.flush)
+        publisher.publish_batch = Mock()
+        publisher.flush()
+
+        publisher.publish_batch.assert_called_once_with([(2, None), (3, None)])
+
+    def test_provide_flush_status(self):
+        publisher = Publisher()
+        publisher.queue_event('event')
+        publisher.flush()
+        status = defaultdict(dict)
+
+        publisher.provide_flush_status(status)
+
+        assert_that(
+            status['bus_publisher']['latencies'],
+            has_entries(flush=has_entries(count=1)),
+        )
+
+
+class TestFlushMixinCompaction(TestCase):
+    def setUp(self):
+        self.publisher = Publisher()
+        self.publisher.register_compaction(EditedEvent, key='id')
+
+    def published_events(self):
+        return [args[0] for args, _ in self.publisher.publish.call_args_list]
+
+    def test_repeated_edited_events_then_last_one_published(self):
+        edited_1 = Event('resource_edited', id=1)
+        edited_2 = Event('resource_edited', id=2)
+        other = Event('other_edited', id=1)
+        edited_1_again = Event('resource_edited', id=1)
+        for event in (edited_1, edited_2, other, edited_1_again):
+            self.publisher.queue_event(event)
+
+        self.publisher.flush()
+
+        assert_that(
+            self.published_events(), contains_exactly(edited_2, other, edited_1_again)
+        )
+
+    def test_created_then_edited_then_created_and_last_edited_published(self):
+        created = Event('resource_created', id=1)
+        edited_1 = Event('resource_edited', id=1)
+        other_edited = Event('resource_edited', id=2)
+        edited_2 = Event('resource_edited', id=1)
+        for event in (created, edited_1, other_edited, edited_2):
+            self.publisher.queue_event(event)
+
+        self.publisher.flush()
+
+        assert_that(
+            self.published_events(), contains_exactly(created, other_edited, edited_2)
+        )
+
+    def test_events_with_extra_headers_not_compacted(self):
+        edited_1 = Event('resource_edited', id=1)
+        edited_2 = Event('resource_edited', id=1)
+        self.publisher.queue_event(edited_1, extra_headers={'key': 'value'})
+        self.publisher.queue_event(edited_2)
+
+        self.publisher.flush()
+
+        assert_that(self.published_events(), contains_exactly(edited_1, edited_2))
+
+    def test_unregistered_events_not_compacted(self):
+        other_1 = Event('other_edited', id=1)
+        other_2 = Event('other_edited', id=1)
+        self.publisher.queue_event(other_1)
+        self.publisher.queue_event(other_2)
+
+        self.publisher.flush()
+
+        assert_that(self.published_events(), contains_exactly(other_1, other_2))
+
+
+@patch('wazo_confd._bus.kombu')
+class TestTransactionalProducer(TestCase):
+    def setUp(self):
+        self.messages = [({'name': 'event-1'}, {'data': 1}, 'key-1'), ({}, {}, 'key-2')]
+
+    def connection(self, kombu):
+        pool = kombu.pools.connections.__getitem__.return_value
+        return pool.acquire.return_value.__enter__.return_value
+
+    def test_publish_then_messages_sent_in_one_transaction(self, kombu):
+        channel = self.connection(kombu).channel.return_value
+        producer = kombu.Producer.return_value
+
+        TransactionalProducer('amqp://', 'exchange').publish(self.messages)
+
+        channel.tx_select.assert_called_once_with()
+        assert_that(
+            producer.publish.call_args_list,
+            contains_exactly(
+                call(
+                    {'data': 1},
+                    headers={'name': 'event-1'},
+                    routing_key='key-1',
+                    serializer='json',
+                ),
+                call({}, headers={}, routing_key='key-2', serializer='json'),
+            ),
+        )
+        channel.tx_commit.assert_called_once_with()
+        channel.tx_rollback.assert_not_called()
+        channel.close.assert_called_once_with()
+
+    def test_publish_many_batches_then_pooled_connection_reused(self, kombu):
+        producer = TransactionalProducer('amqp://', 'exchange')
+
+        producer.publish(self.messages)
+        producer.publish(self.messages)
+
+        kombu.Connection.assert_called_once_with('amqp://')
+        pool = kombu.pools.connections.__getitem__.return_value
+        assert_that(pool.acquire.call_count, equal_to(2))
+
+    def test_publish_fails_then_transaction_rolled_back(self, kombu):
+        connection = self.connection(kombu)
+        channel = connection.channel.return_value
+        kombu.Producer.return_value.publish.side_effect = [None, OSError('error')]
+
+        assert_that(
+            calling(TransactionalProducer('amqp://', 'exchange').publish).with_args(
+                self.messages
+            ),
+            raises(OSError),
+        )
+
+        channel.tx_commit.assert_not_called()
+        channel.tx_rollback.assert_called_once_with()
+        channel.close.assert_called_once_with()
+        connection.collect.assert_called_once_with()
+
+
+class TestBusPublisherBuildMessage(TestCase):
+    def test_build_message_then_event_headers_and_payload(self):
+        publisher = BusPublisher.__new__(BusPublisher)
+        publisher._service_uuid = 'service-uuid'
+        event = Mock(headers={'name': 'resource_edited'}, routing_key='resource.1')
+        event.name = 'resource_edited'
+        event.marshal.return_value = {'id': 1}
+
+        headers, payload, routing_key = publisher.build_message(
+            event, {'extra': 'value'}
+        )
+
+        assert_that(
+            headers,
+            has_entries(
+                name='resource_edited', origin_uuid='service-uuid', extra='value'
+            ),
+        )
+        assert_that(
+            payload,
+            has_entries(
+                name='resource_edited', origin_uuid='service-uuid', data={'id': 1}
+            ),
+        )
+        assert_that(routing_key, equal_to('resource.1'))
+
+    @patch('kombu.Exchange.declare', Mock())
+    @patch('kombu.Producer.publish', autospec=True)
+    def test_build_message_then_message_sent_by_wazo_bus_publish(self, publish):
+        publisher = BusPublisher.from_config(
+            'service-uuid',
+            {
+                'username': 'guest',
+                'password': 'guest',
+                'host': 'localhost',
+                'port': 5672,
+                'exchange_name': 'wazo-headers',
+                'exchange_type': 'headers',
+            },
+        )
+        event = ResourceEditedEvent(42, 'tenant-uuid')
+
+        publisher.publish(event, headers={'extra': 'value'})
+        headers, payload, routing_key = publisher.build_message(
+            event, {'extra': 'value'}
+        )
+
+        (_, published_payload), published = publish.call_args
+        for message in (headers, payload, published['headers'], published_payload):
+            message.pop('timestamp')
+        assert_that(headers, equal_to(published['headers']))
+        assert_that(payload, equal_to(published_payload))
+        assert_that(routing_key, equal_to(published['routing_key']))
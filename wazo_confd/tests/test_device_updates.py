@@ -0,0 +1,192 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+
+from collections import defaultdict
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+import requests
+
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    equal_to,
+    greater_than,
+    has_entries,
+    has_key,
+)
+from wazo_provd_client.exceptions import ProvdError
+
+from .._device_updates import DeviceUpdateDispatcher, DeviceUpdateQueue
+
+
+@patch('wazo_confd._device_updates.session_scope')
+class TestDeviceUpdateQueue(TestCase):
+    def setUp(self):
+        self.provd_updater = Mock()
+        self.queue = DeviceUpdateQueue()
+
+    def test_given_device_added_twice_when_flush_then_updated_once(self, _):
+        self.queue.add(self.provd_updater, 'device-1', tenant_uuid='tenant')
+        self.queue.add(self.provd_updater, 'device-2', tenant_uuid='tenant')
+        self.queue.add(self.provd_updater, 'device-1', tenant_uuid='tenant')
+
+        self.queue.flush()
+
+        assert_that(
+            self.provd_updater.update.call_args_list,
+            contains_exactly(
+                call('device-1', tenant_uuid='tenant'),
+                call('device-2', tenant_uuid='tenant'),
+            ),
+        )
+
+    def test_given_update_fails_when_flush_then_other_devices_updated(self, _):
+        self.provd_updater.update.side_effect = [Exception('error'), True]
+        self.queue.add(self.provd_updater, 'device-1')
+        self.queue.add(self.provd_updater, 'device-2')
+
+        before = self.status()
+        self.queue.flush()
+        after = self.status()
+
+        assert_that(self.provd_updater.update.call_count, equal_to(2))
+        assert_that(after['failed'] - before['failed'], equal_to(1))
+        assert_that(after['updated'] - before['updated'], equal_to(1))
+        assert_that(after['latencies'], has_key('flush'))
+
+    def test_given_config_unchanged_when_flush_then_counted_unchanged(self, _):
+        self.provd_updater.update.side_effect = [False, True]
+        self.queue.add(self.provd_updater, 'device-1')
+        self.queue.add(self.provd_updater, 'device-2')
+
+        before = self.status()
+        self.queue.flush()
+        after = self.status()
+
+        assert_that(after['unchanged'] - before['unchanged'], equal_to(1))
+        assert_that(after['updated'] - before['updated'], equal_to(1))
+        assert_that(after['unchanged_ratio'], greater_than(0))
+
+    def test_given_rollback_when_flush_then_nothing_updated(self, session_scope):
+        self.queue.add(self.provd_updater, 'device-1')
+
+        self.queue.rollback()
+        self.queue.flush()
+
+        self.provd_updater.update.assert_not_called()
+        session_scope.assert_not_called()
+
+    def status(self):
+        status = defaultdict(dict)
+        DeviceUpdateQueue.provide_status(status)
+        return dict(status['device_updates'])
+
+
+def provd_error(status_code):
+    error = ProvdError('error')
+    error.status_code = status_code
+    return error
+
+
+@patch('wazo_confd._device_updates.session_scope')
+class TestDeviceUpdateDispatcher(TestCase):
+    def setUp(self):
+        self.provd_updater = Mock()
+
+    def queue(self, *device_ids, tenant_uuid='tenant'):
+        queue = DeviceUpdateQueue()
+        for device_id in device_ids:
+            queue.add(self.provd_updater, device_id, tenant_uuid=tenant_uuid)
+        return queue
+
+    def updated(self):
+        return [args[0] for args, _ in self.provd_updater.update.call_args_list]
+
+    def test_given_no_worker_when_dispatch_then_updated_at_once(self, _):
+        dispatcher = DeviceUpdateDispatcher(workers=0)
+
+        with dispatcher:
+            dispatcher.dispatch(self.queue('device-1'))
+            assert_that(self.updated(), contains_exactly('device-1'))
+
+    def test_given_workers_when_stop_then_pending_devices_updated(self, _):
+        dispatcher = DeviceUpdateDispatcher(workers=2)
+
+        with dispatcher:
+            dispatcher.dispatch(self.queue('device-1', 'device-2', 'device-3'))
+
+        assert_that(
+            sorted(self.updated()), contains_exactly('device-1', 'device-2', 'device-3')
+        )
+
+    def test_given_many_devices_of_a_tenant_then_other_tenants_served_in_turn(self, _):
+        started, release = threading.Event(), threading.Event()
+
+        def update(device_id, tenant_uuid):
+            if device_id == 'a-1':
+                started.set()
+                release.wait(5)
+
+        self.provd_updater.update.side_effect = update
+        dispatcher = DeviceUpdateDispatcher(workers=1)
+
+        with dispatcher:
+            dispatcher.dispatch(self.queue('a-1', 'a-2', 'a-3', tenant_uuid='a'))
+            started.wait(5)
+            dispatcher.dispatch(self.queue('b-1', tenant_uuid='b'))
+            assert_that(self.status(dispatcher), has_entries(pending=3, running=1))
+            release.set()
+
+        assert_that(self.updated(), contains_exactly('a-1', 'a-2', 'b-1', 'a-3'))
+
+    def test_given_server_error_then_update_retried(self, _):
+        self.provd_updater.update.side_effect = [provd_error(503), True]
+        dispatcher = DeviceUpdateDispatcher(workers=1, retry_interval=0)
+
+        before = self.status(dispatcher)
+        with dispatcher:
+            dispatcher.dispatch(self.queue('device-1'))
+        after = self.status(dispatcher)
+
+        assert_that(self.updated(), contains_exactly('device-1', 'device-1'))
+        assert_that(after['updated'] - before['updated'], equal_to(1))
+        assert_that(after['failed'] - before['failed'], equal_to(0))
+
+    def test_given_connection_error_then_update_retried(self, _):
+        self.provd_updater.update.side_effect = [requests.ConnectionError(), True]
+        dispatcher = DeviceUpdateDispatcher(workers=1, retry_interval=0)
+
+        with dispatcher:
+            dispatcher.dispatch(self.queue('device-1'))
+
+        assert_that(self.updated(), contains_exactly('device-1', 'device-1'))
+
+    def test_given_client_error_then_update_not_retried(self, _):
+        self.provd_updater.update.side_effect = provd_error(404)
+        dispatcher = DeviceUpdateDispatcher(workers=1, retry_interval=0)
+
+        before = self.status(dispatcher)
+        with dispatcher:
+            dispatcher.dispatch(self.queue('device-1'))
+        after = self.status(dispatcher)
+
+        assert_that(self.updated(), contains_exactly('device-1'))
+        assert_that(after['failed'] - before['failed'], equal_to(1))
+
+    def test_given_server_error_persists_then_retried_max_retries_times(self, _):
+        self.provd_updater.update.side_effect = provd_error(500)
+        dispatcher = DeviceUpdateDispatcher(workers=1, max_retries=2, retry_interval=0)
+
+        with dispatcher:
+            dispatcher.dispatch(self.queue('device-1'))
+
+        assert_that(self.provd_updater.update.call_count, equal_to(3))
+
+    def status(self, dispatcher):
+        status = defaultdict(dict)
+        DeviceUpdateQueue.provide_status(status)
+        dispatcher.provide_status(status)
+        return dict(status['device_updates'])
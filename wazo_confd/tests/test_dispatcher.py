@@ -0,0 +1,52 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from hamcrest import assert_that, contains_exactly, equal_to
+
+from .._dispatcher import FlushDispatcher
+
+
+class TestFlushDispatcher(TestCase):
+    def test_dispatch_when_disabled_then_flushed_immediately(self):
+        dispatcher = FlushDispatcher(enabled=False)
+        publisher = Mock()
+
+        with dispatcher:
+            dispatcher.dispatch(publisher)
+            publisher.flush.assert_called_once_with()
+
+    def test_dispatch_then_flushed_in_order(self):
+        dispatcher = FlushDispatcher(enabled=True)
+        flushed = []
+        publishers = [Mock(flush=lambda i=i: flushed.append(i)) for i in range(3)]
+
+        with dispatcher:
+            for publisher in publishers:
+                dispatcher.dispatch(publisher)
+
+        assert_that(flushed, contains_exactly(0, 1, 2))
+
+    def test_dispatch_when_flush_fails_then_retried(self):
+        dispatcher = FlushDispatcher(enabled=True, max_retries=2, retry_interval=0)
+        publisher = Mock()
+        publisher.flush.side_effect = [Exception('error'), None]
+
+        with dispatcher:
+            dispatcher.dispatch(publisher)
+
+        assert_that(publisher.flush.call_count, equal_to(2))
+        publisher.rollback.assert_not_called()
+
+    def test_dispatch_when_retries_exhausted_then_rollback(self):
+        dispatcher = FlushDispatcher(enabled=True, max_retries=1, retry_interval=0)
+        publisher = Mock()
+        publisher.flush.side_effect = Exception('error')
+
+        with dispatcher:
+            dispatcher.dispatch(publisher)
+
+        assert_that(publisher.flush.call_count, equal_to(2))
+        publisher.rollback.assert_called_once_with()
@@ -0,0 +1,67 @@
+# Copyright 2025 The Wazo Authors  (see the AUTHORS file)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from unittest import TestCase
+
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries, none
+
+from .._jobs import JobRunner
+
+
+class TestJobRunner(TestCase):
+    def test_submit_then_job_finished_with_result(self):
+        runner = JobRunner(workers=1)
+
+        def function(job, value):
+            job.report_progress(done=1)
+            job.finish(result=value)
+
+        with runner:
+            job = runner.submit('tenant-uuid', function, 'value')
+
+        assert_that(runner.get(job.uuid), equal_to(job))
+        assert_that(job.status, equal_to('succeeded'))
+        assert_that(job.result, equal_to('value'))
+        assert_that(job.progress, has_entries(done=1))
+
+    def test_submit_when_function_returns_then_job_succeeded(self):
+        runner = JobRunner(workers=1)
+
+        with runner:
+            job = runner.submit('tenant-uuid', lambda job: None)
+
+        assert_that(job.status, equal_to('succeeded'))
+        assert_that(job.result, none())
+
+    def test_submit_when_function_fails_then_job_failed(self):
+        runner = JobRunner(workers=1)
+
+        def function(job):
+            raise Exception('error')
+
+        with runner:
+            job = runner.submit('tenant-uuid', function)
+
+        assert_that(job.status, equal_to('failed'))
+        assert_that(job.error, equal_to('Unexpected error: error'))
+
+    def test_submit_when_too_many_finished_jobs_then_oldest_removed(self):
+        runner = JobRunner(workers=1, max_finished_jobs=2)
+
+        jobs = []
+        with runner:
+            for _ in range(3):
+                jobs.append(runner.submit('tenant-uuid', lambda job: None))
+        with runner:
+            last = runner.submit('tenant-uuid', lambda job: None)
+
+        assert_that(
+            [runner.get(job.uuid) for job in jobs + [last]],
+            contains_exactly(None, jobs[1], jobs[2], last),
+        )
+
+    def test_enabled_when_no_worker_then_disabled(self):
+        runner = JobRunner(workers=0)
+
+        with runner:
+            assert_that(runner.enabled, equal_to(False))
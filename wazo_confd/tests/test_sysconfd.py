@@ -1,12 +1,24 @@
-# Copyright 2013-2023 The Wazo Authors  (see the AUTHORS file)
+# Copyright 2013-2025 The Wazo Authors  (see the AUTHORS file)
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import TestCase
 
 from unittest.mock import patch, Mock
-from hamcrest import assert_that, equal_to, has_entries, has_items
+from flask import Flask
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    equal_to,
+    greater_than,
+    has_entries,
+    has_items,
+    has_key,
+)
 
-from .._sysconfd import SysconfdPublisher
+from .._sysconfd import SysconfdPublisher, SysconfdReloadCoalescer, SysconfdSession
 
 
 class TestSysconfdClient(TestCase):
@@ -213,3 +225,148 @@ class TestSysconfdClient(TestCase):
         self.session.request.assert_called_once_with(
             'DELETE', url, params={'name': moh_name}
         )
+
+
+class TestSysconfdReloadCoalescer(TestCase):
+    def setUp(self):
+        self.dao = Mock()
+        self.dao.is_live_reload_enabled.return_value = True
+        self.url = "http://localhost:8668"
+        session_init_patch = patch('wazo_confd._sysconfd.requests.Session')
+        session_init = session_init_patch.start()
+        self.session = session_init.return_value
+        self.session.request.return_value = Mock(status_code=200)
+        self.addCleanup(session_init_patch.stop)
+        self.coalescer = SysconfdReloadCoalescer(self.url, window=60)
+        self.addCleanup(self.coalescer.stop)
+
+    def test_publisher_flush_does_not_send_handlers(self):
+        client = SysconfdPublisher(self.url, self.dao, self.coalescer)
+
+        client.exec_request_handlers({'ipbx': ['dialplan reload']})
+        client.flush()
+
+        self.assertFalse(self.session.request.called)
+
+    def test_handlers_of_many_publishers_are_sent_once(self):
+        context_1 = {'resource_type': 'meeting', 'resource_body': {'uuid': '1'}}
+        context_2 = {'resource_type': 'meeting', 'resource_body': {'uuid': '2'}}
+        client_1 = SysconfdPublisher(self.url, self.dao, self.coalescer)
+        client_2 = SysconfdPublisher(self.url, self.dao, self.coalescer)
+
+        client_1.exec_request_handlers(
+            {'ipbx': ['dialplan reload'], 'context': [context_1]}
+        )
+        client_1.flush()
+        client_2.exec_request_handlers(
+            {
+                'ipbx': ['dialplan reload', 'module reload res_pjsip.so'],
+                'context': [context_2],
+            }
+        )
+        client_2.flush()
+        self.coalescer.flush()
+
+        self.session.request.assert_called_once()
+        call = self.session.request.call_args_list[0]
+        assert_that(call[0][1], equal_to("http://localhost:8668/exec_request_handlers"))
+        assert_that(
+            call[1]['json'],
+            has_entries(
+                ipbx=has_items('dialplan reload', 'module reload res_pjsip.so'),
+                context=contains_exactly(context_1, context_2),
+            ),
+        )
+        assert_that(len(call[1]['json']['ipbx']), equal_to(2))
+
+    def test_pending_handlers_sent_before_requests_of_later_publishers(self):
+        client_1 = SysconfdPublisher(self.url, self.dao, self.coalescer)
+        client_2 = SysconfdPublisher(self.url, self.dao, self.coalescer)
+
+        client_1.exec_request_handlers({'ipbx': ['dialplan reload']})
+        client_1.flush()
+        client_2.delete_voicemail('123', 'default')
+        client_2.flush()
+
+        urls = [call[0][1] for call in self.session.request.call_args_list]
+        assert_that(
+            urls,
+            contains_exactly(
+                "http://localhost:8668/exec_request_handlers",
+                "http://localhost:8668/delete_voicemail",
+            ),
+        )
+
+    def test_flush_without_handlers(self):
+        self.coalescer.flush()
+
+        self.assertFalse(self.session.request.called)
+
+
+class _SysconfdHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        body = b'{"data": []}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSysconfdSession(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _SysconfdHandler)
+        self.server.client_ports = set()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        self.session = SysconfdSession(pool_size=2, timeout=5)
+        self.client = SysconfdPublisher(self.url, Mock(), session=self.session)
+
+    def test_connection_reused_between_calls(self):
+        for _ in range(3):
+            self.client.get_available_network_interfaces()
+
+        assert_that(len(self.server.client_ports), equal_to(1))
+
+    def test_connection_not_shared_between_threads(self):
+        self.client.get_available_network_interfaces()
+        thread = threading.Thread(target=self.client.get_available_network_interfaces)
+        thread.start()
+        thread.join()
+        self.client.get_available_network_interfaces()
+
+        assert_that(len(self.server.client_ports), equal_to(2))
+
+    def test_latencies_recorded_by_path(self):
+        self.client.get_available_network_interfaces()
+        self.client.get_available_network_interfaces()
+
+        latencies = self.session.latencies()
+
+        assert_that(latencies, has_key('GET /networking/interfaces'))
+        assert_that(
+            latencies['GET /networking/interfaces'],
+            has_entries(count=2, average=greater_than(0), max=greater_than(0)),
+        )
+
+
+class TestSysconfdPublisherFromConfig(TestCase):
+    @patch('wazo_confd._sysconfd.configuration_dao')
+    def test_exec_request_handlers_then_live_reload_read_once_per_request(self, dao):
+        config = {'sysconfd': {'host': 'localhost', 'port': 8668}}
+
+        with Flask(__name__).app_context():
+            publisher = SysconfdPublisher.from_config(config)
+            publisher.exec_request_handlers({'ipbx': ['module reload']})
+            publisher.exec_request_handlers({'ipbx': ['dialplan reload']})
+
+        dao.is_live_reload_enabled.assert_called_once_with()